@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+
+from tatemono_map.api import database
+from tatemono_map.api import main as api_main
+
+from bench_api_load import _percentile, _seed
+
+
+def _legacy_app() -> FastAPI:
+    # The previous shape: sync handlers on Starlette's default 40-thread pool, default-sized read pool.
+    database.get_read_engine().dispose()
+    database._READ_ENGINE = create_engine(
+        f"sqlite+pysqlite:///file:{database._READ_DB_PATH.as_posix()}?mode=ro&uri=true",
+        connect_args={"check_same_thread": False},
+    )
+    legacy = FastAPI()
+
+    @legacy.get("/buildings")
+    def list_buildings(limit: int = 50, offset: int = 0):
+        return api_main._with_read_session(
+            api_main._list_buildings, api_main.Response(), limit, offset, None, None, None, None, None, None
+        )
+
+    @legacy.get("/buildings/{building_key}")
+    def get_building_by_key(building_key: str):
+        return api_main._with_read_session(api_main._get_building_by_key, building_key)
+
+    return legacy
+
+
+async def _client_loop(client: httpx.AsyncClient, requests: int, rows: int, seed: int, timings: list[float]) -> None:
+    rng = random.Random(seed)
+    for idx in range(requests):
+        if idx % 2:
+            path = f"/buildings/load{rng.randrange(rows):06d}"
+        else:
+            path = f"/buildings?limit=50&offset={rng.randrange(0, 1000)}"
+        started = time.perf_counter()
+        response = await client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+
+
+async def _run(app: FastAPI, clients: int, requests: int, rows: int) -> tuple[float, list[float]]:
+    timings: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(_client_loop(client, requests, rows, seed, timings) for seed in range(clients)))
+        elapsed = time.perf_counter() - started
+    return elapsed, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Throughput of the summary read endpoints under concurrent clients")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_api_concurrency_") as work_dir:
+        os.environ["SQLITE_DB_PATH"] = str(Path(work_dir) / "api.sqlite3")
+        os.environ.pop("DATABASE_URL", None)
+        database.reset_engine()
+        database.ensure_migrated()
+        _seed(Path(os.environ["SQLITE_DB_PATH"]), args.rows)
+        for label, app in (("before", _legacy_app()), ("after", None)):
+            if app is None:
+                database.reset_engine()
+                database.ensure_migrated()
+                api_main.app.state.read_limiter = None
+                app = api_main.app
+            elapsed, timings = asyncio.run(_run(app, args.clients, args.requests, args.rows))
+            print(
+                f"bench_api_concurrency mode={label} clients={args.clients} requests={len(timings)} "
+                f"rps={len(timings) / elapsed:.1f} p50_ms={statistics.median(timings):.2f} "
+                f"p99_ms={_percentile(timings, 99):.2f}"
+            )
+        database.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from tatemono_map.api import database
+from tatemono_map.api.main import app, get_db, get_read_db
+
+
+def _seed(db_path: Path, rows: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """
+        INSERT INTO building_summaries(
+            building_key, name, address, vacancy_status, listings_count, layout_types_json,
+            rent_min, rent_max, area_min, area_max, last_updated
+        ) VALUES (?, ?, ?, '空室あり', 2, '["1K"]', ?, ?, 20.0, 30.0, ?)
+        """,
+        (
+            (
+                f"load{idx:06d}",
+                f"{idx % 900 + 100}: 負荷試験マンション{idx}",
+                f"福岡県北九州市小倉北区{idx}",
+                40000 + idx % 300 * 100,
+                60000 + idx % 300 * 100,
+                f"2026-03-{idx % 28 + 1:02d} {idx % 24:02d}:00:00",
+            )
+            for idx in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _legacy_get_db():
+    # The previous dependency: full init_db (DDL, PRAGMA, backfill UPDATEs) on every request.
+    database.init_db()
+    db = database.SessionLocal(bind=database.get_engine())
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _run(client: TestClient, requests: int, rows: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    timings = []
+    for idx in range(requests):
+        if idx % 2:
+            path = f"/buildings/load{rng.randrange(rows):06d}"
+        else:
+            path = f"/buildings?limit=50&offset={rng.randrange(0, 1000)}"
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="p50/p99 latency of GET /buildings with and without per-request init_db")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--requests", type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_api_load_") as work_dir:
+        os.environ["SQLITE_DB_PATH"] = str(Path(work_dir) / "api.sqlite3")
+        os.environ.pop("DATABASE_URL", None)
+        database.reset_engine()
+        with TestClient(app) as client:
+            _seed(Path(os.environ["SQLITE_DB_PATH"]), args.rows)
+            for label, overrides in (
+                ("before", {get_db: _legacy_get_db, get_read_db: _legacy_get_db}),
+                ("after", {}),
+            ):
+                app.dependency_overrides = overrides
+                timings = _run(client, args.requests, args.rows, seed=7)
+                print(
+                    f"bench_api_load mode={label} rows={args.rows} requests={args.requests} "
+                    f"p50_ms={statistics.median(timings):.2f} p99_ms={_percentile(timings, 99):.2f}"
+                )
+            app.dependency_overrides = {}
+        database.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+from tatemono_map.api import database
+from tatemono_map.api.search import ensure_search_index, search_refs
+
+QUERIES = ("グランメゾン99996号館", "sky tower99997", "米町2-", "小倉北区", "戸畑")
+LIKE_SQL = """
+    SELECT building_key FROM building_summaries
+    WHERE name LIKE :like OR address LIKE :like
+    LIMIT 20
+"""
+
+
+def _seed(db_path: Path, rows: int) -> None:
+    wards = ("小倉北区", "小倉南区", "戸畑区", "八幡西区", "門司区")
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO building_summaries(building_key, name, address) VALUES (?, ?, ?)",
+        (
+            (
+                f"search{idx:07d}",
+                f"{('グランメゾン', 'ＳＫＹ ＴＯＷＥＲ', 'ハイツ', 'コーポ')[idx % 4]}{idx}号館",
+                f"福岡県北九州市{wards[idx % 5]}米町{idx % 9 + 1}丁目{idx % 30 + 1}番",
+            )
+            for idx in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _timed(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare LIKE scans with the FTS5 trigram search index")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_api_search_") as work_dir:
+        os.environ["SQLITE_DB_PATH"] = str(Path(work_dir) / "api.sqlite3")
+        os.environ.pop("DATABASE_URL", None)
+        database.reset_engine()
+        database.ensure_migrated()
+        _seed(Path(os.environ["SQLITE_DB_PATH"]), args.rows)
+        started = time.perf_counter()
+        with database.get_engine().begin() as conn:
+            ensure_search_index(conn)
+        print(f"bench_api_search rows={args.rows} index_build_ms={(time.perf_counter() - started) * 1000:.0f}")
+        with database.get_read_engine().connect() as conn:
+            for query in QUERIES:
+                like_ms = _timed(
+                    lambda: conn.execute(text(LIKE_SQL), {"like": f"%{query}%"}).all(), args.repeat
+                )
+                fts_ms = _timed(lambda: search_refs(conn, "summary", query, limit=20), args.repeat)
+                like_hits = len(conn.execute(text(LIKE_SQL), {"like": f"%{query}%"}).all())
+                fts_hits = len(search_refs(conn, "summary", query, limit=20))
+                print(
+                    f"bench_api_search q={query!r} like_hits={like_hits} like_ms={like_ms:.2f} "
+                    f"fts_hits={fts_hits} fts_ms={fts_ms:.2f}"
+                )
+        database.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import time
+from pathlib import Path
+
+from tatemono_map.render.columnar import read_columnar
+
+
+def _best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare buildings.v2.min.json with the columnar export")
+    parser.add_argument("--dist", default="dist")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data_dir = Path(args.dist) / "data"
+    json_bytes = (data_dir / "buildings.v2.min.json").read_bytes()
+    cols_bytes = (data_dir / "buildings.v2.cols.bin").read_bytes()
+    json_sec = _best_of(args.repeat, lambda: json.loads(json_bytes))
+    cols_sec = _best_of(args.repeat, lambda: read_columnar(cols_bytes))
+    for label, data, seconds in (("json", json_bytes, json_sec), ("columnar", cols_bytes, cols_sec)):
+        print(
+            f"bench_columnar format={label} bytes={len(data)} gzip_bytes={len(gzip.compress(data, mtime=0))} "
+            f"parse_ms={seconds * 1000:.2f}"
+        )
+    print(f"bench_columnar bytes_ratio={len(cols_bytes) / len(json_bytes):.3f} parse_ratio={cols_sec / json_sec:.3f}")
+
+
+if __name__ == "__main__":
+    main()
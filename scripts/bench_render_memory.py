@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from tatemono_map.db.repo import connect
+from tatemono_map.render.build import _parse_date_text, build_dist
+
+
+def _seed(db_path: Path, count: int) -> None:
+    conn = connect(db_path)
+    conn.executemany(
+        """
+        INSERT INTO building_summaries(
+            building_key, name, raw_name, address, rent_yen_min, rent_yen_max, area_sqm_min, area_sqm_max,
+            layout_types_json, move_in_dates_json, property_kind, building_built_year_month,
+            building_structure, vacancy_count, last_updated, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'rent', ?, 'RC', ?, ?, ?)
+        """,
+        (
+            (
+                f"bench{idx:07d}",
+                f"ベンチマークマンション{idx}",
+                f"ベンチマークマンション{idx}",
+                f"福岡県北九州市小倉北区米町{idx % 9 + 1}-{idx % 30 + 1}",
+                40000 + idx % 200 * 500,
+                55000 + idx % 200 * 500,
+                20.0 + idx % 10,
+                35.0 + idx % 10,
+                json.dumps(["1K", "1LDK"]),
+                json.dumps(["即入居"]),
+                f"{1980 + idx % 40}-04",
+                idx % 7,
+                f"2026-03-{idx % 28 + 1:02d} 10:00:00",
+                f"2026-03-{idx % 28 + 1:02d} 10:00:00",
+            )
+            for idx in range(count)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _measure(db_path: Path, output_dir: Path) -> dict[str, int]:
+    # The whole build (load, payloads, shards, search index, columnar, pages, precompression), not just the loader.
+    # tracemalloc only sees Python allocations, so the process high-water mark is reported alongside it.
+    _parse_date_text.cache_clear()
+    tracemalloc.start()
+    with redirect_stdout(StringIO()):
+        build_dist(str(db_path), str(output_dir), template_root="templates_v2")
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak": peak, "retained": retained, "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+def _measure_in_child(db_path: Path, output_dir: Path) -> dict[str, int]:
+    # A fresh interpreter per size keeps one run's high-water mark from hiding the next.
+    result = subprocess.run(
+        [sys.executable, __file__, "--measure", str(db_path), str(output_dir)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure peak memory of a full render.build_dist run")
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--measure", nargs=2, metavar=("DB_PATH", "OUTPUT_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(_measure(Path(args.measure[0]), Path(args.measure[1]))))
+        return
+
+    for count in (int(size) for size in args.sizes.split(",") if size.strip()):
+        work_dir = Path(tempfile.mkdtemp(prefix="bench_render_memory_"))
+        try:
+            db_path = work_dir / "bench.sqlite3"
+            with redirect_stdout(StringIO()):
+                _seed(db_path, count)
+            result = _measure_in_child(db_path, work_dir / "dist")
+            print(
+                f"bench_render_memory buildings={count} peak_bytes={result['peak']} retained_bytes={result['retained']} "
+                f"peak_per_building={result['peak'] // count} maxrss_kb={result['maxrss_kb']}"
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from tatemono_map.render.build import _render_pages
+
+
+def _synthetic_building(idx: int) -> dict:
+    rent = 40000 + (idx % 200) * 500
+    return {
+        "building_key": f"bench{idx:07d}",
+        "name": f"ベンチマークマンション{idx}",
+        "address": f"福岡県北九州市小倉北区米町{idx % 9 + 1}-{idx % 30 + 1}-{idx % 50 + 1}",
+        "vacancy_count": idx % 7,
+        "rent_yen_min": rent,
+        "rent_yen_max": rent + 15000,
+        "area_sqm_min": 20.0 + idx % 10,
+        "area_sqm_max": 35.0 + idx % 10,
+        "layout_types": ["1K", "1LDK"] if idx % 2 else ["2LDK"],
+        "move_in_dates": ["即入居", "2026-04-01"],
+        "building_availability_label": "入居",
+        "building_structure": "RC",
+        "structure": "RC",
+        "age_years": idx % 40,
+        "building_built_year_month": "2001-04",
+        "building_built_age_years": idx % 40,
+        "property_kind": "rent",
+        "sale_listing_count": 0,
+        "sale_price_yen_avg": None,
+        "last_updated": "2026-03-01 10:00:00",
+    }
+
+
+def _jobs(output_dir: Path, count: int) -> list[tuple[str, dict]]:
+    return [
+        (
+            str(output_dir / "b" / f"{building['building_key']}.html"),
+            {
+                "building": building,
+                "maps_url": "https://www.google.com/maps/search/?api=1&query=bench",
+                "line_cta_url": "https://lin.ee/bench",
+                "line_deep_link_url": "line://ti/p/@bench",
+            },
+        )
+        for building in map(_synthetic_building, range(count))
+    ]
+
+
+def _timed_render(template_root: str, count: int, workers: int) -> float:
+    output_dir = Path(tempfile.mkdtemp(prefix="bench_render_"))
+    try:
+        (output_dir / "b").mkdir()
+        jobs = _jobs(output_dir, count)
+        started = time.perf_counter()
+        _render_pages(template_root, jobs, workers=workers)
+        return time.perf_counter() - started
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare serial and process-pool rendering of building pages")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--template-root", default="templates_v2")
+    args = parser.parse_args()
+
+    for count in (int(size) for size in args.sizes.split(",") if size.strip()):
+        serial = _timed_render(args.template_root, count, 1)
+        parallel = _timed_render(args.template_root, count, args.workers)
+        print(
+            f"bench_render_pages buildings={count} serial_sec={serial:.2f} "
+            f"workers={args.workers} parallel_sec={parallel:.2f} speedup={serial / parallel:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
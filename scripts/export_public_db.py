@@ -14,7 +14,7 @@ def export_public_db(src: Path, dst: Path) -> int:
 
     dst.parent.mkdir(parents=True, exist_ok=True)
 
-    with sqlite3.connect(src) as src_conn:
+    with sqlite3.connect(f"{src.resolve().as_uri()}?mode=ro", uri=True) as src_conn:
         src_conn.row_factory = sqlite3.Row
         table_exists = src_conn.execute(
             "SELECT 1 FROM sqlite_master WHERE type='table' AND name='building_summaries'"
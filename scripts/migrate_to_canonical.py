@@ -47,6 +47,7 @@ def migrate(db_path: str | Path) -> Path:
         recreate_table(conn, "listings")
         recreate_table(conn, "building_summaries")
         recreate_table(conn, "raw_units")
+        conn.execute("PRAGMA user_version = 0")
         conn.commit()
     return path
 
@@ -2,7 +2,8 @@ param(
   [Parameter(Mandatory = $true)][string]$RealproZip,
   [Parameter(Mandatory = $true)][string]$UlucksZip,
   [string]$RepoPath = (Resolve-Path (Join-Path $PSScriptRoot "..") | Select-Object -ExpandProperty Path),
-  [ValidateSet("strict", "warn", "off")][string]$QcMode = "warn"
+  [ValidateSet("strict", "warn", "off")][string]$QcMode = "warn",
+  [int]$Workers = 1
 )
 
 $ErrorActionPreference = "Stop"
@@ -54,7 +55,7 @@ Get-ChildItem $extractUlucks -Recurse -File -Filter *.pdf | ForEach-Object {
   Copy-Item -Path $_.FullName -Destination $dest -Force
 }
 
-& $PY -m tatemono_map.cli.pdf_batch_run --realpro-dir $realproPdfs --ulucks-dir $ulucksPdfs --out-dir $out --qc-mode $QcMode
+& $PY -m tatemono_map.cli.pdf_batch_run --realpro-dir $realproPdfs --ulucks-dir $ulucksPdfs --out-dir $out --qc-mode $QcMode --workers $Workers
 
 $finalCsv = Join-Path $out "final.csv"
 $masterImportCsv = Join-Path $out "master_import.csv"
@@ -3,14 +3,40 @@ import re
 from pathlib import Path
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from tatemono_map.api.search import ensure_search_index, search_index_present
+from tatemono_map.api.spatial import ensure_spatial_index, spatial_index_present
+
 Base = declarative_base()
 
 ROOM_PREFIX_PATTERN = re.compile(r"^\s*\d{1,4}\s*[:：]\s*")
 
+# Bump when init_db gains new DDL or backfills so existing databases are migrated once more.
+API_SCHEMA_VERSION = 4
+API_SCHEMA_MARKER_TABLE = "api_schema_migrations"
+API_REQUIRED_SUMMARY_COLUMNS = ("vacancy_status", "listings_count", "rent_min", "area_min", "move_in_min", "lat", "lon")
+SUMMARY_KEYSET_INDEX = "idx_building_summaries_last_updated_key"
+SUMMARY_KEYSET_INDEX_DDL = f"""
+CREATE INDEX IF NOT EXISTS {SUMMARY_KEYSET_INDEX}
+ON building_summaries(COALESCE(last_updated, ''), building_key)
+"""
+
+# Explicit pool sizing. Reads go through a threadpool bounded to READ_POOL_SIZE, so checkouts never wait on the pool.
+READ_POOL_SIZE = int(os.getenv("API_READ_POOL_SIZE", "8"))
+WRITE_POOL_SIZE = int(os.getenv("API_WRITE_POOL_SIZE", "2"))
+WRITE_POOL_OVERFLOW = int(os.getenv("API_WRITE_POOL_OVERFLOW", "4"))
+POOL_TIMEOUT_SEC = float(os.getenv("API_POOL_TIMEOUT_SEC", "10"))
+HEALTH_POOL_SIZE = 1
+
 _ENGINE = None
 _DB_PATH: Path | None = None
+_READ_ENGINE = None
+_READ_DB_PATH: Path | None = None
+_MIGRATED_PATHS: set[Path] = set()
+_SUMMARY_MODE_CACHE: dict[Path, tuple[tuple, bool]] = {}
+_HEALTH_ENGINES: dict[str, object] = {}
 
 
 def _resolve_db_path() -> Path:
@@ -37,22 +63,144 @@ def get_engine():
         _ENGINE = create_engine(
             _get_database_url(db_path),
             connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=WRITE_POOL_SIZE,
+            max_overflow=WRITE_POOL_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT_SEC,
         )
 
     return _ENGINE
 
 
+def get_read_engine():
+    global _READ_ENGINE
+    global _READ_DB_PATH
+
+    db_path = _resolve_db_path()
+    if _READ_ENGINE is None or _READ_DB_PATH != db_path:
+        if _READ_ENGINE is not None:
+            _READ_ENGINE.dispose()
+        _READ_DB_PATH = db_path
+        _READ_ENGINE = create_engine(
+            f"sqlite+pysqlite:///file:{db_path.as_posix()}?mode=ro&uri=true",
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=READ_POOL_SIZE,
+            max_overflow=0,
+            pool_timeout=POOL_TIMEOUT_SEC,
+        )
+
+    return _READ_ENGINE
+
+
+def get_health_engine(database_url: str):
+    engine = _HEALTH_ENGINES.get(database_url)
+    if engine is None:
+        engine = _HEALTH_ENGINES[database_url] = create_engine(
+            database_url,
+            poolclass=QueuePool,
+            pool_pre_ping=False,
+            pool_size=HEALTH_POOL_SIZE,
+            max_overflow=0,
+            pool_timeout=POOL_TIMEOUT_SEC,
+        )
+    return engine
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 
-def init_db() -> None:
+def init_db(engine=None) -> None:
     from tatemono_map.models import building  # noqa: F401
 
-    engine = get_engine()
+    if engine is None:
+        engine = get_engine()
     Base.metadata.create_all(bind=engine)
     ensure_building_summaries_table(engine)
 
 
+def api_schema_version(engine=None) -> int:
+    if engine is None:
+        engine = get_engine()
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type='table' AND name = :name"), {"name": API_SCHEMA_MARKER_TABLE}
+        ).first()
+        if not exists:
+            return 0
+        return conn.execute(text(f"SELECT COALESCE(MAX(version), 0) FROM {API_SCHEMA_MARKER_TABLE}")).scalar_one()
+
+
+def _summary_schema_present(engine) -> bool:
+    with engine.connect() as conn:
+        columns = {row["name"] for row in conn.execute(text("PRAGMA table_info(building_summaries)")).mappings()}
+        index = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type='index' AND name = :name"), {"name": SUMMARY_KEYSET_INDEX}
+        ).first()
+        indexes = spatial_index_present(conn) and search_index_present(conn)
+    return set(API_REQUIRED_SUMMARY_COLUMNS) <= columns and index is not None and indexes
+
+
+def migrate_db(engine=None) -> bool:
+    if engine is None:
+        engine = get_engine()
+    # The marker alone is not enough: the ingest pipeline may recreate building_summaries without the API columns.
+    if api_schema_version(engine) >= API_SCHEMA_VERSION and _summary_schema_present(engine):
+        return False
+    init_db(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {API_SCHEMA_MARKER_TABLE} (
+                    version INTEGER PRIMARY KEY,
+                    applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(f"INSERT OR REPLACE INTO {API_SCHEMA_MARKER_TABLE}(version) VALUES (:version)"),
+            {"version": API_SCHEMA_VERSION},
+        )
+    return True
+
+
+def ensure_migrated() -> None:
+    db_path = _resolve_db_path()
+    if db_path in _MIGRATED_PATHS:
+        return
+    migrate_db(get_engine())
+    _MIGRATED_PATHS.add(db_path)
+
+
+def _database_change_token(db_path: Path) -> tuple:
+    # Any commit touches the WAL (or the main file in rollback-journal mode), so stat() is a cheap change detector.
+    token = []
+    for path in (db_path, db_path.with_name(f"{db_path.name}-wal")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            token.append(None)
+            continue
+        token.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(token)
+
+
+def has_building_summaries(engine=None) -> bool:
+    db_path = _resolve_db_path()
+    token = _database_change_token(db_path)
+    cached = _SUMMARY_MODE_CACHE.get(db_path)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    if engine is None:
+        engine = get_read_engine()
+    with engine.connect() as conn:
+        present = conn.execute(text("SELECT EXISTS (SELECT 1 FROM building_summaries)")).scalar_one() == 1
+    _SUMMARY_MODE_CACHE[db_path] = (token, present)
+    return present
+
+
 def ensure_building_summaries_table(engine=None) -> None:
     if engine is None:
         engine = get_engine()
@@ -156,6 +304,7 @@ def ensure_building_summaries_table(engine=None) -> None:
                     ),
                     {"building_key": row["building_key"], "name": normalized},
                 )
+        conn.execute(text(SUMMARY_KEYSET_INDEX_DDL))
         if legacy_columns.keys() & existing_columns:
             conn.execute(
                 text(
@@ -169,12 +318,25 @@ def ensure_building_summaries_table(engine=None) -> None:
                     """
                 )
             )
+        ensure_spatial_index(conn)
+        ensure_search_index(conn)
 
 
 def reset_engine() -> None:
     global _ENGINE
     global _DB_PATH
+    global _READ_ENGINE
+    global _READ_DB_PATH
     if _ENGINE is not None:
         _ENGINE.dispose()
+    if _READ_ENGINE is not None:
+        _READ_ENGINE.dispose()
     _ENGINE = None
     _DB_PATH = None
+    _READ_ENGINE = None
+    _READ_DB_PATH = None
+    for engine in _HEALTH_ENGINES.values():
+        engine.dispose()
+    _HEALTH_ENGINES.clear()
+    _MIGRATED_PATHS.clear()
+    _SUMMARY_MODE_CACHE.clear()
@@ -1,15 +1,30 @@
+import base64
+import binascii
 import json
 import os
 from datetime import datetime, timezone
+from functools import partial
 from typing import Annotated, Any
 
+import anyio
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.responses import HTMLResponse
-from sqlalchemy import create_engine, or_, text
+from sqlalchemy import or_, text
 from sqlalchemy.orm import Session
 
-from tatemono_map.api.database import SessionLocal, ensure_building_summaries_table, get_engine, init_db
+from tatemono_map.api.database import (
+    READ_POOL_SIZE,
+    SessionLocal,
+    ensure_migrated,
+    get_engine,
+    get_health_engine,
+    get_read_engine,
+    has_building_summaries,
+)
 from tatemono_map.api.schemas import BuildingCreate, BuildingRead, BuildingUpdate
+from tatemono_map.api.search import BUILDING_KIND, SUMMARY_KIND, search_refs, sync_search_index
+from tatemono_map.api.spatial import BBOX_KEYS_SQL, MAX_CLUSTER_ZOOM, bbox_params, cluster_points
+from tatemono_map.db.search_queue import drain_search_queue
 from tatemono_map.models.building import Building
 
 app = FastAPI(title="Tatemono Map")
@@ -33,7 +48,7 @@ def _db_status() -> str | None:
             return "error"
 
     try:
-        engine = create_engine(database_url, pool_pre_ping=False)
+        engine = get_health_engine(database_url)
         with engine.connect():
             return "ok"
     except Exception:
@@ -57,7 +72,7 @@ def health():
 
 
 def get_db() -> Session:
-    init_db()
+    ensure_migrated()
     db = SessionLocal(bind=get_engine())
     try:
         yield db
@@ -65,7 +80,42 @@ def get_db() -> Session:
         db.close()
 
 
+def get_read_db() -> Session:
+    ensure_migrated()
+    db = SessionLocal(bind=get_read_engine())
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 DbSession = Annotated[Session, Depends(get_db)]
+ReadDbSession = Annotated[Session, Depends(get_read_db)]
+
+
+def _read_limiter() -> anyio.CapacityLimiter:
+    limiter = getattr(app.state, "read_limiter", None)
+    if limiter is None:
+        limiter = app.state.read_limiter = anyio.CapacityLimiter(READ_POOL_SIZE)
+    return limiter
+
+
+def _with_read_session(func, *args):
+    ensure_migrated()
+    with SessionLocal(bind=get_read_engine()) as db:
+        return func(db, *args)
+
+
+async def _run_read(func, *args):
+    # One worker thread per pooled read-only connection: excess requests wait on the limiter, not the pool timeout.
+    return await anyio.to_thread.run_sync(partial(_with_read_session, func, *args), limiter=_read_limiter())
+
+
+def _commit_with_search_index(db: Session) -> None:
+    # The buildings triggers queue the change on flush; drain it in the same write transaction.
+    db.flush()
+    drain_search_queue(db.connection().connection.driver_connection)
+    db.commit()
 
 
 def _maybe_seed_building_summaries() -> None:
@@ -140,9 +190,11 @@ def _maybe_seed_building_summaries() -> None:
 
 @app.on_event("startup")
 def _startup() -> None:
-    init_db()
-    ensure_building_summaries_table()
+    app.state.read_limiter = anyio.CapacityLimiter(READ_POOL_SIZE)
+    ensure_migrated()
     _maybe_seed_building_summaries()
+    # Fold in summary changes queued by ingest runs that did not drain (e.g. merge_duplicate_buildings).
+    sync_search_index(get_engine())
 
 
 def _parse_layout_types(value: str | None) -> list[str]:
@@ -173,6 +225,28 @@ def _summary_from_row(row: Any) -> dict[str, Any]:
         "lon": row["lon"],
     }
 
+
+SUMMARY_SELECT_SQL = """
+    SELECT
+        building_key,
+        name,
+        address,
+        vacancy_status,
+        listings_count,
+        layout_types_json,
+        COALESCE(rent_min, rent_yen_min) AS rent_min,
+        COALESCE(rent_max, rent_yen_max) AS rent_max,
+        COALESCE(area_min, area_sqm_min) AS area_min,
+        COALESCE(area_max, area_sqm_max) AS area_max,
+        move_in_min,
+        move_in_max,
+        last_updated,
+        lat,
+        lon
+    FROM building_summaries
+"""
+
+
 @app.get("/debug/db")
 def debug_db():
     if not _is_debug_enabled():
@@ -230,29 +304,53 @@ def create_building(payload: BuildingCreate, db: DbSession):
         updated_at=now,
     )
     db.add(building)
-    db.commit()
+    _commit_with_search_index(db)
     db.refresh(building)
     return building
 
 
-@app.get("/buildings")
-def list_buildings(
-    db: DbSession,
-    limit: Annotated[int, Query(ge=1, le=100)] = 50,
-    offset: Annotated[int, Query(ge=0)] = 0,
-    q: str | None = None,
-    min_lat: float | None = None,
-    max_lat: float | None = None,
-    min_lng: float | None = None,
-    max_lng: float | None = None,
+def _encode_cursor(row: Any) -> str:
+    payload = json.dumps([row["last_updated"] or "", row["building_key"]], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        last_updated, building_key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid cursor") from None
+    if not isinstance(last_updated, str) or not isinstance(building_key, str):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid cursor")
+    return last_updated, building_key
+
+
+def _list_buildings(
+    db: Session,
+    response: Response,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    q: str | None,
+    min_lat: float | None,
+    max_lat: float | None,
+    min_lng: float | None,
+    max_lng: float | None,
 ):
-    engine = get_engine()
-    with engine.connect() as conn:
-        summary_count = conn.execute(
-            text("SELECT COUNT(*) AS count FROM building_summaries")
-        ).scalar_one()
-    if summary_count:
-        sql = """
+    engine = get_read_engine()
+    if has_building_summaries(engine):
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        source = "building_summaries"
+        conditions = []
+        bbox = bbox_params(min_lat, max_lat, min_lng, max_lng)
+        if bbox is not None:
+            params.update(bbox)
+            source = f"building_summaries JOIN ({BBOX_KEYS_SQL}) AS bbox USING (building_key)"
+        if cursor:
+            params["cursor_updated"], params["cursor_key"] = _decode_cursor(cursor)
+            params["offset"] = 0
+            conditions.append("(COALESCE(last_updated, ''), building_key) < (:cursor_updated, :cursor_key)")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"""
             SELECT
                 building_key,
                 name,
@@ -267,14 +365,18 @@ def list_buildings(
                 move_in_min,
                 move_in_max,
                 last_updated,
-                lat,
-                lon
-            FROM building_summaries
-            ORDER BY last_updated DESC
+                building_summaries.lat AS lat,
+                building_summaries.lon AS lon
+            FROM {source}
+            {where}
+            ORDER BY COALESCE(last_updated, '') DESC, building_key DESC
             LIMIT :limit OFFSET :offset
         """
         with engine.connect() as conn:
-            rows = conn.execute(text(sql), {"limit": limit, "offset": offset}).mappings().all()
+            rows = conn.execute(text(sql), params).mappings().all()
+        if len(rows) == limit:
+            # Opaque keyset cursor; the body stays a plain list for existing clients.
+            response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1])
         return [_summary_from_row(row) for row in rows]
 
     query = db.query(Building)
@@ -292,49 +394,100 @@ def list_buildings(
     return query.order_by(Building.id).offset(offset).limit(limit).all()
 
 
+@app.get("/buildings")
+async def list_buildings(
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: str | None = None,
+    q: str | None = None,
+    min_lat: float | None = None,
+    max_lat: float | None = None,
+    min_lng: float | None = None,
+    max_lng: float | None = None,
+):
+    return await _run_read(
+        _list_buildings, response, limit, offset, cursor, q, min_lat, max_lat, min_lng, max_lng
+    )
+
+
+def _list_building_clusters(
+    db: Session,
+    zoom: int,
+    min_lat: float | None,
+    max_lat: float | None,
+    min_lng: float | None,
+    max_lng: float | None,
+):
+    params = bbox_params(min_lat, max_lat, min_lng, max_lng) or bbox_params(-90.0, 90.0, -180.0, 180.0)
+    with get_read_engine().connect() as conn:
+        points = conn.execute(text(BBOX_KEYS_SQL), params).mappings().all()
+    return cluster_points(points, zoom)
+
+
+@app.get("/buildings/clusters")
+async def list_building_clusters(
+    zoom: Annotated[int, Query(ge=0, le=MAX_CLUSTER_ZOOM)],
+    min_lat: float | None = None,
+    max_lat: float | None = None,
+    min_lng: float | None = None,
+    max_lng: float | None = None,
+):
+    return await _run_read(_list_building_clusters, zoom, min_lat, max_lat, min_lng, max_lng)
+
+
+def _search_buildings(db: Session, q: str, limit: int, offset: int):
+    engine = get_read_engine()
+    summary_mode = has_building_summaries(engine)
+    with engine.connect() as conn:
+        refs = search_refs(conn, SUMMARY_KIND if summary_mode else BUILDING_KIND, q, limit=limit, offset=offset)
+        if not summary_mode:
+            buildings = {str(building.id): building for building in db.query(Building).filter(Building.id.in_(refs))}
+            return [buildings[ref] for ref in refs if ref in buildings]
+        params = {f"ref_{idx}": ref for idx, ref in enumerate(refs)}
+        placeholders = ", ".join(f":{name}" for name in params) or "NULL"
+        rows = conn.execute(text(f"{SUMMARY_SELECT_SQL} WHERE building_key IN ({placeholders})"), params).mappings()
+        by_key = {row["building_key"]: row for row in rows}
+    return [_summary_from_row(by_key[ref]) for ref in refs if ref in by_key]
+
+
+@app.get("/search")
+async def search_buildings(
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
+    return await _run_read(_search_buildings, q, limit, offset)
+
+
 @app.get("/buildings/by-id/{building_id}", response_model=BuildingRead)
-def get_building_by_id(building_id: int, db: DbSession):
+def get_building_by_id(building_id: int, db: ReadDbSession):
     building = db.get(Building, building_id)
     if not building:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Building not found")
     return building
 
 
-@app.get("/buildings/{building_key}")
-def get_building_by_key(building_key: str, db: DbSession):
+def _get_building_by_key(db: Session, building_key: str):
     if building_key.isdigit():
         building = db.get(Building, int(building_key))
         if building:
             return building
-    engine = get_engine()
-    sql = """
-        SELECT
-            building_key,
-            name,
-            address,
-            vacancy_status,
-            listings_count,
-            layout_types_json,
-            COALESCE(rent_min, rent_yen_min) AS rent_min,
-            COALESCE(rent_max, rent_yen_max) AS rent_max,
-            COALESCE(area_min, area_sqm_min) AS area_min,
-            COALESCE(area_max, area_sqm_max) AS area_max,
-            move_in_min,
-            move_in_max,
-            last_updated,
-            lat,
-            lon
-        FROM building_summaries
-        WHERE building_key = :building_key
-        LIMIT 1
-    """
+    engine = get_read_engine()
     with engine.connect() as conn:
-        row = conn.execute(text(sql), {"building_key": building_key}).mappings().first()
+        row = conn.execute(
+            text(f"{SUMMARY_SELECT_SQL} WHERE building_key = :building_key LIMIT 1"), {"building_key": building_key}
+        ).mappings().first()
     if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="not found")
     return _summary_from_row(row)
 
 
+@app.get("/buildings/{building_key}")
+async def get_building_by_key(building_key: str):
+    return await _run_read(_get_building_by_key, building_key)
+
+
 @app.patch("/buildings/{building_id}", response_model=BuildingRead)
 def update_building(building_id: int, payload: BuildingUpdate, db: DbSession):
     building = db.get(Building, building_id)
@@ -345,7 +498,7 @@ def update_building(building_id: int, payload: BuildingUpdate, db: DbSession):
         setattr(building, key, value)
     building.updated_at = datetime.now(timezone.utc)
     db.add(building)
-    db.commit()
+    _commit_with_search_index(db)
     db.refresh(building)
     return building
 
@@ -356,7 +509,7 @@ def delete_building(building_id: int, db: DbSession):
     if not building:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Building not found")
     db.delete(building)
-    db.commit()
+    _commit_with_search_index(db)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -366,7 +519,7 @@ def index(request: Request):
 
 
 @app.get("/b/{building_key}")
-def building_page(building_key: str):
+async def building_page(building_key: str):
     if building_key == "demo":
         return {
             "building_key": building_key,
@@ -382,4 +535,4 @@ def building_page(building_key: str):
             "lat": None,
             "lon": None,
         }
-    return get_building_by_key(building_key)
+    return await _run_read(_get_building_by_key, building_key)
@@ -0,0 +1,211 @@
+import re
+import unicodedata
+from typing import Any
+
+from sqlalchemy import text
+
+from tatemono_map.db.search_queue import (
+    BUILDING_KIND,
+    SEARCH_DOCS_TABLE,
+    SEARCH_PENDING_TABLE,
+    SEARCH_SOURCES,
+    SUMMARY_KIND,
+    drain_search_queue,
+    search_doc,
+)
+from tatemono_map.normalize.jp import RE_HYPHENS, normalize_address_jp
+
+SEARCH_FTS_TABLE = "building_search_fts"
+TRIGRAM_MIN_CHARS = 3
+# bm25 column weights: name matches outrank address matches.
+BM25_NAME_WEIGHT = 2.0
+BM25_ADDRESS_WEIGHT = 1.0
+SEARCH_TRIGGERS = (
+    "building_summaries_search_ai",
+    "building_summaries_search_au",
+    "building_summaries_search_ad",
+)
+DOCS_TRIGGERS = ("building_search_docs_ai", "building_search_docs_au", "building_search_docs_ad")
+BUILDING_SEARCH_TRIGGERS = ("buildings_search_ai", "buildings_search_au", "buildings_search_ad")
+RE_QUERY_TERMS = re.compile(r"\s+")
+
+
+def _orm_buildings_present(conn) -> bool:
+    columns = {row["name"] for row in conn.execute(text("PRAGMA table_info(buildings)")).mappings()}
+    return {"id", "name", "address"} <= columns
+
+
+def _queue_triggers(kind: str, names: tuple[str, ...]) -> list[str]:
+    # Normalization lives in Python, so triggers only queue keys; any writer (ingest, API) can fire them.
+    table, key, name, address = SEARCH_SOURCES[kind]
+    insert, update, delete = names
+    queue = f"INSERT OR IGNORE INTO {SEARCH_PENDING_TABLE}(kind, ref) VALUES ('{kind}', CAST({{row}}.{key} AS TEXT))"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {insert} AFTER INSERT ON {table} BEGIN {queue.format(row='NEW')}; END",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {update} AFTER UPDATE OF {key}, {name}, {address} ON {table} BEGIN
+            {queue.format(row='OLD')};
+            {queue.format(row='NEW')};
+        END
+        """,
+        f"CREATE TRIGGER IF NOT EXISTS {delete} AFTER DELETE ON {table} BEGIN {queue.format(row='OLD')}; END",
+    ]
+
+
+def search_index_present(conn) -> bool:
+    names = {
+        row["name"]
+        for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")).mappings()
+    }
+    required = {SEARCH_FTS_TABLE, SEARCH_DOCS_TABLE, SEARCH_PENDING_TABLE, *DOCS_TRIGGERS, *SEARCH_TRIGGERS}
+    if _orm_buildings_present(conn):
+        required |= set(BUILDING_SEARCH_TRIGGERS)
+    return required <= names
+
+
+def _docs_triggers() -> list[str]:
+    # Standard external-content FTS5 sync; the docs table holds the normalized text.
+    insert, update, delete = DOCS_TRIGGERS
+    add = f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, name, address) VALUES (NEW.id, NEW.name, NEW.address)"
+    remove = (
+        f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, name, address) "
+        "VALUES ('delete', OLD.id, OLD.name, OLD.address)"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {insert} AFTER INSERT ON {SEARCH_DOCS_TABLE} BEGIN {add}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {update} AFTER UPDATE ON {SEARCH_DOCS_TABLE} BEGIN {remove}; {add}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {delete} AFTER DELETE ON {SEARCH_DOCS_TABLE} BEGIN {remove}; END",
+    ]
+
+
+def ensure_search_index(conn) -> None:
+    conn.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {SEARCH_DOCS_TABLE} (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL,
+                ref TEXT NOT NULL,
+                name TEXT NOT NULL,
+                address TEXT NOT NULL,
+                UNIQUE (kind, ref)
+            )
+            """
+        )
+    )
+    conn.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {SEARCH_PENDING_TABLE} (
+                kind TEXT NOT NULL,
+                ref TEXT NOT NULL,
+                PRIMARY KEY (kind, ref)
+            )
+            """
+        )
+    )
+    conn.execute(
+        text(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5(
+                name, address, content='{SEARCH_DOCS_TABLE}', content_rowid='id', tokenize='trigram'
+            )
+            """
+        )
+    )
+    for name in (*DOCS_TRIGGERS, *SEARCH_TRIGGERS, *BUILDING_SEARCH_TRIGGERS):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+
+    # Bulk backfill with the docs triggers dropped, then let FTS5 rebuild from the content table in one pass.
+    conn.execute(text(f"DELETE FROM {SEARCH_DOCS_TABLE}"))
+    conn.execute(text(f"DELETE FROM {SEARCH_PENDING_TABLE}"))
+    kinds = [SUMMARY_KIND]
+    statements = _docs_triggers() + _queue_triggers(SUMMARY_KIND, SEARCH_TRIGGERS)
+    if _orm_buildings_present(conn):
+        kinds.append(BUILDING_KIND)
+        statements += _queue_triggers(BUILDING_KIND, BUILDING_SEARCH_TRIGGERS)
+    for kind in kinds:
+        table, key, name, address = SEARCH_SOURCES[kind]
+        rows = conn.execute(text(f"SELECT CAST({key} AS TEXT) AS ref, {name} AS name, {address} AS address FROM {table}"))
+        _index_rows(conn, kind, rows)
+    conn.execute(text(f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}) VALUES ('rebuild')"))
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+def _index_rows(conn, kind: str, rows) -> None:
+    docs = [dict(zip(("kind", "ref", "name", "address"), search_doc(kind, *row))) for row in rows]
+    if docs:
+        conn.execute(
+            text(
+                f"INSERT INTO {SEARCH_DOCS_TABLE}(kind, ref, name, address) VALUES (:kind, :ref, :name, :address)"
+            ),
+            docs,
+        )
+
+
+def sync_search_index(engine) -> int:
+    # For API-side writers (startup, ORM endpoints); ingest writers drain inside their own transaction.
+    raw = engine.raw_connection()
+    try:
+        drained = drain_search_queue(raw.driver_connection)
+        raw.commit()
+    finally:
+        raw.close()
+    return drained
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _query_name(term: str) -> str:
+    # normalize_building_name minus room-suffix stripping, which would eat trailing digits of a query fragment.
+    return RE_HYPHENS.sub("-", unicodedata.normalize("NFKC", term)).replace("･", "・").strip(" -")
+
+
+def _like_pattern(value: str) -> str:
+    return "%" + value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def build_search_query(q: str) -> tuple[str, str, dict[str, Any]] | None:
+    # Trigram MATCH needs 3+ characters per term; shorter terms (e.g. 2-kanji ward names) filter the docs table.
+    match_terms = []
+    like_terms = []
+    params: dict[str, Any] = {}
+    for idx, term in enumerate(term for term in RE_QUERY_TERMS.split(q.strip()) if term):
+        name = _query_name(term) or term
+        address = normalize_address_jp(term) or term
+        if min(len(name), len(address)) >= TRIGRAM_MIN_CHARS:
+            match_terms.append(f"(name : {_fts_phrase(name)} OR address : {_fts_phrase(address)})")
+        else:
+            params[f"name_{idx}"] = _like_pattern(name)
+            params[f"address_{idx}"] = _like_pattern(address)
+            like_terms.append(
+                f"(d.name LIKE :name_{idx} ESCAPE '\\' OR d.address LIKE :address_{idx} ESCAPE '\\')"
+            )
+    if not match_terms and not like_terms:
+        return None
+    if not match_terms:
+        return f"{SEARCH_DOCS_TABLE} d WHERE " + " AND ".join(like_terms), "d.ref", params
+    params["match"] = " AND ".join(match_terms)
+    source = (
+        f"{SEARCH_FTS_TABLE} JOIN {SEARCH_DOCS_TABLE} d ON d.id = {SEARCH_FTS_TABLE}.rowid "
+        f"WHERE {SEARCH_FTS_TABLE} MATCH :match"
+    )
+    rank = f"bm25({SEARCH_FTS_TABLE}, {BM25_NAME_WEIGHT}, {BM25_ADDRESS_WEIGHT})"
+    return " AND ".join([source, *like_terms]), rank, params
+
+
+def search_refs(conn, kind: str, q: str, *, limit: int, offset: int = 0) -> list[str]:
+    query = build_search_query(q)
+    if query is None:
+        return []
+    source, rank, params = query
+    sql = f"""
+        SELECT d.ref
+        FROM {source} AND d.kind = :kind
+        ORDER BY {rank}
+        LIMIT :limit OFFSET :offset
+    """
+    return list(conn.execute(text(sql), params | {"kind": kind, "limit": limit, "offset": offset}).scalars())
@@ -0,0 +1,168 @@
+import math
+from typing import Any
+
+from sqlalchemy import text
+
+GEO_TABLE = "building_summaries_geo"
+RTREE_TABLE = "building_summaries_rtree"
+SUMMARY_TRIGGERS = ("building_summaries_geo_ai", "building_summaries_geo_au", "building_summaries_geo_ad")
+BUILDING_TRIGGERS = ("buildings_geo_ai", "buildings_geo_au")
+CLUSTER_CELL_PX = 64
+TILE_SIZE_PX = 256
+MAX_CLUSTER_ZOOM = 22
+MERCATOR_MAX_LAT = 85.05112878
+
+
+def _buildings_have_google_coords(conn) -> bool:
+    columns = {row["name"] for row in conn.execute(text("PRAGMA table_info(buildings)")).mappings()}
+    return {"building_id", "google_lat", "google_lng"} <= columns
+
+
+def _insert_geo_sql(row: str, *, with_buildings: bool, source: str = "") -> str:
+    # The summary's own lat/lon wins; the canonical building's Google coordinates fill the gaps.
+    lat = f"{row}.lat"
+    lon = f"{row}.lon"
+    if with_buildings:
+        lat = f"COALESCE({row}.lat, (SELECT google_lat FROM buildings WHERE building_id = {row}.building_key))"
+        lon = f"COALESCE({row}.lon, (SELECT google_lng FROM buildings WHERE building_id = {row}.building_key))"
+    return f"""
+        INSERT INTO {GEO_TABLE}(building_key, lat, lon)
+        SELECT building_key, lat, lon
+          FROM (SELECT {row}.building_key AS building_key, {lat} AS lat, {lon} AS lon {source})
+         WHERE lat IS NOT NULL AND lon IS NOT NULL
+    """
+
+
+def _spatial_ddl(with_buildings: bool) -> list[str]:
+    statements = [
+        f"""
+        CREATE TABLE IF NOT EXISTS {GEO_TABLE} (
+            id INTEGER PRIMARY KEY,
+            building_key TEXT NOT NULL UNIQUE,
+            lat REAL NOT NULL,
+            lon REAL NOT NULL
+        )
+        """,
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {RTREE_TABLE} USING rtree(id, min_lat, max_lat, min_lon, max_lon)",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {RTREE_TABLE}_ai AFTER INSERT ON {GEO_TABLE} BEGIN
+            INSERT INTO {RTREE_TABLE}(id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (NEW.id, NEW.lat, NEW.lat, NEW.lon, NEW.lon);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {RTREE_TABLE}_ad AFTER DELETE ON {GEO_TABLE} BEGIN
+            DELETE FROM {RTREE_TABLE} WHERE id = OLD.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS building_summaries_geo_ai AFTER INSERT ON building_summaries BEGIN
+            {_insert_geo_sql("NEW", with_buildings=with_buildings)};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS building_summaries_geo_au
+        AFTER UPDATE OF building_key, lat, lon ON building_summaries BEGIN
+            DELETE FROM {GEO_TABLE} WHERE building_key = OLD.building_key;
+            {_insert_geo_sql("NEW", with_buildings=with_buildings)};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS building_summaries_geo_ad AFTER DELETE ON building_summaries BEGIN
+            DELETE FROM {GEO_TABLE} WHERE building_key = OLD.building_key;
+        END
+        """,
+    ]
+    if with_buildings:
+        for name, event in zip(BUILDING_TRIGGERS, ("INSERT", "UPDATE OF google_lat, google_lng")):
+            statements.append(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON buildings BEGIN
+                    DELETE FROM {GEO_TABLE} WHERE building_key = NEW.building_id;
+                    INSERT INTO {GEO_TABLE}(building_key, lat, lon)
+                    SELECT s.building_key, COALESCE(s.lat, NEW.google_lat), COALESCE(s.lon, NEW.google_lng)
+                      FROM building_summaries s
+                     WHERE s.building_key = NEW.building_id
+                       AND COALESCE(s.lat, NEW.google_lat) IS NOT NULL
+                       AND COALESCE(s.lon, NEW.google_lng) IS NOT NULL;
+                END
+                """
+            )
+    return statements
+
+
+def spatial_index_present(conn) -> bool:
+    names = {
+        row["name"]
+        for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")).mappings()
+    }
+    required = {GEO_TABLE, RTREE_TABLE, f"{RTREE_TABLE}_ai", f"{RTREE_TABLE}_ad", *SUMMARY_TRIGGERS}
+    if _buildings_have_google_coords(conn):
+        required |= set(BUILDING_TRIGGERS)
+    return required <= names
+
+
+def ensure_spatial_index(conn) -> None:
+    with_buildings = _buildings_have_google_coords(conn)
+    # Recreate the triggers: whether they can see buildings.google_lat/lng depends on the current schema.
+    for name in (*SUMMARY_TRIGGERS, *BUILDING_TRIGGERS):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    for statement in _spatial_ddl(with_buildings):
+        conn.execute(text(statement))
+    conn.execute(text(f"DELETE FROM {GEO_TABLE}"))
+    conn.execute(text(_insert_geo_sql("s", with_buildings=with_buildings, source="FROM building_summaries s")))
+
+
+def bbox_params(
+    min_lat: float | None, max_lat: float | None, min_lng: float | None, max_lng: float | None
+) -> dict[str, float] | None:
+    if min_lat is None and max_lat is None and min_lng is None and max_lng is None:
+        return None
+    return {
+        "min_lat": -90.0 if min_lat is None else min_lat,
+        "max_lat": 90.0 if max_lat is None else max_lat,
+        "min_lng": -180.0 if min_lng is None else min_lng,
+        "max_lng": 180.0 if max_lng is None else max_lng,
+    }
+
+
+# R*Tree bounds are float32 rounded outward, so the exact geo coordinates re-check the candidates.
+BBOX_KEYS_SQL = f"""
+    SELECT g.building_key, g.lat, g.lon
+      FROM {RTREE_TABLE} r
+      JOIN {GEO_TABLE} g ON g.id = r.id
+     WHERE r.max_lat >= :min_lat AND r.min_lat <= :max_lat
+       AND r.max_lon >= :min_lng AND r.min_lon <= :max_lng
+       AND g.lat BETWEEN :min_lat AND :max_lat
+       AND g.lon BETWEEN :min_lng AND :max_lng
+"""
+
+
+def _world_px(lat: float, lon: float, zoom: int) -> tuple[float, float]:
+    scale = TILE_SIZE_PX * 2**zoom
+    lat = max(-MERCATOR_MAX_LAT, min(MERCATOR_MAX_LAT, lat))
+    x = (lon + 180.0) / 360.0 * scale
+    y = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * scale
+    return x, y
+
+
+def cluster_points(points: list[Any], zoom: int) -> list[dict[str, Any]]:
+    cells: dict[tuple[int, int], list[Any]] = {}
+    for point in points:
+        x, y = _world_px(point["lat"], point["lon"], zoom)
+        cells.setdefault((int(x // CLUSTER_CELL_PX), int(y // CLUSTER_CELL_PX)), []).append(point)
+    clusters = []
+    for (cell_x, cell_y), members in sorted(cells.items()):
+        lats = [member["lat"] for member in members]
+        lons = [member["lon"] for member in members]
+        clusters.append(
+            {
+                "lat": sum(lats) / len(lats),
+                "lon": sum(lons) / len(lons),
+                "count": len(members),
+                "bbox": [min(lons), min(lats), max(lons), max(lats)],
+                "building_key": members[0]["building_key"] if len(members) == 1 else None,
+                "cell": [cell_x, cell_y],
+            }
+        )
+    return clusters
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+
+# SequenceMatcher.ratio() is 2*M/(len(a)+len(b)) where M never exceeds the shared
+# character multiset, so character 1-grams give an exact upper bound (bigrams do not:
+# "ABC" vs "AXBXC" scores 0.75 without a shared bigram).
+BOUND_EPSILON = 1e-9
+
+CharToken = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class SimilarityCandidate:
+    building_id: str
+    name: str
+    address: str
+    name_bound: float
+    address_bound: float
+
+
+@dataclass
+class _Entry:
+    name: str
+    name_counts: Counter
+    address: str
+    address_counts: Counter
+
+
+def _char_tokens(text: str) -> list[CharToken]:
+    seen: Counter = Counter()
+    tokens: list[CharToken] = []
+    for ch in text:
+        tokens.append((ch, seen[ch]))
+        seen[ch] += 1
+    return tokens
+
+
+def _required_overlap(length: int, min_ratio: float) -> int:
+    return max(0, math.ceil(min_ratio * length / (2 - min_ratio) - BOUND_EPSILON))
+
+
+def ratio_upper_bound(left: Counter, left_len: int, right: Counter, right_len: int) -> float:
+    if left_len + right_len == 0:
+        return 1.0
+    overlap = sum((left & right).values())
+    return 2.0 * overlap / (left_len + right_len)
+
+
+class CharNgramCandidateIndex:
+    def __init__(self, rows: Iterable[tuple[str, str, str]], *, min_name_ratio: float) -> None:
+        self.min_name_ratio = min_name_ratio
+        self._entries: dict[str, _Entry] = {}
+        self._postings: dict[CharToken, set[str]] = {}
+        materialized = list(rows)
+        self._frequency = Counter(token for _key, name, _address in materialized for token in _char_tokens(name))
+        for key, name, address in materialized:
+            self.add(key, name, address)
+
+    def _order(self, token: CharToken) -> tuple[int, str, int]:
+        return (self._frequency.get(token, 0), token[0], token[1])
+
+    def _prefix(self, name: str) -> list[CharToken]:
+        tokens = sorted(_char_tokens(name), key=self._order)
+        if not tokens:
+            return []
+        return tokens[: len(tokens) - _required_overlap(len(tokens), self.min_name_ratio) + 1]
+
+    def add(self, key: str, name: str, address: str) -> None:
+        previous = self._entries.get(key)
+        if previous is not None:
+            for token in self._prefix(previous.name):
+                self._postings[token].discard(key)
+        self._entries[key] = _Entry(name, Counter(name), address, Counter(address))
+        for token in self._prefix(name):
+            self._postings.setdefault(token, set()).add(key)
+
+    def candidates(self, name: str, address: str) -> list[SimilarityCandidate]:
+        if name:
+            keys: set[str] = set()
+            for token in self._prefix(name):
+                keys |= self._postings.get(token, set())
+        else:
+            keys = set(self._entries)
+
+        name_counts = Counter(name)
+        address_counts = Counter(address)
+        result: list[SimilarityCandidate] = []
+        for key in keys:
+            entry = self._entries[key]
+            name_bound = ratio_upper_bound(name_counts, len(name), entry.name_counts, len(entry.name))
+            if name_bound + BOUND_EPSILON < self.min_name_ratio:
+                continue
+            address_bound = ratio_upper_bound(address_counts, len(address), entry.address_counts, len(entry.address))
+            result.append(SimilarityCandidate(key, entry.name, entry.address, name_bound, address_bound))
+        return result
@@ -12,7 +12,7 @@ from tatemono_map.util.building_age import age_years_from_built_year_month
 
 from .ingest_master_import import REVIEW_COLUMNS, _to_review_row
 from .keys import make_alias_key, make_legacy_alias_key
-from .matcher import match_building
+from .matcher import BuildingMatchIndex
 from .normalization import normalize_building_input
 from .renormalize_buildings import renormalize_buildings
 
@@ -132,6 +132,7 @@ def ingest_building_facts_csv(
 
     conn = connect(db_path)
     renormalize_buildings(conn)
+    match_index = BuildingMatchIndex.from_connection(conn)
     report = Report()
 
     now = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -173,7 +174,7 @@ def ingest_building_facts_csv(
                 )
                 continue
 
-            match = match_building(conn, normalized.normalized_name, normalized.normalized_address)
+            match = match_index.match(normalized.normalized_name, normalized.normalized_address)
             building_id = match.building_id
             if not building_id and match.reason in {"unmatched", "address_without_digits"}:
                 alias_key = make_alias_key(normalized.normalized_name, normalized.normalized_address)
@@ -214,6 +215,7 @@ def ingest_building_facts_csv(
                                 simplified_addr,
                             ),
                         )
+                        match_index.add(building_id, normalized.normalized_name, simplified_addr)
                         report.created += 1
                         created_rows.append(
                             {
@@ -377,6 +379,7 @@ def ingest_building_facts_csv(
                 """,
                 (source, evidence_id, building_id, normalized.raw_name, normalized.raw_address),
             )
+            match_index.add_source(source, evidence_id, building_id, normalized.raw_name)
 
     conn.commit()
     conn.close()
@@ -13,8 +13,9 @@ from pathlib import Path
 from tatemono_map.cli.master_import import _clean_text, _fallback_updated_at, _parse_area, _parse_man_to_yen
 from tatemono_map.db.repo import connect
 
+from .candidates import BOUND_EPSILON
 from .keys import make_alias_key, make_legacy_alias_key
-from .matcher import match_building
+from .matcher import BuildingMatchIndex
 from .normalization import normalize_address_for_matching, normalize_building_input
 from .renormalize_buildings import renormalize_buildings
 
@@ -137,6 +138,14 @@ AUTO_SEED_BLOCKED_REASONS = {
     "address_without_digits",
 }
 
+CLOSE_CONFLICT_NAME_WEIGHT = 0.65
+CLOSE_CONFLICT_ADDRESS_WEIGHT = 0.35
+CLOSE_CONFLICT_MIN_SCORE = 0.82
+CLOSE_CONFLICT_STRONG_SCORE = 0.9
+CLOSE_CONFLICT_MARGIN = 0.03
+# Lowest name ratio that can still reach CLOSE_CONFLICT_MIN_SCORE with a perfect address score.
+CLOSE_CONFLICT_MIN_NAME_RATIO = (CLOSE_CONFLICT_MIN_SCORE - CLOSE_CONFLICT_ADDRESS_WEIGHT) / CLOSE_CONFLICT_NAME_WEIGHT
+
 
 @dataclass
 class Report:
@@ -178,29 +187,37 @@ def _is_probably_room_or_unit_name(name: str) -> bool:
     return False
 
 
-def _has_close_conflict(conn, normalized_name: str, normalized_address: str) -> bool:
-    rows = conn.execute("SELECT norm_name, norm_address FROM buildings").fetchall()
-    scores: list[float] = []
+def _has_close_conflict(match_index: BuildingMatchIndex, normalized_name: str, normalized_address: str) -> bool:
     incoming_addr = normalize_address_for_matching(normalized_address)
-    for row in rows:
-        existing_name = row[0] or ""
-        existing_addr = normalize_address_for_matching(row[1] or "")
+    bounded: list[tuple[float, str, str]] = []
+    for candidate in match_index.similarity_candidates(
+        normalized_name, incoming_addr, min_name_ratio=CLOSE_CONFLICT_MIN_NAME_RATIO
+    ):
+        upper = candidate.name_bound * CLOSE_CONFLICT_NAME_WEIGHT + candidate.address_bound * CLOSE_CONFLICT_ADDRESS_WEIGHT
+        if upper + BOUND_EPSILON >= CLOSE_CONFLICT_MIN_SCORE:
+            bounded.append((upper, candidate.name, candidate.address))
+    bounded.sort(key=lambda item: item[0], reverse=True)
+
+    scores: list[float] = []
+    for upper, existing_name, existing_addr in bounded:
+        if len(scores) > 1 and upper + BOUND_EPSILON < scores[1]:
+            break
         name_score = _score_similarity(normalized_name, existing_name)
         addr_score = _score_similarity(incoming_addr, existing_addr)
-        total = name_score * 0.65 + addr_score * 0.35
-        if total >= 0.82:
+        total = name_score * CLOSE_CONFLICT_NAME_WEIGHT + addr_score * CLOSE_CONFLICT_ADDRESS_WEIGHT
+        if total >= CLOSE_CONFLICT_MIN_SCORE:
             scores.append(total)
+            scores.sort(reverse=True)
     if not scores:
         return False
-    scores.sort(reverse=True)
-    if scores[0] >= 0.9:
+    if scores[0] >= CLOSE_CONFLICT_STRONG_SCORE:
         return True
-    if len(scores) > 1 and scores[0] - scores[1] < 0.03:
+    if len(scores) > 1 and scores[0] - scores[1] < CLOSE_CONFLICT_MARGIN:
         return True
     return False
 
 
-def _can_auto_seed(conn, normalized_name: str, normalized_address: str, match_reason: str) -> tuple[bool, str]:
+def _can_auto_seed(match_index: BuildingMatchIndex, normalized_name: str, normalized_address: str, match_reason: str) -> tuple[bool, str]:
     if not normalized_name:
         return False, "missing_normalized_name"
     if not normalized_address:
@@ -211,7 +228,7 @@ def _can_auto_seed(conn, normalized_name: str, normalized_address: str, match_re
         return False, "address_not_granular"
     if match_reason in AUTO_SEED_BLOCKED_REASONS:
         return False, f"blocked_by_match_reason:{match_reason}"
-    if _has_close_conflict(conn, normalized_name, normalized_address):
+    if _has_close_conflict(match_index, normalized_name, normalized_address):
         return False, "close_conflicting_candidate"
     return True, "high_confidence_unmatched"
 
@@ -335,6 +352,7 @@ def ingest_master_import_csv(
 ) -> Report:
     conn = connect(db_path)
     renormalize_buildings(conn)
+    match_index = BuildingMatchIndex.from_connection(conn)
     report = Report()
     report.auto_seed_enabled = auto_seed_high_confidence
     source_url = f"file:{Path(csv_path).name}"
@@ -417,13 +435,13 @@ def ingest_master_import_csv(
                     legacy_alias_key = make_legacy_alias_key(normalized.normalized_name, normalized.normalized_address)
                     building_id = alias_map.get(legacy_alias_key, "")
 
-                match = match_building(conn, normalized.normalized_name, normalized.normalized_address)
+                match = match_index.match(normalized.normalized_name, normalized.normalized_address)
                 if not building_id:
                     building_id = match.building_id
 
                 if not building_id and match.reason == "unmatched":
                     can_seed, seed_reason = _can_auto_seed(
-                        conn,
+                        match_index,
                         normalized.normalized_name,
                         normalized.normalized_address,
                         match.reason,
@@ -447,6 +465,7 @@ def ingest_master_import_csv(
                                     normalized.normalized_address,
                                 ),
                             )
+                            match_index.add(new_building_id, normalized.normalized_name, normalized.normalized_address)
                             report.newly_added += 1
                             report.auto_seeded_count += 1
                             auto_seed_rows.append(
@@ -547,6 +566,7 @@ def ingest_master_import_csv(
                         """,
                         (source, evidence_id, building_id, normalized.raw_name, normalized.raw_address),
                     )
+                    match_index.add_source(source, evidence_id, building_id, normalized.raw_name)
 
                 listing_key = _listing_key(row)
                 updated_at = _fallback_updated_at(row.get("updated_at"))
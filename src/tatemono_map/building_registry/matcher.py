@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Any
 
+from .candidates import CharNgramCandidateIndex, SimilarityCandidate
 from .normalization import normalize_address_for_matching, normalize_building_input
 
 NAME_SIMILARITY_THRESHOLD = 0.88
@@ -90,55 +91,136 @@ def _pick_strong_unique(candidates: list[tuple[str, float, float, float]], varia
     return MatchResult(None, "address_candidates_low_confidence", top_ids, top_scores, variant)
 
 
+@dataclass
+class _IndexedBuilding:
+    order: int
+    norm_name: str
+    match_address: str
+
+
+@dataclass
+class _IndexedSource:
+    order: int
+    building_id: str
+    alias_name: str
+
+
+class BuildingMatchIndex:
+    def __init__(self) -> None:
+        self._buildings: dict[str, _IndexedBuilding] = {}
+        self._by_address: dict[str, list[str]] = {}
+        self._sources: dict[tuple[str, str], _IndexedSource] = {}
+        self._sources_by_name: dict[str, set[tuple[str, str]]] = {}
+        self._candidate_indexes: dict[float, CharNgramCandidateIndex] = {}
+
+    @classmethod
+    def from_connection(cls, conn: Any) -> "BuildingMatchIndex":
+        index = cls()
+        for row in conn.execute("SELECT building_id, norm_name, norm_address FROM buildings ORDER BY rowid").fetchall():
+            index.add(row[0], row[1], row[2])
+        for row in conn.execute(
+            """
+            SELECT source, evidence_id, building_id, raw_name
+            FROM building_sources
+            WHERE raw_name IS NOT NULL AND raw_name <> ''
+            ORDER BY rowid
+            """
+        ).fetchall():
+            index.add_source(row[0], row[1], row[2], row[3])
+        return index
+
+    def add(self, building_id: str, norm_name: str | None, norm_address: str | None) -> None:
+        match_address = normalize_address_for_matching(norm_address or "")
+        for candidate_index in self._candidate_indexes.values():
+            candidate_index.add(building_id, norm_name or "", match_address)
+        existing = self._buildings.get(building_id)
+        if existing is None:
+            self._buildings[building_id] = _IndexedBuilding(len(self._buildings), norm_name or "", match_address)
+            self._by_address.setdefault(match_address, []).append(building_id)
+            return
+        existing.norm_name = norm_name or ""
+        if existing.match_address == match_address:
+            return
+        self._by_address[existing.match_address].remove(building_id)
+        existing.match_address = match_address
+        bucket = self._by_address.setdefault(match_address, [])
+        bucket.append(building_id)
+        bucket.sort(key=lambda bid: self._buildings[bid].order)
+
+    def add_source(self, source: str, evidence_id: str, building_id: str, raw_name: str | None) -> None:
+        key = (source, evidence_id)
+        alias_name = normalize_building_input(raw_name, "").normalized_name if raw_name else ""
+        existing = self._sources.get(key)
+        if existing is not None:
+            self._sources_by_name[existing.alias_name].discard(key)
+            order = existing.order
+        else:
+            order = len(self._sources)
+        self._sources[key] = _IndexedSource(order, building_id, alias_name)
+        self._sources_by_name.setdefault(alias_name, set()).add(key)
+
+    def similarity_candidates(
+        self, normalized_name: str, match_address: str, *, min_name_ratio: float
+    ) -> list[SimilarityCandidate]:
+        candidate_index = self._candidate_indexes.get(min_name_ratio)
+        if candidate_index is None:
+            candidate_index = CharNgramCandidateIndex(
+                ((building_id, entry.norm_name, entry.match_address) for building_id, entry in self._buildings.items()),
+                min_name_ratio=min_name_ratio,
+            )
+            self._candidate_indexes[min_name_ratio] = candidate_index
+        return candidate_index.candidates(normalized_name, match_address)
+
+    def match(self, normalized_name: str, normalized_address: str) -> MatchResult:
+        if _has_multi_lot_or_range(normalized_address):
+            return MatchResult(None, "address_multi_or_range", [], [])
+
+        alias_hits: list[str] = []
+        input_address_variants = _address_variants(normalized_address)
+        if normalized_name:
+            alias_keys = sorted(self._sources_by_name.get(normalized_name, ()), key=lambda key: self._sources[key].order)
+            for key in alias_keys:
+                building_id = self._sources[key].building_id
+                building = self._buildings.get(building_id)
+                if building is None:
+                    continue
+                source_addr = building.match_address
+                if source_addr and source_addr in input_address_variants and building_id not in alias_hits:
+                    alias_hits.append(building_id)
+        if len(alias_hits) == 1:
+            return MatchResult(alias_hits[0], "alias_exact", [alias_hits[0]], [1.0])
+        if len(alias_hits) > 1:
+            return MatchResult(None, "alias_ambiguous", alias_hits[:3], [1.0 for _ in alias_hits[:3]])
+
+        if not _has_digit(normalized_address):
+            return MatchResult(None, "address_without_digits", [], [])
+
+        for idx, variant in enumerate(input_address_variants):
+            matched = self._by_address.get(variant)
+            if not matched:
+                continue
+            if len(matched) == 1:
+                building_id = matched[0]
+                name_score = _score_name(normalized_name, self._buildings[building_id].norm_name)
+                if idx == 0:
+                    return MatchResult(building_id, "address_exact", [building_id], [round(name_score, 4)], variant)
+                if name_score >= NAME_SIMILARITY_THRESHOLD:
+                    return MatchResult(building_id, "address_variant_exact", [building_id], [round(name_score, 4)], variant)
+                return MatchResult(None, "address_name_low_confidence", [building_id], [round(name_score, 4)], variant)
+
+            scored = []
+            for building_id in matched:
+                building = self._buildings[building_id]
+                name_score = _score_name(normalized_name, building.norm_name)
+                addr_score = _score_address(variant, building.match_address)
+                total = name_score * 0.7 + addr_score * 0.3
+                scored.append((building_id, total, name_score, addr_score))
+            result = _pick_strong_unique(scored, variant if idx > 0 else "")
+            if result.reason != "unmatched":
+                return result
+
+        return MatchResult(None, "unmatched", [], [])
+
+
 def match_building(conn: Any, normalized_name: str, normalized_address: str) -> MatchResult:
-    if _has_multi_lot_or_range(normalized_address):
-        return MatchResult(None, "address_multi_or_range", [], [])
-
-    alias_rows = conn.execute(
-        """
-        SELECT s.building_id, s.raw_name, b.norm_address
-        FROM building_sources s
-        INNER JOIN buildings b ON b.building_id = s.building_id
-        WHERE s.raw_name IS NOT NULL AND s.raw_name <> ''
-        """
-    ).fetchall()
-    alias_hits: list[str] = []
-    input_address_variants = set(_address_variants(normalized_address))
-    for row in alias_rows:
-        alias_norm = normalize_building_input(row[1], "").normalized_name
-        source_addr = normalize_address_for_matching(row[2] or "")
-        address_matches = bool(source_addr and source_addr in input_address_variants)
-        if alias_norm and alias_norm == normalized_name and address_matches and row[0] not in alias_hits:
-            alias_hits.append(row[0])
-    if len(alias_hits) == 1:
-        return MatchResult(alias_hits[0], "alias_exact", [alias_hits[0]], [1.0])
-    if len(alias_hits) > 1:
-        return MatchResult(None, "alias_ambiguous", alias_hits[:3], [1.0 for _ in alias_hits[:3]])
-
-    addr_rows = conn.execute("SELECT building_id, norm_name, norm_address FROM buildings").fetchall()
-    if not _has_digit(normalized_address):
-        return MatchResult(None, "address_without_digits", [], [])
-
-    for idx, variant in enumerate(_address_variants(normalized_address)):
-        matched = [row for row in addr_rows if normalize_address_for_matching(row[2] or "") == variant]
-        if not matched:
-            continue
-        if len(matched) == 1:
-            name_score = _score_name(normalized_name, matched[0][1] or "")
-            if idx == 0:
-                return MatchResult(matched[0][0], "address_exact", [matched[0][0]], [round(name_score, 4)], variant)
-            if name_score >= NAME_SIMILARITY_THRESHOLD:
-                return MatchResult(matched[0][0], "address_variant_exact", [matched[0][0]], [round(name_score, 4)], variant)
-            return MatchResult(None, "address_name_low_confidence", [matched[0][0]], [round(name_score, 4)], variant)
-
-        scored = []
-        for row in matched:
-            name_score = _score_name(normalized_name, row[1] or "")
-            addr_score = _score_address(variant, normalize_address_for_matching(row[2] or ""))
-            total = name_score * 0.7 + addr_score * 0.3
-            scored.append((row[0], total, name_score, addr_score))
-        result = _pick_strong_unique(scored, variant if idx > 0 else "")
-        if result.reason != "unmatched":
-            return result
-
-    return MatchResult(None, "unmatched", [], [])
+    return BuildingMatchIndex.from_connection(conn).match(normalized_name, normalized_address)
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from tatemono_map.db.repo import connect
 
-from .matcher import match_building
+from .matcher import BuildingMatchIndex
 from .keys import make_alias_key
 from .normalization import normalize_building_input
 
@@ -23,6 +23,7 @@ def _pick(row: dict[str, str], *keys: str) -> str:
 
 def seed_from_ui_csv(db_path: str, csv_path: str, source: str = "ui_seed") -> tuple[int, int, int]:
     conn = connect(db_path)
+    match_index = BuildingMatchIndex.from_connection(conn)
     inserted = 0
     attached = 0
     aliases = 0
@@ -49,9 +50,11 @@ def seed_from_ui_csv(db_path: str, csv_path: str, source: str = "ui_seed") -> tu
                     winner_id = winner[0]
 
             alias_key = make_alias_key(normalized.normalized_name, normalized.normalized_address)
-            match = match_building(conn, normalized.normalized_name, normalized.normalized_address)
+            match = match_index.match(normalized.normalized_name, normalized.normalized_address)
             building_id = winner_id or match.building_id or alias_key
-            existing = conn.execute("SELECT 1 FROM buildings WHERE building_id=?", (building_id,)).fetchone()
+            existing = conn.execute(
+                "SELECT norm_name, norm_address FROM buildings WHERE building_id=?", (building_id,)
+            ).fetchone()
             if existing is None:
                 conn.execute(
                     """
@@ -68,6 +71,7 @@ def seed_from_ui_csv(db_path: str, csv_path: str, source: str = "ui_seed") -> tu
                         normalized.normalized_address,
                     ),
                 )
+                match_index.add(building_id, normalized.normalized_name, normalized.normalized_address)
                 inserted += 1
             else:
                 conn.execute(
@@ -80,6 +84,11 @@ def seed_from_ui_csv(db_path: str, csv_path: str, source: str = "ui_seed") -> tu
                     """,
                     (normalized.normalized_name, normalized.normalized_address, building_id),
                 )
+                match_index.add(
+                    building_id,
+                    existing["norm_name"] or normalized.normalized_name,
+                    existing["norm_address"] or normalized.normalized_address,
+                )
 
             if winner_id and alias_key != winner_id:
                 conn.execute(
@@ -107,6 +116,7 @@ def seed_from_ui_csv(db_path: str, csv_path: str, source: str = "ui_seed") -> tu
                     """,
                     (source, evidence_id, building_id, normalized.raw_name, normalized.raw_address),
                 )
+                match_index.add_source(source, evidence_id, building_id, normalized.raw_name)
                 attached += 1
 
     conn.commit()
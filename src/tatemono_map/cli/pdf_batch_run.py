@@ -3,14 +3,21 @@ from __future__ import annotations
 import argparse
 import csv
 import hashlib
+import io
+import json
+import pickle
 import re
+import sqlite3
 import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
 
-from importlib import import_module
+from importlib import import_module, metadata
 
 FINAL_SCHEMA = [
     "category",
@@ -66,6 +73,9 @@ REALPRO_CONTEXT_INNER_BAND_PX = 60.0
 
 REALPRO_TABLE_HEADER_TOKENS = ["号室名", "賃料", "共益費", "間取", "面積", "敷金", "礼金", "管理費"]
 NON_BLOCKING_QC_REASONS = {"address_normalize_failed"}
+# Bump whenever detection or parser output changes so cached parses are not reused.
+PARSE_CACHE_VERSION = 1
+PARSER_DISTRIBUTIONS = ("pdfplumber", "pypdf")
 
 
 def _PdfReader():
@@ -109,7 +119,7 @@ class VacancyParser(Protocol):
     def detect_kind(self, first_page_text: str, metadata: Dict[str, Any]) -> DetectResult:
         ...
 
-    def parse(self, pdf_path: Path) -> ParseResult:
+    def parse(self, pdf_path: Path | PdfDocument) -> ParseResult:
         ...
 
 
@@ -176,9 +186,97 @@ def sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
-def page_count_fast(path: Path) -> int:
-    r = _PdfReader()(str(path))
-    return len(r.pages)
+# Page extractors whose results are memoized per (method, arguments) on a shared handle.
+CACHED_PAGE_METHODS = frozenset({"extract_text", "extract_words", "extract_tables", "find_tables"})
+
+
+class _CachedPage:
+    def __init__(self, page: Any):
+        self._page = page
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._page, name)
+        if name not in CACHED_PAGE_METHODS:
+            return attr
+
+        def cached(*args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key not in self._cache:
+                self._cache[key] = attr(*args, **kwargs)
+            return self._cache[key]
+
+        return cached
+
+
+class PdfDocument:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._data: Optional[bytes] = None
+        self._sha256 = ""
+        self._reader: Any = None
+        self._pages: Optional[List[_CachedPage]] = None
+        self._stack = ExitStack()
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._stack.close()
+        self._pages = None
+
+    def _load(self) -> bytes:
+        if self._data is None:
+            h = hashlib.sha256()
+            chunks: List[bytes] = []
+            with self.path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+                    chunks.append(chunk)
+            self._data = b"".join(chunks)
+            self._sha256 = h.hexdigest()
+        return self._data
+
+    @property
+    def sha256(self) -> str:
+        self._load()
+        return self._sha256
+
+    @property
+    def size(self) -> int:
+        return len(self._load())
+
+    @property
+    def reader(self) -> Any:
+        if self._reader is None:
+            self._reader = _PdfReader()(io.BytesIO(self._load()))
+        return self._reader
+
+    @property
+    def pages(self) -> List[_CachedPage]:
+        if self._pages is None:
+            # Parsers may be handed a path that was never read (e.g. direct parse calls); open it by name then.
+            source = io.BytesIO(self._data) if self._data is not None else str(self.path)
+            pdf = self._stack.enter_context(pdfplumber.open(source))
+            self._pages = [_CachedPage(page) for page in pdf.pages]
+        return self._pages
+
+
+@contextmanager
+def open_pdf_document(source: Path | PdfDocument) -> Iterator[PdfDocument]:
+    if isinstance(source, PdfDocument):
+        yield source
+        return
+    with PdfDocument(source) as doc:
+        yield doc
+
+
+def page_count_fast(path: Path | PdfDocument) -> int:
+    with open_pdf_document(path) as doc:
+        return len(doc.reader.pages)
 
 
 def parse_updated_at(text: str) -> str:
@@ -411,10 +509,11 @@ class UlucksParser:
                 score += 1
         return DetectResult(kind="ulucks" if score >= 4 else "non_vacancy", reason=f"ulucks_score={score}")
 
-    def parse(self, pdf_path: Path) -> ParseResult:
+    def parse(self, pdf_path: Path | PdfDocument) -> ParseResult:
         rows: List[Dict[str, Any]] = []
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for pi, page in enumerate(pdf.pages, start=1):
+        with open_pdf_document(pdf_path) as doc:
+            pdf_path = doc.path
+            for pi, page in enumerate(doc.pages, start=1):
                 text = page.extract_text() or ""
                 text = normalize_pdf_text(text)
                 updated = parse_updated_at(text)
@@ -611,11 +710,12 @@ class RealproParser:
             lines = self._words_to_lines(pseudo_words)
         return self._extract_context_from_lines(lines, ward_hint)
 
-    def parse(self, pdf_path: Path) -> ParseResult:
+    def parse(self, pdf_path: Path | PdfDocument) -> ParseResult:
         rows: List[Dict[str, Any]] = []
         warns: List[str] = []
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for pi, page in enumerate(pdf.pages, start=1):
+        with open_pdf_document(pdf_path) as doc:
+            pdf_path = doc.path
+            for pi, page in enumerate(doc.pages, start=1):
                 text = page.extract_text() or ""
                 text = normalize_pdf_text(text)
                 updated = parse_updated_at(text)
@@ -747,22 +847,23 @@ class RealproParser:
 PARSERS: Sequence[VacancyParser] = [UlucksParser(), RealproParser()]
 
 
-def detect_pdf_kind(path: Path) -> DetectResult:
-    first = ""
-    try:
-        r = _PdfReader()(str(path))
-        if r.pages:
-            first = normalize_pdf_text(r.pages[0].extract_text() or "")
-    except Exception:
+def detect_pdf_kind(path: Path | PdfDocument) -> DetectResult:
+    with open_pdf_document(path) as doc:
         first = ""
-    if not first:
         try:
-            with pdfplumber.open(str(path)) as pdf:
-                first = normalize_pdf_text(pdf.pages[0].extract_text() or "")
-        except Exception as e:
-            return DetectResult("non_vacancy", f"sniff_error:{type(e).__name__}")
-
-    meta = {"filename": path.name}
+            r = doc.reader
+            if r.pages:
+                first = normalize_pdf_text(r.pages[0].extract_text() or "")
+        except Exception:
+            first = ""
+        if not first:
+            try:
+                first = normalize_pdf_text(doc.pages[0].extract_text() or "")
+            except Exception as e:
+                return DetectResult("non_vacancy", f"sniff_error:{type(e).__name__}")
+        name = doc.path.name
+
+    meta = {"filename": name}
     results = [p.detect_kind(first, meta) for p in PARSERS]
     matched = [r for r in results if r.kind != "non_vacancy"]
     if len(matched) == 1:
@@ -835,17 +936,18 @@ def write_master_import_csv(df: pd.DataFrame, path: Path) -> None:
     out.to_csv(path, index=False, encoding="utf-8-sig", lineterminator="\r\n", quoting=csv.QUOTE_ALL, na_rep="")
 
 
-def _extract_with_parser(kind: str, path: Path) -> ParseResult:
+def _extract_with_parser(kind: str, path: Path | PdfDocument) -> ParseResult:
     parser = next((p for p in PARSERS if p.name == kind), None)
     if parser is None:
         return ParseResult(df=pd.DataFrame([], columns=FINAL_SCHEMA + LEGACY_SCHEMA), warnings=["unsupported_kind"], drop_reasons={})
     try:
         return parser.parse(path)
     except Exception as e:
-        raise RuntimeError(f"pdf_parse_failed kind={kind} file={path}") from e
+        file = path.path if isinstance(path, PdfDocument) else path
+        raise RuntimeError(f"pdf_parse_failed kind={kind} file={file}") from e
 
 
-def _try_parse_ambiguous(path: Path) -> Tuple[str, Optional[ParseResult]]:
+def _try_parse_ambiguous(path: Path | PdfDocument) -> Tuple[str, Optional[ParseResult]]:
     for kind in ("realpro", "ulucks"):
         parsed = _extract_with_parser(kind, path)
         if len(parsed.df) > 0:
@@ -853,6 +955,286 @@ def _try_parse_ambiguous(path: Path) -> Tuple[str, Optional[ParseResult]]:
     return "non_vacancy", None
 
 
+@dataclass
+class PdfOutcome:
+    manifest_row: Dict[str, Any]
+    stats_row: Dict[str, Any]
+    qc_lines: List[str]
+    failed: bool = False
+    sha256: str = ""
+    df: Optional[pd.DataFrame] = None
+    error: str = ""
+
+
+@dataclass
+class PdfAnalysis:
+    pages: int
+    detect: DetectResult
+    kind: str
+    parsed: Optional[ParseResult]
+
+
+@lru_cache(maxsize=1)
+def parser_version() -> str:
+    # Parsed rows depend on this module's code and on the extraction libraries, not just on the PDF bytes.
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for dist in PARSER_DISTRIBUTIONS:
+        try:
+            digest.update(f"{dist}={metadata.version(dist)}".encode())
+        except metadata.PackageNotFoundError:
+            digest.update(f"{dist}=".encode())
+    return f"{PARSE_CACHE_VERSION}-{digest.hexdigest()[:16]}"
+
+
+class ParseCache:
+    def __init__(self, cache_dir: Path):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = cache_dir / "parse_cache.sqlite3"
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                sha256 TEXT NOT NULL,
+                parser_version TEXT NOT NULL,
+                pages INTEGER NOT NULL,
+                detect_kind TEXT NOT NULL,
+                detect_reason TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                df_pickle BLOB,
+                warnings_json TEXT,
+                drop_reasons_json TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (sha256, parser_version)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get(self, sha256: str) -> Optional[PdfAnalysis]:
+        row = self.conn.execute(
+            """
+            SELECT pages, detect_kind, detect_reason, kind, df_pickle, warnings_json, drop_reasons_json
+            FROM parse_cache WHERE sha256 = ? AND parser_version = ?
+            """,
+            (sha256, parser_version()),
+        ).fetchone()
+        if row is None:
+            return None
+        pages, detect_kind, detect_reason, kind, df_pickle, warnings_json, drop_reasons_json = row
+        parsed: Optional[ParseResult] = None
+        if df_pickle is not None:
+            try:
+                df = pickle.loads(df_pickle)
+            except Exception:
+                # Written by an incompatible pandas; parse again and overwrite.
+                return None
+            parsed = ParseResult(df=df, warnings=json.loads(warnings_json), drop_reasons=json.loads(drop_reasons_json))
+        return PdfAnalysis(pages=pages, detect=DetectResult(detect_kind, detect_reason), kind=kind, parsed=parsed)
+
+    def put(self, sha256: str, analysis: PdfAnalysis) -> None:
+        parsed = analysis.parsed
+        self.conn.execute(
+            """
+            INSERT INTO parse_cache(
+                sha256, parser_version, pages, detect_kind, detect_reason, kind,
+                df_pickle, warnings_json, drop_reasons_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(sha256, parser_version) DO UPDATE SET
+                pages=excluded.pages,
+                detect_kind=excluded.detect_kind,
+                detect_reason=excluded.detect_reason,
+                kind=excluded.kind,
+                df_pickle=excluded.df_pickle,
+                warnings_json=excluded.warnings_json,
+                drop_reasons_json=excluded.drop_reasons_json,
+                created_at=CURRENT_TIMESTAMP
+            """,
+            (
+                sha256,
+                parser_version(),
+                analysis.pages,
+                analysis.detect.kind,
+                analysis.detect.reason,
+                analysis.kind,
+                pickle.dumps(parsed.df, protocol=pickle.HIGHEST_PROTOCOL) if parsed else None,
+                json.dumps(parsed.warnings, ensure_ascii=False) if parsed else None,
+                json.dumps(parsed.drop_reasons, ensure_ascii=False) if parsed else None,
+            ),
+        )
+        self.conn.commit()
+
+
+def analyze_pdf(doc: PdfDocument) -> PdfAnalysis:
+    pages = 0
+    try:
+        pages = page_count_fast(doc)
+    except Exception:
+        pages = 0
+
+    detect = detect_pdf_kind(doc)
+    kind = detect.kind
+    parsed: Optional[ParseResult] = None
+    if kind == "non_vacancy" and detect.reason == "ambiguous_kind":
+        recovered_kind, recovered = _try_parse_ambiguous(doc)
+        if recovered is not None:
+            kind = recovered_kind
+            parsed = recovered
+    if kind != "non_vacancy" and parsed is None:
+        parsed = _extract_with_parser(kind, doc)
+    return PdfAnalysis(pages=pages, detect=detect, kind=kind, parsed=parsed)
+
+
+def process_pdf(path: Path, *, qc_mode: str, cache: Optional[ParseCache] = None) -> PdfOutcome:
+    with PdfDocument(path) as doc:
+        if cache is None:
+            return _process_document(doc, analyze_pdf(doc), qc_mode=qc_mode)
+        analysis = cache.get(doc.sha256)
+        cache_status = "hit" if analysis is not None else "miss"
+        if analysis is None:
+            analysis = analyze_pdf(doc)
+            cache.put(doc.sha256, analysis)
+        outcome = _process_document(doc, analysis, qc_mode=qc_mode)
+        outcome.stats_row["parse_cache"] = cache_status
+        return outcome
+
+
+def _process_document(doc: PdfDocument, analysis: PdfAnalysis, *, qc_mode: str) -> PdfOutcome:
+    path = doc.path
+    sha = doc.sha256
+    pages = analysis.pages
+    detect = analysis.detect
+    kind = analysis.kind
+    manifest_row = {
+        "file": path.name,
+        "sha256": sha,
+        "bytes": doc.size,
+        "pages": pages,
+        "kind": detect.kind,
+        "classify_reason": detect.reason,
+    }
+
+    if kind == "non_vacancy":
+        return PdfOutcome(
+            manifest_row=manifest_row,
+            stats_row={
+                "file": path.name,
+                "sha256": sha,
+                "pages": pages,
+                "kind": kind,
+                "extracted_rows": 0,
+                "drop_reasons": "",
+                "warning_count": 1,
+                "status": "WARN",
+                "reasons": detect.reason,
+            },
+            qc_lines=[f"[WARN] {path.name} kind=non_vacancy reason={detect.reason}"],
+        )
+
+    parsed = analysis.parsed
+    assert parsed is not None
+    df = parsed.df
+    extracted_row_count = len(df)
+    df, dropped_rows, drop_reasons = apply_name_and_row_filters(df)
+    df, dup_removed = dedupe(df)
+
+    reasons: List[str] = []
+    blocking_reasons: List[str] = []
+    status = "SKIP" if qc_mode == "off" else "OK"
+    if qc_mode != "off":
+        reasons = qc_check(df, kind)
+        reasons.extend(parsed.warnings)
+        blocking_reasons = [r for r in reasons if r not in NON_BLOCKING_QC_REASONS]
+        status = "OK" if not reasons else "WARN"
+
+    qc_lines: List[str] = []
+    if reasons:
+        qc_lines.append(f"[WARN] {path.name} kind={kind} reasons={';'.join(reasons)}")
+
+    return PdfOutcome(
+        manifest_row=manifest_row,
+        stats_row={
+            "file": path.name,
+            "sha256": sha,
+            "pages": pages,
+            "kind": kind,
+            "extracted_rows": len(df),
+            "drop_reasons": ";".join(f"{k}:{v}" for k, v in drop_reasons.items() if v),
+            "warning_count": len(reasons),
+            "status": status,
+            "dedupe_removed": dup_removed,
+            "source_extracted_rows": extracted_row_count,
+            "reasons": ";".join(reasons),
+        },
+        qc_lines=qc_lines,
+        failed=should_stop_on_qc_failures(qc_mode, 1 if blocking_reasons else 0),
+        sha256=sha,
+        df=df,
+    )
+
+
+def _process_pdf_or_error(path: Path, *, qc_mode: str, cache: Optional[ParseCache] = None) -> PdfOutcome:
+    # A broken PDF becomes its own failed outcome instead of an exception that tears down the batch (or pool).
+    try:
+        return process_pdf(path, qc_mode=qc_mode, cache=cache)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        return PdfOutcome(
+            manifest_row={"file": path.name, "sha256": "", "bytes": "", "pages": 0, "kind": "error", "classify_reason": error},
+            stats_row={
+                "file": path.name,
+                "sha256": "",
+                "pages": 0,
+                "kind": "error",
+                "extracted_rows": 0,
+                "drop_reasons": "",
+                "warning_count": 1,
+                "status": "ERROR",
+                "reasons": error,
+            },
+            qc_lines=[f"[ERROR] {path.name} {error}"],
+            failed=True,
+            error=error,
+        )
+
+
+_worker_cache: Optional[ParseCache] = None
+
+
+def _init_worker_cache(cache_dir: str) -> None:
+    # One cache connection per worker process, opened (and its DDL run) once for all the PDFs it handles.
+    global _worker_cache
+    _worker_cache = ParseCache(Path(cache_dir)) if cache_dir else None
+
+
+def _process_pdf_in_worker(path: Path, *, qc_mode: str) -> PdfOutcome:
+    return _process_pdf_or_error(path, qc_mode=qc_mode, cache=_worker_cache)
+
+
+def iter_pdf_outcomes(
+    paths: Sequence[Path], *, qc_mode: str, workers: int = 1, cache_dir: str = ""
+) -> Iterator[PdfOutcome]:
+    # Executor.map yields in submission order, so merged outputs match the serial run.
+    if workers <= 1 or len(paths) <= 1:
+        with ExitStack() as stack:
+            cache = stack.enter_context(ParseCache(Path(cache_dir))) if cache_dir else None
+            for path in paths:
+                yield _process_pdf_or_error(path, qc_mode=qc_mode, cache=cache)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_cache, initargs=(cache_dir,)) as pool:
+        yield from pool.map(partial(_process_pdf_in_worker, qc_mode=qc_mode), paths)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--ulucks-dir", required=False, default="")
@@ -860,6 +1242,8 @@ def main() -> int:
     ap.add_argument("--out-dir", required=True)
     ap.add_argument("--qc-mode", choices=["strict", "warn", "off"], default="warn")
     ap.add_argument("--legacy-columns", action="store_true")
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--cache-dir", default="", help="persistent parse cache keyed by PDF sha256 and parser version")
     args = ap.parse_args()
 
     out_dir = Path(args.out_dir)
@@ -871,102 +1255,29 @@ def main() -> int:
     qc_lines: List[str] = []
     all_dfs: List[pd.DataFrame] = []
     failures = 0
-
-    def handle_pdf(path: Path) -> None:
-        nonlocal failures
-        sha = sha256_file(path)
-        pages = 0
-        try:
-            pages = page_count_fast(path)
-        except Exception:
-            pages = 0
-
-        detect = detect_pdf_kind(path)
-        kind = detect.kind
-        manifest_rows.append(
-            {
-                "file": path.name,
-                "sha256": sha,
-                "bytes": path.stat().st_size,
-                "pages": pages,
-                "kind": kind,
-                "classify_reason": detect.reason,
-            }
-        )
-
-        parsed: Optional[ParseResult] = None
-        if kind == "non_vacancy" and detect.reason == "ambiguous_kind":
-            recovered_kind, recovered = _try_parse_ambiguous(path)
-            if recovered is not None:
-                kind = recovered_kind
-                parsed = recovered
-
-        if kind == "non_vacancy":
-            qc_lines.append(f"[WARN] {path.name} kind=non_vacancy reason={detect.reason}")
-            stats_rows.append(
-                {
-                    "file": path.name,
-                    "sha256": sha,
-                    "pages": pages,
-                    "kind": kind,
-                    "extracted_rows": 0,
-                    "drop_reasons": "",
-                    "warning_count": 1,
-                    "status": "WARN",
-                    "reasons": detect.reason,
-                }
-            )
-            return
-
-        if parsed is None:
-            parsed = _extract_with_parser(kind, path)
-        df = parsed.df
-        extracted_row_count = len(df)
-        df, dropped_rows, drop_reasons = apply_name_and_row_filters(df)
-        df, dup_removed = dedupe(df)
-        per_path = per_pdf_dir / f"{sha}.csv"
-        write_csv(df, per_path, legacy_columns=args.legacy_columns)
-
-        reasons: List[str] = []
-        blocking_reasons: List[str] = []
-        status = "SKIP" if args.qc_mode == "off" else "OK"
-        if args.qc_mode != "off":
-            reasons = qc_check(df, kind)
-            reasons.extend(parsed.warnings)
-            blocking_reasons = [r for r in reasons if r not in NON_BLOCKING_QC_REASONS]
-            status = "OK" if not reasons else "WARN"
-
-        if reasons:
-            qc_lines.append(f"[WARN] {path.name} kind={kind} reasons={';'.join(reasons)}")
-        if should_stop_on_qc_failures(args.qc_mode, 1 if blocking_reasons else 0):
+    errors = 0
+
+    paths = [p for root in [args.ulucks_dir, args.realpro_dir] if root for p in sorted(Path(root).rglob("*.pdf"))]
+    for outcome in iter_pdf_outcomes(paths, qc_mode=args.qc_mode, workers=args.workers, cache_dir=args.cache_dir):
+        manifest_rows.append(outcome.manifest_row)
+        stats_rows.append(outcome.stats_row)
+        qc_lines.extend(outcome.qc_lines)
+        if outcome.failed:
             failures += 1
-
-        stats_rows.append(
-            {
-                "file": path.name,
-                "sha256": sha,
-                "pages": pages,
-                "kind": kind,
-                "extracted_rows": len(df),
-                "drop_reasons": ";".join(f"{k}:{v}" for k, v in drop_reasons.items() if v),
-                "warning_count": len(reasons),
-                "status": status,
-                "dedupe_removed": dup_removed,
-                "source_extracted_rows": extracted_row_count,
-                "reasons": ";".join(reasons),
-            }
-        )
-        all_dfs.append(df)
-
-    for root in [args.ulucks_dir, args.realpro_dir]:
-        if root:
-            for p in sorted(Path(root).rglob("*.pdf")):
-                handle_pdf(p)
+        if outcome.error:
+            errors += 1
+        if outcome.df is not None:
+            write_csv(outcome.df, per_pdf_dir / f"{outcome.sha256}.csv", legacy_columns=args.legacy_columns)
+            all_dfs.append(outcome.df)
 
     pd.DataFrame(manifest_rows).to_csv(out_dir / "manifest.csv", index=False, encoding="utf-8-sig", lineterminator="\r\n", quoting=csv.QUOTE_ALL)
     pd.DataFrame(stats_rows).to_csv(out_dir / "stats.csv", index=False, encoding="utf-8-sig", lineterminator="\r\n", quoting=csv.QUOTE_ALL)
     (out_dir / "qc_report.txt").write_text("\r\n".join(qc_lines) + ("\r\n" if qc_lines else ""), encoding="utf-8-sig")
 
+    if errors:
+        print(f"[STOP] PDFs failed to process: {errors}", file=sys.stderr)
+        return 2
+
     if should_stop_on_qc_failures(args.qc_mode, failures):
         print(f"[STOP] QC warnings treated as failures: {failures}", file=sys.stderr)
         return 2
@@ -1,6 +1,7 @@
-from .repo import ListingRecord, connect, insert_raw_source, replace_building_summary, upsert_listing
+from .repo import BuildingSummaryWriter, ListingRecord, connect, insert_raw_source, replace_building_summary, upsert_listing
 
 __all__ = [
+    "BuildingSummaryWriter",
     "ListingRecord",
     "connect",
     "insert_raw_source",
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from dataclasses import dataclass
+
+from tatemono_map.db.repo import connect
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name: str
+    table: str
+    sql: str
+    params: tuple = ()
+
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery(
+        name="building_summaries.current_snapshot",
+        table="listings",
+        sql="""
+        SELECT building_key FROM listings
+        WHERE (
+            ingest_run_id IN (SELECT ingest_run_id FROM current_ingest_snapshots)
+            OR (ingest_run_id IS NULL AND NOT EXISTS (SELECT 1 FROM current_ingest_snapshots))
+        )
+        """,
+    ),
+    HotQuery(
+        name="building_summaries.refresh_keys",
+        table="listings",
+        sql="SELECT id FROM listings WHERE building_key IN (?, ?)",
+        params=("k1", "k2"),
+    ),
+    HotQuery(
+        name="building_summaries.refresh_member_aliases",
+        table="building_key_aliases",
+        sql="SELECT alias_key, canonical_key FROM building_key_aliases WHERE canonical_key IN (?, ?)",
+        params=("k1", "k2"),
+    ),
+    HotQuery(
+        name="apply_building_corrections.duplicate_candidates",
+        table="buildings",
+        sql="""
+        SELECT building_id, canonical_name, canonical_address
+          FROM buildings
+         WHERE building_id <> ?
+           AND ((? <> '' AND norm_name = ?) OR (? <> '' AND norm_address = ?))
+         ORDER BY building_id
+        """,
+        params=("b1", "n", "n", "a", "a"),
+    ),
+    HotQuery(
+        name="apply_building_corrections.find_candidates",
+        table="buildings",
+        sql="SELECT building_id FROM buildings WHERE canonical_name = ? AND canonical_address = ? ORDER BY building_id",
+        params=("n", "a"),
+    ),
+    HotQuery(
+        name="apply_building_corrections.find_candidates_fallback",
+        table="buildings",
+        sql="""
+        SELECT building_id FROM buildings
+         WHERE canonical_name = ? OR canonical_address = ? OR canonical_name = ? OR canonical_address = ?
+         ORDER BY building_id
+        """,
+        params=("n", "a", "o", "o"),
+    ),
+    HotQuery(
+        name="building_sources.by_building",
+        table="building_sources",
+        sql="SELECT source, evidence_id FROM building_sources WHERE building_id = ?",
+        params=("b1",),
+    ),
+)
+
+
+def explain(conn: sqlite3.Connection, query: HotQuery) -> list[str]:
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query.sql}", query.params).fetchall()]
+
+
+def full_scans(conn: sqlite3.Connection) -> list[str]:
+    # "SCAN <table> USING COVERING INDEX" still walks every row, so any SCAN of the hot table counts.
+    return [
+        query.name
+        for query in HOT_QUERIES
+        if any(detail == f"SCAN {query.table}" or detail.startswith(f"SCAN {query.table} ") for detail in explain(conn, query))
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print EXPLAIN QUERY PLAN for known hot queries")
+    parser.add_argument("--db-path", default="data/tatemono_map.sqlite3")
+    args = parser.parse_args()
+
+    conn = connect(args.db_path)
+    try:
+        for query in HOT_QUERIES:
+            print(f"[{query.name}]")
+            for detail in explain(conn, query):
+                print(f"  {detail}")
+        scans = full_scans(conn)
+    finally:
+        conn.close()
+    print(f"full_scans={len(scans)}")
+    if scans:
+        raise SystemExit(f"full table scans in hot queries: {', '.join(scans)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,13 @@ from pathlib import Path
 from typing import Iterator
 
 from tatemono_map.db.keys import make_building_key, make_listing_key_for_smartlink
-from tatemono_map.db.schema import ensure_schema, normalize_db_path
+from tatemono_map.db.schema import (
+    SCHEMA_FINGERPRINT,
+    SchemaMismatchError,
+    ensure_schema,
+    normalize_db_path,
+    schema_version,
+)
 
 
 @dataclass
@@ -27,10 +33,88 @@ class ListingRecord:
     management_phone: str | None = None
 
 
-def connect(db_path: str | Path) -> sqlite3.Connection:
-    path = ensure_schema(db_path)
+# Per-connection settings; journal_mode=WAL is persistent and set once per DB file.
+CONNECTION_PRAGMAS: tuple[tuple[str, str], ...] = (
+    ("synchronous", "NORMAL"),
+    ("cache_size", "-65536"),
+    ("mmap_size", str(256 * 1024 * 1024)),
+    ("busy_timeout", "5000"),
+    ("temp_store", "MEMORY"),
+)
+
+# path -> (st_ino, user_version) of files already migrated and switched to WAL. Ordinary writes change neither,
+# so the check survives them; a replaced file has a new inode or, if the inode is reused, its own user_version.
+_checked_schemas: dict[Path, tuple[int | None, int]] = {}
+
+
+def _file_inode(path: Path) -> int | None:
+    try:
+        return path.stat().st_ino
+    except FileNotFoundError:
+        return None
+
+
+def _open(path: Path, read_only: bool) -> sqlite3.Connection:
+    if read_only:
+        # No journal_mode switch here: WAL would leave -wal/-shm files behind and rewrite a tracked DB's header.
+        return sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(path)
+
+
+def _migrate(path: Path, version: int | None, *, read_only: bool) -> None:
+    try:
+        ensure_schema(path)
+    except sqlite3.OperationalError as exc:
+        if not read_only:
+            raise
+        raise SchemaMismatchError(
+            f"{path} is at schema version {version}, expected {SCHEMA_FINGERPRINT}; "
+            "run migrations (tatemono_map.db.schema.ensure_schema) on a writable copy before opening it read-only"
+        ) from exc
+
+
+def _enable_wal(path: Path) -> None:
     conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
+def _open_current(path: Path, read_only: bool) -> sqlite3.Connection:
+    # The schema version is read on the connection being handed out; a stale DB is migrated once on a writable
+    # connection (read-only callers included, as before) and then reopened.
+    try:
+        conn = _open(path, read_only)
+        version = schema_version(conn)
+    except sqlite3.OperationalError:
+        if not read_only or path.exists():
+            raise
+        conn, version = None, None
+    identity = (_file_inode(path), version)
+    if version == SCHEMA_FINGERPRINT and (read_only or _checked_schemas.get(path) == identity):
+        return conn
+    if conn is not None:
+        conn.close()
+    if version != SCHEMA_FINGERPRINT:
+        _migrate(path, version, read_only=read_only)
+    if not read_only:
+        _enable_wal(path)
+        _checked_schemas[path] = (_file_inode(path), SCHEMA_FINGERPRINT)
+    return _open(path, read_only)
+
+
+def forget_schema_check(db_path: str | Path) -> None:
+    _checked_schemas.pop(normalize_db_path(db_path), None)
+
+
+def connect(db_path: str | Path, *, read_only: bool = False) -> sqlite3.Connection:
+    path = normalize_db_path(db_path)
+    conn = _open_current(path, read_only)
     conn.row_factory = sqlite3.Row
+    for name, value in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value}")
     return conn
 
 
@@ -140,73 +224,110 @@ def upsert_listing(conn: sqlite3.Connection, record: ListingRecord) -> None:
     conn.commit()
 
 
-def replace_building_summary(conn: sqlite3.Connection, row: dict) -> None:
-    conn.execute(
-        """
-        INSERT INTO building_summaries(
-            building_key, name, raw_name, address,
-            rent_yen_min, rent_yen_max, sale_price_yen_min, sale_price_yen_max, sale_price_yen_avg,
-            area_sqm_min, area_sqm_max, sale_area_sqm_min, sale_area_sqm_max,
-            layout_types_json, sale_layout_types_json, property_kind, move_in_dates_json, age_years, structure,
-            building_built_year_month, building_built_age_years, building_structure, building_availability_label,
-            vacancy_count, sale_listing_count, last_updated, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+BUILDING_SUMMARY_COLUMNS = (
+    "building_key",
+    "name",
+    "raw_name",
+    "address",
+    "rent_yen_min",
+    "rent_yen_max",
+    "sale_price_yen_min",
+    "sale_price_yen_max",
+    "sale_price_yen_avg",
+    "area_sqm_min",
+    "area_sqm_max",
+    "sale_area_sqm_min",
+    "sale_area_sqm_max",
+    "layout_types_json",
+    "sale_layout_types_json",
+    "property_kind",
+    "move_in_dates_json",
+    "age_years",
+    "structure",
+    "building_built_year_month",
+    "building_built_age_years",
+    "building_structure",
+    "building_availability_label",
+    "vacancy_count",
+    "sale_listing_count",
+    "last_updated",
+    "updated_at",
+)
+DEFAULT_SUMMARY_CHUNK_SIZE = 500
+
+
+def _building_summary_upsert_sql() -> str:
+    columns = ", ".join(BUILDING_SUMMARY_COLUMNS)
+    placeholders = ", ".join("?" for _ in BUILDING_SUMMARY_COLUMNS)
+    updates = ",\n            ".join(f"{column}=excluded.{column}" for column in BUILDING_SUMMARY_COLUMNS[1:])
+    return f"""
+        INSERT INTO building_summaries({columns})
+        VALUES ({placeholders})
         ON CONFLICT(building_key) DO UPDATE SET
-            name=excluded.name,
-            raw_name=excluded.raw_name,
-            address=excluded.address,
-            rent_yen_min=excluded.rent_yen_min,
-            rent_yen_max=excluded.rent_yen_max,
-            sale_price_yen_min=excluded.sale_price_yen_min,
-            sale_price_yen_max=excluded.sale_price_yen_max,
-            sale_price_yen_avg=excluded.sale_price_yen_avg,
-            area_sqm_min=excluded.area_sqm_min,
-            area_sqm_max=excluded.area_sqm_max,
-            sale_area_sqm_min=excluded.sale_area_sqm_min,
-            sale_area_sqm_max=excluded.sale_area_sqm_max,
-            layout_types_json=excluded.layout_types_json,
-            sale_layout_types_json=excluded.sale_layout_types_json,
-            property_kind=excluded.property_kind,
-            move_in_dates_json=excluded.move_in_dates_json,
-            age_years=excluded.age_years,
-            structure=excluded.structure,
-            building_built_year_month=excluded.building_built_year_month,
-            building_built_age_years=excluded.building_built_age_years,
-            building_structure=excluded.building_structure,
-            building_availability_label=excluded.building_availability_label,
-            vacancy_count=excluded.vacancy_count,
-            sale_listing_count=excluded.sale_listing_count,
-            last_updated=excluded.last_updated,
-            updated_at=excluded.updated_at
-        """,
-        (
-            row["building_key"],
-            row.get("name"),
-            row.get("raw_name"),
-            row.get("address"),
-            row.get("rent_yen_min"),
-            row.get("rent_yen_max"),
-            row.get("sale_price_yen_min"),
-            row.get("sale_price_yen_max"),
-            row.get("sale_price_yen_avg"),
-            row.get("area_sqm_min"),
-            row.get("area_sqm_max"),
-            row.get("sale_area_sqm_min"),
-            row.get("sale_area_sqm_max"),
-            json.dumps(row.get("layout_types") or [], ensure_ascii=False),
-            row.get("sale_layout_types_json"),
-            row.get("property_kind") or "",
-            (json.dumps(row.get("move_in_dates"), ensure_ascii=False) if row.get("move_in_dates") else None),
-            row.get("age_years"),
-            row.get("structure"),
-            row.get("building_built_year_month"),
-            row.get("building_built_age_years"),
-            row.get("building_structure"),
-            row.get("building_availability_label"),
-            row.get("vacancy_count"),
-            row.get("sale_listing_count"),
-            row.get("last_updated"),
-            row.get("last_updated"),
-        ),
+            {updates}
+        """
+
+
+def building_summary_params(row: dict) -> tuple:
+    return (
+        row["building_key"],
+        row.get("name"),
+        row.get("raw_name"),
+        row.get("address"),
+        row.get("rent_yen_min"),
+        row.get("rent_yen_max"),
+        row.get("sale_price_yen_min"),
+        row.get("sale_price_yen_max"),
+        row.get("sale_price_yen_avg"),
+        row.get("area_sqm_min"),
+        row.get("area_sqm_max"),
+        row.get("sale_area_sqm_min"),
+        row.get("sale_area_sqm_max"),
+        json.dumps(row.get("layout_types") or [], ensure_ascii=False),
+        row.get("sale_layout_types_json"),
+        row.get("property_kind") or "",
+        (json.dumps(row.get("move_in_dates"), ensure_ascii=False) if row.get("move_in_dates") else None),
+        row.get("age_years"),
+        row.get("structure"),
+        row.get("building_built_year_month"),
+        row.get("building_built_age_years"),
+        row.get("building_structure"),
+        row.get("building_availability_label"),
+        row.get("vacancy_count"),
+        row.get("sale_listing_count"),
+        row.get("last_updated"),
+        row.get("last_updated"),
     )
+
+
+def replace_building_summary(conn: sqlite3.Connection, row: dict) -> None:
+    conn.execute(_building_summary_upsert_sql(), building_summary_params(row))
     conn.commit()
+
+
+class BuildingSummaryWriter:
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        chunk_size: int = DEFAULT_SUMMARY_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive: {chunk_size}")
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.written = 0
+        self._sql = _building_summary_upsert_sql()
+        self._pending: list[tuple] = []
+
+    def add(self, row: dict) -> None:
+        self._pending.append(building_summary_params(row))
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self.conn.executemany(self._sql, self._pending)
+        self.written += len(self._pending)
+        self._pending = []
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import re
 import sqlite3
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -326,8 +329,162 @@ TABLE_SCHEMAS: tuple[TableSchema, ...] = (
             "updated_at",
         ),
     ),
+    TableSchema(
+        name="building_summary_changes",
+        ddl="""
+        CREATE TABLE IF NOT EXISTS building_summary_changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            building_key TEXT,
+            changed_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        columns=("id", "building_key", "changed_at"),
+    ),
+)
+
+@dataclass(frozen=True)
+class IndexSchema:
+    name: str
+    table: str
+    columns: tuple[str, ...]
+
+    @property
+    def ddl(self) -> str:
+        return f"CREATE INDEX IF NOT EXISTS {self.name} ON {self.table}({', '.join(self.columns)})"
+
+
+# Secondary indexes for the hot predicates listed in db.query_plans.HOT_QUERIES.
+# The trailing columns make the listings indexes covering for key/snapshot lookups.
+INDEX_SCHEMAS: tuple[IndexSchema, ...] = (
+    IndexSchema("idx_listings_ingest_run_id", "listings", ("ingest_run_id", "building_key")),
+    IndexSchema("idx_listings_building_key", "listings", ("building_key", "ingest_run_id")),
+    IndexSchema("idx_buildings_norm_name", "buildings", ("norm_name",)),
+    IndexSchema("idx_buildings_norm_address", "buildings", ("norm_address",)),
+    IndexSchema("idx_buildings_canonical_name", "buildings", ("canonical_name",)),
+    IndexSchema("idx_buildings_canonical_address", "buildings", ("canonical_address",)),
+    IndexSchema("idx_building_sources_building_id", "building_sources", ("building_id",)),
+    IndexSchema("idx_building_key_aliases_canonical_key", "building_key_aliases", ("canonical_key",)),
+)
+
+# Columns read by normalize.building_summaries; only these mark a building_key dirty on UPDATE.
+SUMMARY_BUILDING_COLUMNS: tuple[str, ...] = (
+    "building_id",
+    "canonical_name",
+    "canonical_address",
+    "structure",
+    "age_years",
+    "built_year",
+    "built_year_month",
+    "availability_label",
+    "property_kind",
+    "sale_price_yen_min",
+    "sale_price_yen_max",
+    "sale_price_yen_avg",
+    "sale_area_sqm_min",
+    "sale_area_sqm_max",
+    "sale_layout_types_json",
+    "sale_listing_count",
+    "avg_rent_yen",
+)
+
+SUMMARY_LISTING_COLUMNS: tuple[str, ...] = (
+    "building_key",
+    "name",
+    "address",
+    "rent_yen",
+    "area_sqm",
+    "layout",
+    "move_in_date",
+    "updated_at",
+    "age_years",
+    "structure",
+    "availability_raw",
+    "structure_raw",
+    "built_year_month",
+    "built_age_years",
+    "availability_date",
+    "availability_flag_immediate",
+    "ingest_run_id",
 )
 
+
+def _changed(columns: tuple[str, ...]) -> str:
+    return " OR ".join(f"OLD.{column} IS NOT NEW.{column}" for column in columns)
+
+
+def _log_keys(*expressions: str) -> str:
+    selects = " UNION ".join(f"SELECT {expression}" for expression in expressions)
+    return f"INSERT INTO building_summary_changes(building_key) {selects};"
+
+
+def _log_snapshot_run(run_expression: str, null_run_condition: str) -> str:
+    return (
+        "INSERT INTO building_summary_changes(building_key) "
+        "SELECT DISTINCT building_key FROM listings "
+        f"WHERE ingest_run_id = {run_expression} "
+        f"OR (ingest_run_id IS NULL AND {null_run_condition});"
+    )
+
+
+# Listings without an ingest run are only visible while no snapshot is current, so
+# the first inserted / last deleted snapshot row also dirties them.
+SUMMARY_CHANGE_TRIGGERS: tuple[str, ...] = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_listings_insert AFTER INSERT ON listings
+    BEGIN {_log_keys("NEW.building_key")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_listings_update AFTER UPDATE ON listings
+    WHEN {_changed(SUMMARY_LISTING_COLUMNS)}
+    BEGIN {_log_keys("OLD.building_key", "NEW.building_key")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_listings_delete AFTER DELETE ON listings
+    BEGIN {_log_keys("OLD.building_key")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_buildings_insert AFTER INSERT ON buildings
+    BEGIN {_log_keys("NEW.building_id")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_buildings_update AFTER UPDATE ON buildings
+    WHEN {_changed(SUMMARY_BUILDING_COLUMNS)}
+    BEGIN {_log_keys("OLD.building_id", "NEW.building_id")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_buildings_delete AFTER DELETE ON buildings
+    BEGIN {_log_keys("OLD.building_id")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_aliases_insert AFTER INSERT ON building_key_aliases
+    BEGIN {_log_keys("NEW.alias_key", "NEW.canonical_key")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_aliases_update AFTER UPDATE ON building_key_aliases
+    WHEN {_changed(("alias_key", "canonical_key"))}
+    BEGIN {_log_keys("OLD.alias_key", "OLD.canonical_key", "NEW.alias_key", "NEW.canonical_key")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_aliases_delete AFTER DELETE ON building_key_aliases
+    BEGIN {_log_keys("OLD.alias_key", "OLD.canonical_key")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_snapshots_insert AFTER INSERT ON current_ingest_snapshots
+    BEGIN {_log_snapshot_run("NEW.ingest_run_id", "(SELECT COUNT(*) FROM current_ingest_snapshots) = 1")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_snapshots_update AFTER UPDATE ON current_ingest_snapshots
+    WHEN OLD.ingest_run_id IS NOT NEW.ingest_run_id
+    BEGIN {_log_snapshot_run("OLD.ingest_run_id", "0")} {_log_snapshot_run("NEW.ingest_run_id", "0")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS building_summary_changes_snapshots_delete AFTER DELETE ON current_ingest_snapshots
+    BEGIN {_log_snapshot_run("OLD.ingest_run_id", "NOT EXISTS (SELECT 1 FROM current_ingest_snapshots)")} END
+    """,
+)
+
+TRIGGER_NAME_RE = re.compile(r"CREATE TRIGGER IF NOT EXISTS (\w+)")
+
 ADDITIVE_MIGRATION_COLUMNS: dict[str, dict[str, str]] = {
     "buildings": {
         "structure": "TEXT",
@@ -416,6 +573,19 @@ ADDITIVE_MIGRATION_COLUMNS: dict[str, dict[str, str]] = {
 
 
 
+def _schema_fingerprint() -> int:
+    parts = [repr((table.name, table.ddl, table.columns)) for table in TABLE_SCHEMAS]
+    parts.append(repr(sorted((table, sorted(columns.items())) for table, columns in ADDITIVE_MIGRATION_COLUMNS.items())))
+    parts.extend(index.ddl for index in INDEX_SCHEMAS)
+    parts.extend(SUMMARY_CHANGE_TRIGGERS)
+    digest = hashlib.sha256("\n".join(parts).encode("utf-8")).digest()
+    # PRAGMA user_version is a signed 32-bit integer and 0 means "never checked".
+    return int.from_bytes(digest[:4], "big") & 0x7FFFFFFF or 1
+
+
+SCHEMA_FINGERPRINT = _schema_fingerprint()
+
+
 class SchemaMismatchError(RuntimeError):
     pass
 
@@ -429,6 +599,7 @@ def ensure_schema(db_path: str | Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     with sqlite3.connect(path) as conn:
         conn.row_factory = sqlite3.Row
+        stale = schema_version(conn) != SCHEMA_FINGERPRINT
         for table in TABLE_SCHEMAS:
             conn.execute(table.ddl)
             info_rows = conn.execute(f"PRAGMA table_info({table.name})").fetchall()
@@ -456,9 +627,33 @@ def ensure_schema(db_path: str | Path) -> Path:
                 raise SchemaMismatchError(
                     f"Schema mismatch on {table.name}. missing_required={missing} actual={columns}"
                 )
+        for trigger_ddl in SUMMARY_CHANGE_TRIGGERS:
+            if stale:
+                # IF NOT EXISTS would keep an older body under the same name.
+                conn.execute(f"DROP TRIGGER IF EXISTS {TRIGGER_NAME_RE.search(trigger_ddl).group(1)}")
+            conn.execute(trigger_ddl)
+        created = ensure_indexes(conn)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_FINGERPRINT}")
+    if created:
+        print(f"ensure_schema: created_indexes={','.join(created)} db={path}", file=sys.stderr)
     return path
 
 
+def ensure_indexes(conn: sqlite3.Connection) -> list[str]:
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall()}
+    created: list[str] = []
+    for index in INDEX_SCHEMAS:
+        if index.name in existing:
+            continue
+        conn.execute(index.ddl)
+        created.append(index.name)
+    return created
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
 def list_tables(conn: sqlite3.Connection) -> list[str]:
     rows = conn.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
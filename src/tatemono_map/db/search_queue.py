@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sqlite3
+
+from tatemono_map.normalize.jp import normalize_address_jp, normalize_building_name
+
+SEARCH_DOCS_TABLE = "building_search_docs"
+SEARCH_PENDING_TABLE = "building_search_pending"
+SUMMARY_KIND = "summary"
+BUILDING_KIND = "building"
+
+# kind -> (source table, key column, name column, address column)
+SEARCH_SOURCES = {
+    SUMMARY_KIND: ("building_summaries", "building_key", "name", "address"),
+    BUILDING_KIND: ("buildings", "id", "name", "address"),
+}
+# Bind the TEXT ref back to the key's own type so the primary key index is used.
+_REF_PARAMS = {SUMMARY_KIND: "?", BUILDING_KIND: "CAST(? AS INTEGER)"}
+
+
+def search_doc(kind: str, ref: str, name: str | None, address: str | None) -> tuple[str, str, str, str]:
+    return kind, ref, normalize_building_name(name or ""), normalize_address_jp(address or "")
+
+
+def drain_search_queue(conn: sqlite3.Connection) -> int:
+    # Triggers only queue keys (normalization is Python); writers fold the queue into the docs table they already lock.
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (SEARCH_PENDING_TABLE,)
+    ).fetchone()
+    if exists is None:
+        return 0
+    pending = conn.execute(f"DELETE FROM {SEARCH_PENDING_TABLE} RETURNING kind, ref").fetchall()
+    for kind, ref in pending:
+        conn.execute(f"DELETE FROM {SEARCH_DOCS_TABLE} WHERE kind = ? AND ref = ?", (kind, ref))
+        table, key, name, address = SEARCH_SOURCES[kind]
+        row = conn.execute(f"SELECT {name}, {address} FROM {table} WHERE {key} = {_REF_PARAMS[kind]}", (ref,)).fetchone()
+        if row is not None:
+            conn.execute(
+                f"INSERT INTO {SEARCH_DOCS_TABLE}(kind, ref, name, address) VALUES (?, ?, ?, ?)",
+                search_doc(kind, ref, row[0], row[1]),
+            )
+    return len(pending)
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from tatemono_map.db.keys import make_building_key, make_listing_key_for_master
 from tatemono_map.db.repo import connect
-from tatemono_map.normalize.building_summaries import rebuild
+from tatemono_map.normalize.building_summaries import refresh
 
 CANONICAL_COLUMNS = (
     "building_name",
@@ -120,5 +120,5 @@ def import_ulucks_pdf_csv(
 
     conn.commit()
     conn.close()
-    rebuild(db_path)
+    refresh(db_path)
     return imported
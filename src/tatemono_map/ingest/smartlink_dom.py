@@ -18,7 +18,7 @@ from selectolax.parser import HTMLParser
 from tatemono_map.db.keys import make_building_key, make_listing_key_for_smartlink
 from tatemono_map.db.repo import ListingRecord, connect
 from tatemono_map.ingest.ulucks_playwright import _extract_pagination_hrefs
-from tatemono_map.normalize.building_summaries import rebuild
+from tatemono_map.normalize.building_summaries import refresh
 from tatemono_map.util.area import parse_area_sqm
 from tatemono_map.util.money import parse_rent_yen
 from tatemono_map.util.text import normalize_text
@@ -470,7 +470,7 @@ def persist_records(db_path: str, records: list[ListingRecord]) -> tuple[int, in
     if not records:
         raise RuntimeError("smartlink_dom ingest produced 0 records")
     upserted = _bulk_upsert(db_path=db_path, records=records)
-    summary_count = rebuild(db_path)
+    summary_count = refresh(db_path)
     return upserted, summary_count
 
 
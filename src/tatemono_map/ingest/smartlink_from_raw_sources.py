@@ -10,7 +10,7 @@ from selectolax.parser import HTMLParser
 
 from tatemono_map.db.keys import make_building_key, make_listing_key_for_smartlink
 from tatemono_map.db.repo import ListingRecord, connect, iter_raw_sources
-from tatemono_map.normalize.building_summaries import rebuild
+from tatemono_map.normalize.building_summaries import refresh
 from tatemono_map.util.area import parse_area_sqm
 from tatemono_map.util.money import parse_rent_yen
 from tatemono_map.util.text import normalize_text
@@ -252,7 +252,7 @@ def ingest(db_path: str) -> tuple[int, int]:
     upserted = _bulk_upsert(conn, all_records)
     conn.close()
 
-    summary_count = rebuild(db_path)
+    summary_count = refresh(db_path)
     return upserted, summary_count
 
 
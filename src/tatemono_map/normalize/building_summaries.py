@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import json
 from collections import Counter
+from dataclasses import dataclass
 from datetime import date
 
-from tatemono_map.db.repo import connect, replace_building_summary
+from tatemono_map.db.repo import (
+    BUILDING_SUMMARY_COLUMNS,
+    DEFAULT_SUMMARY_CHUNK_SIZE,
+    BuildingSummaryWriter,
+    building_summary_params,
+    connect,
+)
+from tatemono_map.db.search_queue import drain_search_queue
 from tatemono_map.util.building_age import age_years_from_built_year_month
 from tatemono_map.util.text import normalize_text
 
@@ -90,154 +99,396 @@ def refresh_building_availability_labels(conn) -> None:
     return None
 
 
-def rebuild(db_path: str) -> int:
-    conn = connect(db_path)
-    conn.execute("DELETE FROM building_summaries")
-
-    building_rows = conn.execute(
-        """
-        SELECT building_id, canonical_name, canonical_address,
-               structure, age_years, built_year, built_year_month, availability_raw, availability_label,
-               property_kind, sale_price_yen_min, sale_price_yen_max, sale_price_yen_avg,
-               sale_area_sqm_min, sale_area_sqm_max, sale_layout_types_json, sale_listing_count,
-               avg_rent_yen, rental_listing_count
-        FROM buildings
-        """
-    ).fetchall()
-
-    alias_rows = conn.execute("SELECT alias_key, canonical_key FROM building_key_aliases").fetchall()
-    alias_map = {row["alias_key"]: row["canonical_key"] for row in alias_rows}
-
-    rows = conn.execute(
-        """
-        SELECT building_key, name, address, rent_yen, area_sqm, layout, move_in_date, updated_at,
-               age_years, structure, availability_raw, built_raw, structure_raw,
-               built_year_month, built_age_years, availability_date, availability_flag_immediate
-        FROM listings
-        WHERE (
-            ingest_run_id IN (SELECT ingest_run_id FROM current_ingest_snapshots)
-            OR (
-                ingest_run_id IS NULL
-                AND NOT EXISTS (SELECT 1 FROM current_ingest_snapshots)
-            )
+@dataclass(frozen=True)
+class _ListingAggregate:
+    vacancy_count: int
+    rent_yen_min: int | None
+    rent_yen_max: int | None
+    area_sqm_min: float | None
+    area_sqm_max: float | None
+    layouts: list[str]
+    move_in_dates: list[str]
+    last_updated: str | None
+    name: str | None
+    address: str | None
+
+
+def _aggregate_rows(items: list) -> _ListingAggregate | None:
+    if not items:
+        return None
+    rents = [r["rent_yen"] for r in items if r["rent_yen"] is not None]
+    areas = [r["area_sqm"] for r in items if r["area_sqm"] is not None]
+    return _ListingAggregate(
+        vacancy_count=len(items),
+        rent_yen_min=min(rents) if rents else None,
+        rent_yen_max=max(rents) if rents else None,
+        area_sqm_min=min(areas) if areas else None,
+        area_sqm_max=max(areas) if areas else None,
+        layouts=sorted({normalize_text(r["layout"]) for r in items if r["layout"]}),
+        move_in_dates=sorted({normalize_text(r["move_in_date"]) for r in items if r["move_in_date"]}),
+        last_updated=max((r["updated_at"] for r in items if r["updated_at"]), default=None),
+        name=items[0]["name"],
+        address=items[0]["address"],
+    )
+
+
+def _aggregate_from_sql(row) -> _ListingAggregate:
+    return _ListingAggregate(
+        vacancy_count=row["vacancy_count"],
+        rent_yen_min=row["rent_yen_min"],
+        rent_yen_max=row["rent_yen_max"],
+        area_sqm_min=row["area_sqm_min"],
+        area_sqm_max=row["area_sqm_max"],
+        layouts=sorted({normalize_text(v) for v in json.loads(row["layouts_json"]) if v}),
+        move_in_dates=sorted({normalize_text(v) for v in json.loads(row["move_in_dates_json"]) if v}),
+        last_updated=row["last_updated"],
+        name=row["latest_name"],
+        address=row["latest_address"],
+    )
+
+
+def _build_summary(building_key: str, items: list, building) -> dict:
+    return _summarize(building_key, _aggregate_rows(items), items, building)
+
+
+def _summarize(building_key: str, aggregate: _ListingAggregate | None, items: list, building) -> dict:
+    age_values = [int(r["age_years"]) for r in items if r["age_years"] is not None]
+    structure_values = [r["structure"] for r in items if r["structure"]]
+    built_year_month_values = [r["built_year_month"] for r in items if r["built_year_month"]]
+    built_age_values = [int(r["built_age_years"]) for r in items if r["built_age_years"] is not None]
+    building_structure_values = [r["structure_raw"] for r in items if r["structure_raw"]]
+    move_in_dates = aggregate.move_in_dates if aggregate else []
+    summary_name = building["canonical_name"] if building else (aggregate.name if aggregate else None)
+    summary_address = building["canonical_address"] if building else (aggregate.address if aggregate else None)
+    summary_raw_name = summary_name
+
+    listing_age = _pick_age_years(age_values)
+    listing_structure = _pick_structure(structure_values)
+    listing_built_year_month = _pick_built_year_month(built_year_month_values)
+    listing_built_age = _pick_age_years(built_age_values)
+    listing_building_structure = _pick_structure(building_structure_values) or listing_structure
+
+    fallback_age = building["age_years"] if building else None
+    fallback_structure = normalize_text(building["structure"]) if building else None
+    fallback_built_year_month = (
+        normalize_text(building["built_year_month"]) if building and building["built_year_month"] else None
+    ) or (f"{building['built_year']}-01" if building and building["built_year"] else None)
+    listing_derived_age_from_built = age_years_from_built_year_month(listing_built_year_month)
+    derived_age_from_built = age_years_from_built_year_month(fallback_built_year_month)
+    resolved_built_age_years = (
+        listing_derived_age_from_built
+        if listing_derived_age_from_built is not None
+        else (listing_built_age if listing_built_age is not None else (derived_age_from_built if derived_age_from_built is not None else fallback_age))
+    )
+    fallback_availability_label = (normalize_text(building["availability_label"]) if building else "") or None
+    fallback_property_kind = normalize_text(building["property_kind"]) if building and building["property_kind"] else ""
+
+    sale_price_min = building["sale_price_yen_min"] if building else None
+    sale_price_max = building["sale_price_yen_max"] if building else None
+    sale_price_avg = building["sale_price_yen_avg"] if building else None
+    sale_area_min = building["sale_area_sqm_min"] if building else None
+    sale_area_max = building["sale_area_sqm_max"] if building else None
+    sale_layout_types_json = building["sale_layout_types_json"] if building else None
+    sale_listing_count = building["sale_listing_count"] if building else None
+
+    availability_label = (_select_availability_label(move_in_dates, items) if items else None) or fallback_availability_label
+    vacancy_count = aggregate.vacancy_count if aggregate else 0
+    if fallback_property_kind == "bunjo" or vacancy_count <= 0:
+        availability_label = None
+    fallback_rent = None if fallback_property_kind == "bunjo" else (building["avg_rent_yen"] if building else None)
+
+    return {
+        "building_key": building_key,
+        "name": summary_name,
+        "raw_name": summary_raw_name,
+        "address": summary_address,
+        "property_kind": fallback_property_kind,
+        "rent_yen_min": aggregate.rent_yen_min if aggregate and aggregate.rent_yen_min is not None else fallback_rent,
+        "rent_yen_max": aggregate.rent_yen_max if aggregate and aggregate.rent_yen_max is not None else fallback_rent,
+        "sale_price_yen_min": sale_price_min,
+        "sale_price_yen_max": sale_price_max,
+        "sale_price_yen_avg": sale_price_avg,
+        "area_sqm_min": aggregate.area_sqm_min if aggregate else None,
+        "area_sqm_max": aggregate.area_sqm_max if aggregate else None,
+        "sale_area_sqm_min": sale_area_min,
+        "sale_area_sqm_max": sale_area_max,
+        "layout_types": aggregate.layouts if aggregate else [],
+        "sale_layout_types_json": sale_layout_types_json,
+        "move_in_dates": move_in_dates,
+        "age_years": resolved_built_age_years if resolved_built_age_years is not None else listing_age,
+        "structure": listing_structure or fallback_structure,
+        "building_built_year_month": listing_built_year_month or fallback_built_year_month,
+        "building_built_age_years": resolved_built_age_years,
+        "building_structure": listing_building_structure or fallback_structure,
+        "building_availability_label": availability_label,
+        "vacancy_count": vacancy_count,
+        "sale_listing_count": sale_listing_count,
+        "last_updated": aggregate.last_updated if aggregate else None,
+    }
+
+
+_BUILDING_SELECT = """
+    SELECT building_id, canonical_name, canonical_address,
+           structure, age_years, built_year, built_year_month, availability_raw, availability_label,
+           property_kind, sale_price_yen_min, sale_price_yen_max, sale_price_yen_avg,
+           sale_area_sqm_min, sale_area_sqm_max, sale_layout_types_json, sale_listing_count,
+           avg_rent_yen, rental_listing_count
+    FROM buildings
+"""
+
+_CURRENT_LISTINGS = """
+    SELECT l.*, COALESCE(a.canonical_key, l.building_key) AS canonical_key
+    FROM listings AS l
+    LEFT JOIN building_key_aliases AS a ON a.alias_key = l.building_key
+    WHERE l.building_key IS NOT NULL AND l.building_key != ''
+      AND (
+        l.ingest_run_id IN (SELECT ingest_run_id FROM current_ingest_snapshots)
+        OR (
+            l.ingest_run_id IS NULL
+            AND NOT EXISTS (SELECT 1 FROM current_ingest_snapshots)
+        )
+      )
+"""
+
+_AGGREGATE_SQL = """
+    WITH current AS ({current})
+    SELECT g.*, l.name AS latest_name, l.address AS latest_address
+    FROM (
+        SELECT canonical_key,
+               COUNT(*) AS vacancy_count,
+               MIN(rent_yen) AS rent_yen_min,
+               MAX(rent_yen) AS rent_yen_max,
+               MIN(area_sqm) AS area_sqm_min,
+               MAX(area_sqm) AS area_sqm_max,
+               json_group_array(DISTINCT layout) AS layouts_json,
+               json_group_array(DISTINCT move_in_date) AS move_in_dates_json,
+               MAX(NULLIF(updated_at, '')) AS last_updated,
+               MAX(id) AS latest_id
+        FROM current
+        GROUP BY canonical_key
+    ) AS g
+    JOIN listings AS l ON l.id = g.latest_id
+"""
+
+# Only the columns behind mode/median picks and the availability label, newest first.
+_PICK_SQL = """
+    WITH current AS ({current})
+    SELECT canonical_key, age_years, structure, built_year_month, built_age_years, structure_raw,
+           availability_raw, availability_date, availability_flag_immediate
+    FROM current
+    ORDER BY id DESC
+"""
+
+_REFRESH_KEYS_TABLE = "building_summary_refresh_keys"
+
+_LISTING_SELECT = """
+    SELECT id, building_key, name, address, rent_yen, area_sqm, layout, move_in_date, updated_at,
+           age_years, structure, availability_raw, built_raw, structure_raw,
+           built_year_month, built_age_years, availability_date, availability_flag_immediate
+    FROM listings
+    WHERE (
+        ingest_run_id IN (SELECT ingest_run_id FROM current_ingest_snapshots)
+        OR (
+            ingest_run_id IS NULL
+            AND NOT EXISTS (SELECT 1 FROM current_ingest_snapshots)
         )
-        ORDER BY id DESC
-        """
-    ).fetchall()
+    )
+    ORDER BY id DESC
+"""
+
+# Stays well below SQLITE_MAX_VARIABLE_NUMBER on older builds (999).
+_KEY_BATCH_SIZE = 500
+
+
+def _latest_change_id(conn) -> int:
+    return conn.execute("SELECT COALESCE(MAX(id), 0) AS id FROM building_summary_changes").fetchone()["id"]
+
+
+def _select_in(conn, sql: str, column: str, keys) -> list:
+    ordered = sorted(keys)
+    rows: list = []
+    for offset in range(0, len(ordered), _KEY_BATCH_SIZE):
+        batch = ordered[offset : offset + _KEY_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        rows.extend(conn.execute(f"{sql} {column} IN ({placeholders})", batch).fetchall())
+    return rows
+
+
+def _listing_aggregates(conn, scope: str = "") -> tuple[dict[str, _ListingAggregate], dict[str, list]]:
+    current = _CURRENT_LISTINGS + scope
+    aggregates = {
+        row["canonical_key"]: _aggregate_from_sql(row)
+        for row in conn.execute(_AGGREGATE_SQL.format(current=current)).fetchall()
+    }
+    picks: dict[str, list] = {}
+    for row in conn.execute(_PICK_SQL.format(current=current)).fetchall():
+        picks.setdefault(row["canonical_key"], []).append(row)
+    return aggregates, picks
+
+
+def _reference_summaries(conn) -> dict[str, dict]:
+    building_rows = conn.execute(_BUILDING_SELECT).fetchall()
+    alias_map = {row["alias_key"]: row["canonical_key"] for row in conn.execute("SELECT alias_key, canonical_key FROM building_key_aliases")}
     grouped: dict[str, list] = {}
-    for row in rows:
+    for row in conn.execute(_LISTING_SELECT).fetchall():
         if not row["building_key"]:
             continue
         canonical_key = alias_map.get(row["building_key"], row["building_key"])
         grouped.setdefault(canonical_key, []).append(row)
 
     canonical_by_id = {row["building_id"]: row for row in building_rows}
-    target_keys = set(canonical_by_id.keys()) | set(grouped.keys())
-
-    for building_key in sorted(target_keys):
-        items = grouped.get(building_key, [])
-        building = canonical_by_id.get(building_key)
-        rents = [r["rent_yen"] for r in items if r["rent_yen"] is not None]
-        areas = [r["area_sqm"] for r in items if r["area_sqm"] is not None]
-        layouts = sorted({normalize_text(r["layout"]) for r in items if r["layout"]})
-        move_in_dates = sorted({normalize_text(r["move_in_date"]) for r in items if r["move_in_date"]})
-        age_values = [int(r["age_years"]) for r in items if r["age_years"] is not None]
-        structure_values = [r["structure"] for r in items if r["structure"]]
-        built_year_month_values = [r["built_year_month"] for r in items if r["built_year_month"]]
-        built_age_values = [int(r["built_age_years"]) for r in items if r["built_age_years"] is not None]
-        building_structure_values = [r["structure_raw"] for r in items if r["structure_raw"]]
-        latest = max((r["updated_at"] for r in items if r["updated_at"]), default=None)
-        summary_name = building["canonical_name"] if building else (items[0]["name"] if items else None)
-        summary_address = building["canonical_address"] if building else (items[0]["address"] if items else None)
-        summary_raw_name = summary_name
-
-        listing_age = _pick_age_years(age_values)
-        listing_structure = _pick_structure(structure_values)
-        listing_built_year_month = _pick_built_year_month(built_year_month_values)
-        listing_built_age = _pick_age_years(built_age_values)
-        listing_building_structure = _pick_structure(building_structure_values) or listing_structure
-
-        fallback_age = building["age_years"] if building else None
-        fallback_structure = normalize_text(building["structure"]) if building else None
-        fallback_built_year_month = (
-            normalize_text(building["built_year_month"]) if building and building["built_year_month"] else None
-        ) or (f"{building['built_year']}-01" if building and building["built_year"] else None)
-        listing_derived_age_from_built = age_years_from_built_year_month(listing_built_year_month)
-        derived_age_from_built = age_years_from_built_year_month(fallback_built_year_month)
-        resolved_built_age_years = (
-            listing_derived_age_from_built
-            if listing_derived_age_from_built is not None
-            else (listing_built_age if listing_built_age is not None else (derived_age_from_built if derived_age_from_built is not None else fallback_age))
-        )
-        fallback_availability_label = (normalize_text(building["availability_label"]) if building else "") or None
-        fallback_property_kind = normalize_text(building["property_kind"]) if building and building["property_kind"] else ""
-
-        sale_price_min = building["sale_price_yen_min"] if building else None
-        sale_price_max = building["sale_price_yen_max"] if building else None
-        sale_price_avg = building["sale_price_yen_avg"] if building else None
-        sale_area_min = building["sale_area_sqm_min"] if building else None
-        sale_area_max = building["sale_area_sqm_max"] if building else None
-        sale_layout_types_json = building["sale_layout_types_json"] if building else None
-        sale_listing_count = building["sale_listing_count"] if building else None
-
-        availability_label = (_select_availability_label(move_in_dates, items) if items else None) or fallback_availability_label
-        vacancy_count = len(items)
-        if fallback_property_kind == "bunjo" or vacancy_count <= 0:
-            availability_label = None
-
-        replace_building_summary(
-            conn,
-            {
-                "building_key": building_key,
-                "name": summary_name,
-                "raw_name": summary_raw_name,
-                "address": summary_address,
-                "property_kind": fallback_property_kind,
-                "rent_yen_min": min(rents) if rents else (None if fallback_property_kind == "bunjo" else (building["avg_rent_yen"] if building else None)),
-                "rent_yen_max": max(rents) if rents else (None if fallback_property_kind == "bunjo" else (building["avg_rent_yen"] if building else None)),
-                "sale_price_yen_min": sale_price_min,
-                "sale_price_yen_max": sale_price_max,
-                "sale_price_yen_avg": sale_price_avg,
-                "area_sqm_min": min(areas) if areas else None,
-                "area_sqm_max": max(areas) if areas else None,
-                "sale_area_sqm_min": sale_area_min,
-                "sale_area_sqm_max": sale_area_max,
-                "layout_types": layouts,
-                "sale_layout_types_json": sale_layout_types_json,
-                "move_in_dates": move_in_dates,
-                "age_years": resolved_built_age_years if resolved_built_age_years is not None else listing_age,
-                "structure": listing_structure or fallback_structure,
-                "building_built_year_month": listing_built_year_month or fallback_built_year_month,
-                "building_built_age_years": resolved_built_age_years,
-                "building_structure": listing_building_structure or fallback_structure,
-                "building_availability_label": availability_label,
-                "vacancy_count": vacancy_count,
-                "sale_listing_count": sale_listing_count,
-                "last_updated": latest,
-            },
-        )
+    return {
+        building_key: _build_summary(building_key, grouped.get(building_key, []), canonical_by_id.get(building_key))
+        for building_key in sorted(set(canonical_by_id) | set(grouped))
+    }
+
+
+def rebuild(db_path: str, *, chunk_size: int = DEFAULT_SUMMARY_CHUNK_SIZE) -> int:
+    conn = connect(db_path)
+
+    change_id = _latest_change_id(conn)
+    building_rows = conn.execute(_BUILDING_SELECT).fetchall()
+    alias_count = conn.execute("SELECT COUNT(*) AS c FROM building_key_aliases").fetchone()["c"]
+    aggregates, picks = _listing_aggregates(conn)
+
+    canonical_by_id = {row["building_id"]: row for row in building_rows}
+    target_keys = set(canonical_by_id.keys()) | set(aggregates.keys())
+
+    try:
+        # Rewrite the live table in one transaction: readers keep the old rows until commit, and triggers on
+        # building_summaries (the API's geo index and search queue) see every delete and insert.
+        conn.execute("BEGIN")
+        conn.execute("DELETE FROM building_summaries")
+        writer = BuildingSummaryWriter(conn, chunk_size=chunk_size)
+        for building_key in sorted(target_keys):
+            writer.add(
+                _summarize(building_key, aggregates.get(building_key), picks.get(building_key, []), canonical_by_id.get(building_key))
+            )
+        writer.flush()
+        conn.execute("DELETE FROM building_summary_changes WHERE id <= ?", (change_id,))
+        drain_search_queue(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        conn.close()
+        raise
 
     total = conn.execute("SELECT COUNT(*) AS c FROM building_summaries").fetchone()["c"]
     print(
         "seeded_buildings={} listings={} distinct_canonical_buildings_in_listings={} aliases={} building_summaries_total={}".format(
             len(building_rows),
-            len(rows),
-            len(grouped),
-            len(alias_rows),
+            sum(aggregate.vacancy_count for aggregate in aggregates.values()),
+            len(aggregates),
+            alias_count,
             total,
         )
     )
 
-    conn.commit()
     conn.close()
     return total
 
 
+def refresh(db_path: str, *, chunk_size: int = DEFAULT_SUMMARY_CHUNK_SIZE) -> int:
+    conn = connect(db_path)
+
+    upserted = 0
+    deleted = 0
+    try:
+        conn.execute("BEGIN")
+        change_id = _latest_change_id(conn)
+        changed_keys = {
+            row["building_key"]
+            for row in conn.execute(
+                "SELECT DISTINCT building_key FROM building_summary_changes WHERE id <= ? AND building_key IS NOT NULL",
+                (change_id,),
+            ).fetchall()
+        }
+
+        # A dirty key also dirties the summary it is folded into; listings are then
+        # aggregated for every raw key that canonicalizes onto one of the dirty summaries.
+        alias_sql = "SELECT alias_key, canonical_key FROM building_key_aliases WHERE"
+        changed_aliases = _select_in(conn, alias_sql, "alias_key", changed_keys)
+        target_keys = changed_keys | {row["canonical_key"] for row in changed_aliases}
+        member_aliases = _select_in(conn, alias_sql, "canonical_key", target_keys)
+        raw_keys = target_keys | {row["alias_key"] for row in member_aliases}
+
+        conn.execute(f"CREATE TEMP TABLE {_REFRESH_KEYS_TABLE} (building_key TEXT PRIMARY KEY)")
+        conn.executemany(f"INSERT INTO {_REFRESH_KEYS_TABLE}(building_key) VALUES (?)", [(key,) for key in raw_keys])
+        aggregates, picks = _listing_aggregates(
+            conn, f"AND l.building_key IN (SELECT building_key FROM temp.{_REFRESH_KEYS_TABLE})"
+        )
+        conn.execute(f"DROP TABLE temp.{_REFRESH_KEYS_TABLE}")
+        canonical_by_id = {row["building_id"]: row for row in _select_in(conn, f"{_BUILDING_SELECT} WHERE", "building_id", target_keys)}
+
+        writer = BuildingSummaryWriter(conn, chunk_size=chunk_size)
+        for building_key in sorted(target_keys):
+            aggregate = aggregates.get(building_key)
+            building = canonical_by_id.get(building_key)
+            if building is None and aggregate is None:
+                deleted += conn.execute("DELETE FROM building_summaries WHERE building_key = ?", (building_key,)).rowcount
+                continue
+            writer.add(_summarize(building_key, aggregate, picks.get(building_key, []), building))
+        writer.flush()
+        upserted = writer.written
+        conn.execute("DELETE FROM building_summary_changes WHERE id <= ?", (change_id,))
+        drain_search_queue(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        conn.close()
+        raise
+
+    total = conn.execute("SELECT COUNT(*) AS c FROM building_summaries").fetchone()["c"]
+    print(
+        "changed_keys={} refreshed_keys={} upserted={} deleted={} building_summaries_total={}".format(
+            len(changed_keys),
+            len(target_keys),
+            upserted,
+            deleted,
+            total,
+        )
+    )
+
+    conn.close()
+    return total
+
+
+def verify(db_path: str) -> list[str]:
+    # Recomputes every summary with the row-by-row reference path, independent of the SQL aggregates.
+    conn = connect(db_path)
+    expected = _reference_summaries(conn)
+    columns = ", ".join(BUILDING_SUMMARY_COLUMNS)
+    actual = {row["building_key"]: tuple(row) for row in conn.execute(f"SELECT {columns} FROM building_summaries").fetchall()}
+    conn.close()
+
+    mismatched = [
+        building_key
+        for building_key in sorted(set(expected) | set(actual))
+        if building_key not in expected
+        or actual.get(building_key) != building_summary_params(expected[building_key])
+    ]
+    return mismatched
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--db-path", default="data/tatemono_map.sqlite3")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_SUMMARY_CHUNK_SIZE)
+    parser.add_argument("--mode", choices=("full", "incremental", "verify"), default="full")
     args = parser.parse_args()
-    n = rebuild(args.db_path)
+    if args.mode == "verify":
+        mismatched = verify(args.db_path)
+        print(f"building_summaries_verify mismatched={len(mismatched)}")
+        for building_key in mismatched[:20]:
+            print(f"  {building_key}")
+        if mismatched:
+            raise SystemExit(1)
+        return
+    if args.mode == "incremental":
+        n = refresh(args.db_path, chunk_size=args.chunk_size)
+        print(f"refreshed building_summaries: {n}")
+        return
+    n = rebuild(args.db_path, chunk_size=args.chunk_size)
     print(f"rebuilt building_summaries: {n}")
 
 
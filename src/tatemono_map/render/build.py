@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import filecmp
+import hashlib
+import inspect
 import json
 import os
 import re
 import shutil
+import sqlite3
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -13,8 +24,21 @@ from dotenv import load_dotenv
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from tatemono_map.db.repo import connect
+from tatemono_map.render.columnar import ColumnarWriter
+from tatemono_map.render.search_index import BIGRAM_KIND, SEARCH_INDEX_BUDGET_BYTES, TOKEN_KIND, SearchIndexBuilder
+from tatemono_map.render.shards import TILE_ZOOM, WARD_NAMES_BY_SLUG, tile_bbox, tile_for, ward_slug
 from tatemono_map.util.building_age import age_years_from_built_year_month
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to compact stdlib json
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional; only .gz siblings are written without it
+    brotli = None
+
 FORBIDDEN_PATTERNS = (
     r"mail=",
     r"link_id=",
@@ -24,9 +48,24 @@ FORBIDDEN_PATTERNS = (
     r"号室"
 )
 
+FORBIDDEN_RE = re.compile("|".join(f"(?:{pattern})" for pattern in FORBIDDEN_PATTERNS), re.IGNORECASE)
+FORBIDDEN_BYTES_RE = re.compile(FORBIDDEN_RE.pattern.encode("utf-8"), re.IGNORECASE)
+# Longest forbidden pattern in UTF-8 bytes; streamed writers re-scan this much of the previous chunk.
+FORBIDDEN_TAIL_BYTES = max(len(pattern.encode("utf-8")) for pattern in FORBIDDEN_PATTERNS)
 ROOM_SUFFIX_RE = re.compile(r"(?:\s|　)*(?:\d+|[0-9０-９]+)\s*号室")
 DEFAULT_LINE_UNIVERSAL_URL = "https://lin.ee/Y0NvwKe"
 DEFAULT_LINE_DEEP_LINK = "line://ti/p/@055wdvuq"
+BUILD_MANIFEST_NAME = ".build_manifest.json"
+PAGE_CHUNK_SIZE = 64
+PAGE_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+SCRATCH_FLUSH_ROWS = 1024
+WRITE_CHUNK_BYTES = 1 << 16
+HASHED_DATA_ASSETS = ("buildings.json", "buildings.v2.min.json", "buildings.v2.cols.bin", "search_index.json")
+ASSET_HASH_LENGTH = 12
+PRECOMPRESS_SUFFIXES = (".html", ".json", ".bin")
+PRECOMPRESS_MIN_BYTES = 1024
+
+_worker_templates: dict[str, object] = {}
 
 
 def _format_yen(value: object) -> str:
@@ -43,14 +82,13 @@ def _sanitize_text(value: str) -> str:
     return re.sub(r"\s{2,}", " ", sanitized).strip()
 
 
-def _sanitize_building(building: dict) -> dict:
-    sanitized = dict(building)
-    for key, value in sanitized.items():
+def _sanitize_building(building: MutableMapping) -> MutableMapping:
+    for key, value in building.items():
         if isinstance(value, str):
-            sanitized[key] = _sanitize_text(value)
+            building[key] = _sanitize_text(value)
         elif isinstance(value, list):
-            sanitized[key] = [_sanitize_text(item) if isinstance(item, str) else item for item in value]
-    return sanitized
+            building[key] = [_sanitize_text(item) if isinstance(item, str) else item for item in value]
+    return building
 
 
 def _normalize_json_scalar(value: object) -> object:
@@ -60,22 +98,20 @@ def _normalize_json_scalar(value: object) -> object:
     return value
 
 
-def _stable_sort_payload(payload: list[dict]) -> list[dict]:
-    return sorted(payload, key=lambda row: str(row.get("id") or ""))
-
-
-def _validate_public_dist(output_dir: Path) -> None:
-    for html_path in output_dir.rglob("*.html"):
-        content = html_path.read_text(encoding="utf-8")
-        for pattern in FORBIDDEN_PATTERNS:
-            if re.search(pattern, content, flags=re.IGNORECASE):
-                raise RuntimeError(f"forbidden data detected in dist: {html_path} pattern={pattern}")
+def _check_public_text(path: Path, text: str) -> None:
+    match = FORBIDDEN_RE.search(text)
+    if match:
+        raise RuntimeError(f"forbidden data detected in dist: {path} pattern={match.group(0)}")
 
 
 def _parse_date(value: object) -> datetime | None:
     if value is None:
         return None
-    text = str(value).strip()
+    return _parse_date_text(str(value).strip())
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_text(text: str) -> datetime | None:
     if not text:
         return None
 
@@ -112,14 +148,13 @@ def _build_summary_date(building: dict) -> datetime | None:
     return _parse_date(building.get("last_updated")) or _parse_date(building.get("updated_at"))
 
 
-def _apply_built_age_guard(building: dict) -> dict:
-    guarded = dict(building)
-    derived_age = age_years_from_built_year_month(guarded.get("building_built_year_month"))
+def _apply_built_age_guard(building: MutableMapping) -> MutableMapping:
+    derived_age = age_years_from_built_year_month(building.get("building_built_year_month"))
     if derived_age is None:
-        derived_age = guarded.get("building_built_age_years")
-    guarded["building_built_age_years"] = derived_age
-    guarded["derived_built_age_years"] = derived_age
-    return guarded
+        derived_age = building.get("building_built_age_years")
+    building["building_built_age_years"] = derived_age
+    building["derived_built_age_years"] = derived_age
+    return building
 
 
 def _build_google_maps_url(address: object) -> str | None:
@@ -129,104 +164,202 @@ def _build_google_maps_url(address: object) -> str | None:
     return f"https://maps.google.com/?q={quote_plus(text)}"
 
 
-def _load_buildings(db_path: str) -> tuple[list[dict], int, int, int, int]:
-    conn = connect(db_path)
-    canonical_buildings_count = conn.execute("SELECT COUNT(*) FROM buildings WHERE COALESCE(hidden_from_public, 0) = 0").fetchone()[0]
-    summary_buildings_count = conn.execute(
-        """
-        SELECT COUNT(DISTINCT s.building_key)
-        FROM building_summaries s
-        LEFT JOIN buildings b ON b.building_id = s.building_key
-        WHERE COALESCE(b.hidden_from_public, 0) = 0
-        """
-    ).fetchone()[0]
-    buildings_count = canonical_buildings_count
-    vacancy_total = conn.execute(
-        """
-        SELECT COALESCE(SUM(s.vacancy_count), 0)
-        FROM building_summaries s
-        LEFT JOIN buildings b ON b.building_id = s.building_key
-        WHERE COALESCE(b.hidden_from_public, 0) = 0
-        """
-    ).fetchone()[0]
-    buildings = conn.execute(
-        """
-        SELECT
-            COALESCE(b.building_id, s.building_key) AS building_key,
-            COALESCE(b.canonical_name, s.name, s.raw_name) AS name,
-            COALESCE(b.canonical_name, s.raw_name) AS raw_name,
-            COALESCE(b.canonical_address, s.address) AS address,
-            s.rent_yen_min,
-            s.rent_yen_max,
-            s.sale_price_yen_min,
-            s.sale_price_yen_max,
-            s.sale_price_yen_avg,
-            s.area_sqm_min,
-            s.area_sqm_max,
-            s.sale_area_sqm_min,
-            s.sale_area_sqm_max,
-            s.layout_types_json,
-            s.sale_layout_types_json,
-            s.property_kind,
-            s.move_in_dates_json,
-            s.age_years,
-            s.structure,
-            s.building_built_year_month,
-            s.building_built_age_years,
-            s.building_structure,
-            s.building_availability_label,
-            COALESCE(s.vacancy_count, 0) AS vacancy_count,
-            s.sale_listing_count,
-            s.last_updated,
-            COALESCE(s.updated_at, b.updated_at) AS updated_at
-        FROM building_summaries s
-        LEFT JOIN buildings b ON b.building_id = s.building_key
-        WHERE COALESCE(b.hidden_from_public, 0) = 0
-        UNION ALL
-        SELECT
-            b.building_id AS building_key,
-            b.canonical_name AS name,
-            b.canonical_name AS raw_name,
-            b.canonical_address AS address,
-            NULL AS rent_yen_min,
-            NULL AS rent_yen_max,
-            NULL AS sale_price_yen_min,
-            NULL AS sale_price_yen_max,
-            NULL AS sale_price_yen_avg,
-            NULL AS area_sqm_min,
-            NULL AS area_sqm_max,
-            NULL AS sale_area_sqm_min,
-            NULL AS sale_area_sqm_max,
-            NULL AS layout_types_json,
-            NULL AS sale_layout_types_json,
-            '' AS property_kind,
-            NULL AS move_in_dates_json,
-            NULL AS age_years,
-            NULL AS structure,
-            NULL AS building_built_year_month,
-            NULL AS building_built_age_years,
-            NULL AS building_structure,
-            NULL AS building_availability_label,
-            0 AS vacancy_count,
-            NULL AS sale_listing_count,
-            NULL AS last_updated,
-            b.updated_at AS updated_at
-        FROM buildings b
-        WHERE COALESCE(b.hidden_from_public, 0) = 0
-          AND NOT EXISTS (SELECT 1 FROM building_summaries s WHERE s.building_key = b.building_id)
-        ORDER BY updated_at DESC
-        """
-    ).fetchall()
-
-    building_list = []
-    for row in buildings:
-        building = dict(row)
-        building["layout_types"] = json.loads(building.get("layout_types_json") or "[]")
-        building["move_in_dates"] = json.loads(building.get("move_in_dates_json") or "[]")
+class BuildingRecord(Mapping):
+    # One slot per selected column plus the derived fields; Mapping keeps the dict-style access
+    # (b.get(...), b["building_key"]) that templates and payload builders use.
+    __slots__ = (
+        "building_key",
+        "name",
+        "raw_name",
+        "address",
+        "rent_yen_min",
+        "rent_yen_max",
+        "sale_price_yen_min",
+        "sale_price_yen_max",
+        "sale_price_yen_avg",
+        "area_sqm_min",
+        "area_sqm_max",
+        "sale_area_sqm_min",
+        "sale_area_sqm_max",
+        "sale_layout_types_json",
+        "property_kind",
+        "age_years",
+        "structure",
+        "building_built_year_month",
+        "building_built_age_years",
+        "building_structure",
+        "building_availability_label",
+        "vacancy_count",
+        "sale_listing_count",
+        "last_updated",
+        "updated_at",
+        "google_lat",
+        "google_lng",
+        "layout_types",
+        "move_in_dates",
+        "updated_epoch",
+        "derived_built_age_years",
+    )
+
+    def __init__(self, **values: object) -> None:
+        for key in self.__slots__:
+            setattr(self, key, values.get(key))
+
+    def __getitem__(self, key: str) -> object:
+        # Only the slots are keys; getattr alone would also hand out methods such as record["get"].
+        if key not in _BUILDING_RECORD_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: object) -> None:
+        if key not in _BUILDING_RECORD_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _BUILDING_RECORD_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+
+_BUILDING_RECORD_FIELDS = frozenset(BuildingRecord.__slots__)
+
+
+def _iter_building_records(cursor: sqlite3.Cursor) -> Iterator[BuildingRecord]:
+    columns = [description[0] for description in cursor.description]
+    for row in cursor:
+        values = dict(zip(columns, row))
+        building = BuildingRecord(
+            **values,
+            layout_types=json.loads(values.get("layout_types_json") or "[]"),
+            move_in_dates=json.loads(values.get("move_in_dates_json") or "[]"),
+        )
         summary_date = _build_summary_date(building)
-        building["updated_epoch"] = int(summary_date.timestamp()) if summary_date else -1
-        building_list.append(_sanitize_building(_apply_built_age_guard(building)))
-    conn.close()
+        building.updated_epoch = int(summary_date.timestamp()) if summary_date else -1
+        yield _sanitize_building(_apply_built_age_guard(building))
+
+
+BUILDINGS_SQL = """
+    SELECT
+        COALESCE(b.building_id, s.building_key) AS building_key,
+        COALESCE(b.canonical_name, s.name, s.raw_name) AS name,
+        COALESCE(b.canonical_name, s.raw_name) AS raw_name,
+        COALESCE(b.canonical_address, s.address) AS address,
+        s.rent_yen_min,
+        s.rent_yen_max,
+        s.sale_price_yen_min,
+        s.sale_price_yen_max,
+        s.sale_price_yen_avg,
+        s.area_sqm_min,
+        s.area_sqm_max,
+        s.sale_area_sqm_min,
+        s.sale_area_sqm_max,
+        s.layout_types_json,
+        s.sale_layout_types_json,
+        s.property_kind,
+        s.move_in_dates_json,
+        s.age_years,
+        s.structure,
+        s.building_built_year_month,
+        s.building_built_age_years,
+        s.building_structure,
+        s.building_availability_label,
+        COALESCE(s.vacancy_count, 0) AS vacancy_count,
+        s.sale_listing_count,
+        s.last_updated,
+        COALESCE(s.updated_at, b.updated_at) AS updated_at,
+        b.google_lat,
+        b.google_lng
+    FROM building_summaries s
+    LEFT JOIN buildings b ON b.building_id = s.building_key
+    WHERE COALESCE(b.hidden_from_public, 0) = 0
+    UNION ALL
+    SELECT
+        b.building_id AS building_key,
+        b.canonical_name AS name,
+        b.canonical_name AS raw_name,
+        b.canonical_address AS address,
+        NULL AS rent_yen_min,
+        NULL AS rent_yen_max,
+        NULL AS sale_price_yen_min,
+        NULL AS sale_price_yen_max,
+        NULL AS sale_price_yen_avg,
+        NULL AS area_sqm_min,
+        NULL AS area_sqm_max,
+        NULL AS sale_area_sqm_min,
+        NULL AS sale_area_sqm_max,
+        NULL AS layout_types_json,
+        NULL AS sale_layout_types_json,
+        '' AS property_kind,
+        NULL AS move_in_dates_json,
+        NULL AS age_years,
+        NULL AS structure,
+        NULL AS building_built_year_month,
+        NULL AS building_built_age_years,
+        NULL AS building_structure,
+        NULL AS building_availability_label,
+        0 AS vacancy_count,
+        NULL AS sale_listing_count,
+        NULL AS last_updated,
+        b.updated_at AS updated_at,
+        b.google_lat,
+        b.google_lng
+    FROM buildings b
+    WHERE COALESCE(b.hidden_from_public, 0) = 0
+      AND NOT EXISTS (SELECT 1 FROM building_summaries s WHERE s.building_key = b.building_id)
+"""
+# Payload order (data files, pages) and the recency order the index lists use.
+PAYLOAD_ORDER_SQL = "ORDER BY building_key, updated_at DESC"
+RECENT_ORDER_SQL = "ORDER BY updated_at DESC"
+
+
+class BuildingSource:
+    # Re-runs the building query for every pass instead of holding the catalogue; each pass streams
+    # BuildingRecords off one read-only cursor.
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+
+    def _iter(self, order_sql: str) -> Iterator[BuildingRecord]:
+        conn = connect(self.db_path, read_only=True)
+        try:
+            yield from _iter_building_records(conn.execute(f"{BUILDINGS_SQL} {order_sql}"))
+        finally:
+            conn.close()
+
+    def payload_order(self) -> Iterator[BuildingRecord]:
+        return self._iter(PAYLOAD_ORDER_SQL)
+
+    def __iter__(self) -> Iterator[BuildingRecord]:
+        return self._iter(RECENT_ORDER_SQL)
+
+
+def _load_buildings(db_path: str) -> tuple[BuildingSource, int, int, int, int]:
+    conn = connect(db_path, read_only=True)
+    try:
+        canonical_buildings_count = conn.execute("SELECT COUNT(*) FROM buildings WHERE COALESCE(hidden_from_public, 0) = 0").fetchone()[0]
+        summary_buildings_count = conn.execute(
+            """
+            SELECT COUNT(DISTINCT s.building_key)
+            FROM building_summaries s
+            LEFT JOIN buildings b ON b.building_id = s.building_key
+            WHERE COALESCE(b.hidden_from_public, 0) = 0
+            """
+        ).fetchone()[0]
+        vacancy_total = conn.execute(
+            """
+            SELECT COALESCE(SUM(s.vacancy_count), 0)
+            FROM building_summaries s
+            LEFT JOIN buildings b ON b.building_id = s.building_key
+            WHERE COALESCE(b.hidden_from_public, 0) = 0
+            """
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    buildings_count = canonical_buildings_count
     print(
         "render_kpi_counts canonical_buildings_count={} summary_buildings_count={} vacancy_total={}".format(
             canonical_buildings_count,
@@ -234,100 +367,178 @@ def _load_buildings(db_path: str) -> tuple[list[dict], int, int, int, int]:
             vacancy_total,
         )
     )
-    return building_list, canonical_buildings_count, summary_buildings_count, buildings_count, vacancy_total
-
-
-def _build_buildings_payload(buildings: list[dict]) -> list[dict]:
-    payload = []
-    for b in buildings:
-        payload.append(
-            {
-                "id": b.get("building_key"),
-                "name": b.get("name"),
-                "address": b.get("address"),
-                "vacancy_count": b.get("vacancy_count"),
-                "rent_min": b.get("rent_yen_min"),
-                "rent_max": b.get("rent_yen_max"),
-                "sale_price_min": b.get("sale_price_yen_min"),
-                "sale_price_max": b.get("sale_price_yen_max"),
-                "sale_price_avg": b.get("sale_price_yen_avg"),
-                "area_min": b.get("area_sqm_min"),
-                "area_max": b.get("area_sqm_max"),
-                "sale_area_min": b.get("sale_area_sqm_min"),
-                "sale_area_max": b.get("sale_area_sqm_max"),
-                "updated_at": b.get("last_updated") or b.get("updated_at"),
-                "updated_epoch": b.get("updated_epoch"),
-                "google_maps_url": _build_google_maps_url(b.get("address")),
-                "room_types": b.get("layout_types") or [],
-                "sale_layout_types": json.loads(b.get("sale_layout_types_json")) if b.get("sale_layout_types_json") else [],
-                "property_kind": b.get("property_kind") or "",
-                "sale_listing_count": b.get("sale_listing_count"),
-                "structure": b.get("structure"),
-                "built_year": b.get("age_years"),
-                "building_structure": b.get("building_structure") or b.get("structure"),
-                "building_built_year_month": b.get("building_built_year_month"),
-                "building_built_age_years": b.get("derived_built_age_years") if b.get("derived_built_age_years") is not None else b.get("age_years"),
-                "building_availability_label": b.get("building_availability_label"),
-            }
-        )
-    normalized = []
-    for row in payload:
-        normalized.append({key: _normalize_json_scalar(value) for key, value in row.items()})
-    return _stable_sort_payload(normalized)
-
-
-def _build_buildings_v2_min_payload(buildings: list[dict]) -> list[dict]:
-    payload = []
-    for b in buildings:
-        payload.append(
-            {
-                "id": b.get("building_key"),
-                "name": b.get("name"),
-                "address": b.get("address"),
-                "vacancy_count": b.get("vacancy_count"),
-                "rent_min": b.get("rent_yen_min"),
-                "rent_max": b.get("rent_yen_max"),
-                "sale_price_min": b.get("sale_price_yen_min"),
-                "sale_price_max": b.get("sale_price_yen_max"),
-                "sale_price_avg": b.get("sale_price_yen_avg"),
-                "area_min": b.get("area_sqm_min"),
-                "area_max": b.get("area_sqm_max"),
-                "sale_area_min": b.get("sale_area_sqm_min"),
-                "sale_area_max": b.get("sale_area_sqm_max"),
-                "updated_at": b.get("last_updated") or b.get("updated_at"),
-                "updated_epoch": b.get("updated_epoch"),
-                "property_kind": b.get("property_kind") or "",
-                "sale_listing_count": b.get("sale_listing_count"),
-                "building_structure": b.get("building_structure") or b.get("structure"),
-                "building_availability_label": b.get("building_availability_label"),
-                "building_built_year_month": b.get("building_built_year_month"),
-                "building_built_age_years": b.get("derived_built_age_years") if b.get("derived_built_age_years") is not None else b.get("age_years"),
-            }
-        )
-    normalized = []
-    for row in payload:
-        normalized.append({key: _normalize_json_scalar(value) for key, value in row.items()})
-    return _stable_sort_payload(normalized)
+    return BuildingSource(db_path), canonical_buildings_count, summary_buildings_count, buildings_count, vacancy_total
+
+
+class _CatalogueStats:
+    # Index-page totals gathered while the payload pass streams by.
+    def __init__(self) -> None:
+        self.count = 0
+        self.vacant = 0
+        self.rent_min: object = None
+        self.rent_max: object = None
+        self.latest_date: datetime | None = None
+
+    def track(self, buildings: Iterable[Mapping]) -> Iterator[Mapping]:
+        for b in buildings:
+            self.count += 1
+            self.vacant += b.get("vacancy_count") or 0
+            if b.get("rent_yen_min") is not None and (self.rent_min is None or b["rent_yen_min"] < self.rent_min):
+                self.rent_min = b["rent_yen_min"]
+            if b.get("rent_yen_max") is not None and (self.rent_max is None or b["rent_yen_max"] > self.rent_max):
+                self.rent_max = b["rent_yen_max"]
+            parsed = _build_summary_date(b)
+            if parsed is not None and (self.latest_date is None or parsed > self.latest_date):
+                self.latest_date = parsed
+            yield b
+
+
+V2_MIN_FIELDS = (
+    "id",
+    "name",
+    "address",
+    "vacancy_count",
+    "rent_min",
+    "rent_max",
+    "sale_price_min",
+    "sale_price_max",
+    "sale_price_avg",
+    "area_min",
+    "area_max",
+    "sale_area_min",
+    "sale_area_max",
+    "updated_at",
+    "updated_epoch",
+    "property_kind",
+    "sale_listing_count",
+    "building_structure",
+    "building_availability_label",
+    "building_built_year_month",
+    "building_built_age_years",
+)
+
+
+def _project_building(b: dict) -> dict:
+    row = {
+        "id": b.get("building_key"),
+        "name": b.get("name"),
+        "address": b.get("address"),
+        "vacancy_count": b.get("vacancy_count"),
+        "rent_min": b.get("rent_yen_min"),
+        "rent_max": b.get("rent_yen_max"),
+        "sale_price_min": b.get("sale_price_yen_min"),
+        "sale_price_max": b.get("sale_price_yen_max"),
+        "sale_price_avg": b.get("sale_price_yen_avg"),
+        "area_min": b.get("area_sqm_min"),
+        "area_max": b.get("area_sqm_max"),
+        "sale_area_min": b.get("sale_area_sqm_min"),
+        "sale_area_max": b.get("sale_area_sqm_max"),
+        "updated_at": b.get("last_updated") or b.get("updated_at"),
+        "updated_epoch": b.get("updated_epoch"),
+        "google_maps_url": _build_google_maps_url(b.get("address")),
+        "room_types": b.get("layout_types") or [],
+        "sale_layout_types": json.loads(b.get("sale_layout_types_json")) if b.get("sale_layout_types_json") else [],
+        "property_kind": b.get("property_kind") or "",
+        "sale_listing_count": b.get("sale_listing_count"),
+        "structure": b.get("structure"),
+        "built_year": b.get("age_years"),
+        "building_structure": b.get("building_structure") or b.get("structure"),
+        "building_built_year_month": b.get("building_built_year_month"),
+        "building_built_age_years": b.get("derived_built_age_years") if b.get("derived_built_age_years") is not None else b.get("age_years"),
+        "building_availability_label": b.get("building_availability_label"),
+    }
+    return {key: _normalize_json_scalar(value) for key, value in row.items()}
+
+
+def _v2_min_row(row: dict) -> dict:
+    return {key: row[key] for key in V2_MIN_FIELDS}
+
+
+def _iter_projected_buildings(buildings: BuildingSource) -> Iterator[dict]:
+    return map(_project_building, buildings.payload_order())
 
 
 def export_buildings_json(db_path: str, output_path: str, fmt: str) -> int:
-    buildings, *_ = _load_buildings(db_path)
-    if fmt == "legacy":
-        payload = _build_buildings_payload(buildings)
-    elif fmt == "v2min":
-        payload = _build_buildings_v2_min_payload(buildings)
-    else:
+    if fmt not in ("legacy", "v2min"):
         raise ValueError(f"unsupported format: {fmt}")
-
+    buildings, *_ = _load_buildings(db_path)
     out = Path(output_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
-    print(f"export_buildings_json path={out} format={fmt} count={len(payload)} bytes={out.stat().st_size}")
-    return len(payload)
+    with _JsonArrayWriter(out) as writer:
+        for row in _iter_projected_buildings(buildings):
+            writer.append(row if fmt == "legacy" else _v2_min_row(row))
+    print(f"export_buildings_json path={out} format={fmt} count={writer.count} bytes={out.stat().st_size}")
+    return writer.count
+
+
+def _write_if_changed(path: Path, text: str, written: list[Path] | None = None) -> bool:
+    _check_public_text(path, text)
+    return _write_bytes_if_changed(path, text.encode("utf-8"), written)
+
+
+def _write_bytes_if_changed(path: Path, data: bytes, written: list[Path] | None = None) -> bool:
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    if written is not None:
+        written.append(path)
+    return True
+
+
+def _render_fingerprint(template_root: str) -> str:
+    digest = hashlib.sha256()
+    root = Path(template_root)
+    for template_path in sorted(p for p in root.rglob("*") if p.is_file()):
+        digest.update(template_path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(template_path.read_bytes())
+    digest.update(inspect.getsource(_format_yen).encode("utf-8"))
+    digest.update(repr(FORBIDDEN_PATTERNS).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _json_default(value: object) -> object:
+    return dict(value) if isinstance(value, Mapping) else str(value)
+
+
+def _page_input_hash(fingerprint: str, context: dict) -> str:
+    payload = json.dumps(context, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(f"{fingerprint}\n{payload}".encode("utf-8")).hexdigest()
+
+
+def _load_build_manifest(output_dir: Path, scratch: sqlite3.Connection) -> str | None:
+    # The manifest is JSON lines: a {"render_fingerprint": ...} header, then one [page, input_hash] pair per line.
+    # Pairs go straight into the scratch database so a large catalogue never sits in a dict.
+    scratch.execute("CREATE TABLE previous_pages (name TEXT PRIMARY KEY, input_hash TEXT NOT NULL)")
+    try:
+        fh = (output_dir / BUILD_MANIFEST_NAME).open(encoding="utf-8")
+    except OSError:
+        return None
+    with fh:
+        try:
+            fingerprint = json.loads(fh.readline()).get("render_fingerprint")
+            scratch.executemany("INSERT OR REPLACE INTO previous_pages VALUES (?, ?)", (json.loads(line) for line in fh))
+        except (AttributeError, TypeError, ValueError, sqlite3.Error):
+            # Unreadable or pre-JSON-lines manifests just mean every page is rendered once more.
+            scratch.execute("DELETE FROM previous_pages")
+            return None
+    return fingerprint if isinstance(fingerprint, str) else None
+
+
+def _write_build_manifest(output_dir: Path, scratch: sqlite3.Connection, fingerprint: str) -> None:
+    with _AtomicFileWriter(output_dir / BUILD_MANIFEST_NAME) as writer:
+        writer.write(_json_line({"render_fingerprint": fingerprint}))
+        for row in scratch.execute("SELECT name, input_hash FROM pages ORDER BY name"):
+            writer.write(_json_line(list(row)))
+
 
+def _json_line(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
 
-def _write_build_info(output_dir: Path, *, db_path: str, buildings_count_json: int) -> None:
-    conn = connect(db_path)
+
+def _write_build_info(
+    output_dir: Path, *, db_path: str, buildings_count_json: int, data_assets: dict[str, str] | None = None
+) -> None:
+    conn = connect(db_path, read_only=True)
     try:
         buildings_count_db = conn.execute("SELECT COUNT(*) FROM buildings").fetchone()[0]
         vacancies_count_db = conn.execute(
@@ -342,6 +553,7 @@ def _write_build_info(output_dir: Path, *, db_path: str, buildings_count_json: i
         "buildings_count_json": buildings_count_json,
         "buildings_count_db": buildings_count_db,
         "vacancies_count_db": vacancies_count_db,
+        "data_assets": data_assets or {},
     }
     build_info_path = output_dir / "build_info.json"
     build_info_path.write_text(
@@ -350,27 +562,401 @@ def _write_build_info(output_dir: Path, *, db_path: str, buildings_count_json: i
     print(f"build_info_json path={build_info_path} payload={json.dumps(build_info, ensure_ascii=False)}")
 
 
-def _write_buildings_json(output_dir: Path, buildings: list[dict]) -> None:
-    payload = _build_buildings_payload(buildings)
-    payload_v2_min = _build_buildings_v2_min_payload(buildings)
+def _encode_json(value: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _coalesce(chunks: Iterable[bytes], size: int = WRITE_CHUNK_BYTES) -> Iterator[bytes]:
+    pending: list[bytes] = []
+    pending_bytes = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_bytes += len(chunk)
+        if pending_bytes >= size:
+            yield b"".join(pending)
+            pending = []
+            pending_bytes = 0
+    if pending:
+        yield b"".join(pending)
+
+
+class _AtomicFileWriter:
+    # Streams into a sibling temp file and only replaces the target when the bytes differ. Checked writers scan
+    # every chunk for forbidden text, carrying a short tail over so a match split across two chunks is still caught.
+    def __init__(self, path: Path, written: list[Path] | None = None, *, check: bool = True) -> None:
+        self.path = path
+        self.written = written
+        self.check = check
+        self.size = 0
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._fh = None
+        self._tail = b""
+
+    def __enter__(self) -> "_AtomicFileWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self._tmp_path.open("wb")
+        return self
+
+    def write(self, chunk: bytes) -> None:
+        if self.check:
+            window = self._tail + chunk
+            match = FORBIDDEN_BYTES_RE.search(window)
+            if match:
+                raise RuntimeError(f"forbidden data detected in dist: {self.path} pattern={match.group(0).decode('utf-8')}")
+            self._tail = window[-FORBIDDEN_TAIL_BYTES:]
+        self._fh.write(chunk)
+        self.size += len(chunk)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._fh.close()
+        if exc_type is not None or (
+            self.path.is_file()
+            and self.path.stat().st_size == self.size
+            and filecmp.cmp(self._tmp_path, self.path, shallow=False)
+        ):
+            self._tmp_path.unlink()
+            return
+        os.replace(self._tmp_path, self.path)
+        if self.written is not None:
+            self.written.append(self.path)
+
+
+class _JsonArrayWriter(_AtomicFileWriter):
+    def __init__(self, path: Path, written: list[Path] | None = None) -> None:
+        super().__init__(path, written)
+        self.count = 0
+
+    def __enter__(self) -> "_JsonArrayWriter":
+        super().__enter__()
+        self.write(b"[")
+        return self
+
+    def append(self, row: dict) -> None:
+        self.append_encoded(_encode_json(row))
+
+    def append_encoded(self, chunk: bytes) -> None:
+        self.write(b"," + chunk if self.count else chunk)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.write(b"]")
+        super().__exit__(exc_type, exc, tb)
+
+
+class _ShardSpill:
+    # Encoded shard rows wait in the scratch database until every building has been seen; only the per-shard
+    # metadata (bounded by the ward and tile counts) stays in memory.
+    def __init__(self, scratch: sqlite3.Connection) -> None:
+        self.conn = scratch
+        self.conn.execute(
+            "CREATE TABLE shard_rows (seq INTEGER PRIMARY KEY, grp TEXT NOT NULL, name TEXT NOT NULL, row BLOB NOT NULL)"
+        )
+        self.meta: dict[tuple[str, str], dict] = {}
+        self._pending: list[tuple[str, str, bytes]] = []
+
+    def add(self, group: str, name: str, meta: dict, chunk: bytes) -> None:
+        self.meta.setdefault((group, name), meta)
+        self._pending.append((group, name, chunk))
+        if len(self._pending) >= SCRATCH_FLUSH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        self.conn.executemany("INSERT INTO shard_rows (grp, name, row) VALUES (?, ?, ?)", self._pending)
+        self._pending = []
+
+    def rows(self) -> Iterator[tuple[str, str, bytes]]:
+        self._flush()
+        return iter(self.conn.execute("SELECT grp, name, row FROM shard_rows ORDER BY grp, name, seq"))
 
+
+def _write_buildings_json(
+    output_dir: Path, buildings: Iterable[Mapping], scratch: sqlite3.Connection, written: list[Path] | None = None
+) -> int:
+    # One pass over the records feeds every data writer; shards and the search index spill to the scratch
+    # database and the columnar encoder to temp files, so memory stays flat as the catalogue grows.
     data_dir = output_dir / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    buildings_path = data_dir / "buildings.json"
-    buildings_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
-    buildings_v2_min_path = data_dir / "buildings.v2.min.json"
-    buildings_v2_min_path.write_text(json.dumps(payload_v2_min, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    shards = _ShardSpill(scratch)
+    search_index = SearchIndexBuilder(scratch)
+    with ColumnarWriter() as columnar:
+        with _JsonArrayWriter(data_dir / "buildings.json", written) as legacy, _JsonArrayWriter(
+            data_dir / "buildings.v2.min.json", written
+        ) as v2_min:
+            for building in buildings:
+                row = _project_building(building)
+                min_row = _v2_min_row(row)
+                min_chunk = _encode_json(min_row)
+                legacy.append(row)
+                v2_min.append_encoded(min_chunk)
+                search_index.add(min_row)
+                columnar.add({**min_row, "room_types": row["room_types"]})
+                slug = ward_slug(row["address"])
+                shards.add("ward", slug, {"ward": slug, "ward_name": WARD_NAMES_BY_SLUG.get(slug)}, min_chunk)
+                tile = tile_for(building.get("google_lat"), building.get("google_lng"))
+                if tile is not None:
+                    x, y = tile
+                    shards.add("tile", f"{TILE_ZOOM}-{x}-{y}", {"x": x, "y": y, "bbox": tile_bbox(x, y)}, min_chunk)
+
+        for writer in (legacy, v2_min):
+            print(f"render_buildings_json path={writer.path} bytes={writer.size} count={writer.count}")
+        _write_shards(data_dir, shards, total=v2_min.count, written=written)
+        _write_search_index(data_dir, search_index, written)
+        _write_columnar(data_dir, columnar, json_bytes=v2_min.size, written=written)
+    return v2_min.count
+
+
+def _write_columnar(data_dir: Path, columnar: ColumnarWriter, *, json_bytes: int, written: list[Path] | None = None) -> None:
+    # Every string in these rows was already scanned when buildings.json was streamed.
+    path = data_dir / "buildings.v2.cols.bin"
+    with _AtomicFileWriter(path, written, check=False) as writer:
+        columnar.write_to(writer)
+    print(f"render_columnar path={path} bytes={writer.size} json_bytes={json_bytes} count={columnar.count}")
+
+
+def _write_search_index(data_dir: Path, builder: SearchIndexBuilder, written: list[Path] | None = None) -> None:
+    path = data_dir / "search_index.json"
+    # Same stream as gzip.compress(data, mtime=0), measured without holding the payload.
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+    gzip_bytes = 0
+    with _AtomicFileWriter(path, written) as writer:
+        for chunk in _coalesce(builder.iter_json()):
+            writer.write(chunk)
+            gzip_bytes += len(compressor.compress(chunk))
+    gzip_bytes += len(compressor.flush())
+    print(
+        f"render_search_index path={path} bytes={writer.size} gzip_bytes={gzip_bytes} "
+        f"budget_bytes={SEARCH_INDEX_BUDGET_BYTES} over_budget={int(writer.size > SEARCH_INDEX_BUDGET_BYTES)} "
+        f"tokens={builder.term_count(TOKEN_KIND)} bigrams={builder.term_count(BIGRAM_KIND)} count={builder.count}"
+    )
+
 
-    print(f"render_buildings_json path={buildings_path} bytes={buildings_path.stat().st_size} count={len(payload)}")
+def _write_shards(data_dir: Path, shards: _ShardSpill, *, total: int, written: list[Path] | None = None) -> None:
+    shards_dir = data_dir / "shards"
+    entries: dict[str, list[dict]] = {"ward": [], "tile": []}
+    for (group, name), rows in groupby(shards.rows(), key=itemgetter(0, 1)):
+        with _JsonArrayWriter(shards_dir / group / f"{name}.json", written) as writer:
+            for _group, _name, chunk in rows:
+                writer.append_encoded(chunk)
+        entries[group].append({**shards.meta[(group, name)], "path": f"data/shards/{group}/{name}.json", "count": writer.count})
+    for group, group_entries in entries.items():
+        shard_dir = shards_dir / group
+        names = {entry["path"].rsplit("/", 1)[1] for entry in group_entries}
+        if shard_dir.is_dir():
+            for stale_path in shard_dir.glob("*.json"):
+                if stale_path.name not in names:
+                    stale_path.unlink()
+    ward_entries, tile_entries = entries["ward"], entries["tile"]
+    manifest = {
+        "version": 1,
+        "count": total,
+        "wards": ward_entries,
+        "tiles": {"zoom": TILE_ZOOM, "count": sum(entry["count"] for entry in tile_entries), "items": tile_entries},
+    }
+    manifest_path = shards_dir / "manifest.json"
+    _write_if_changed(manifest_path, json.dumps(manifest, ensure_ascii=False, separators=(",", ":")), written)
     print(
-        f"render_buildings_json path={buildings_v2_min_path} bytes={buildings_v2_min_path.stat().st_size} count={len(payload_v2_min)}"
+        f"render_shards path={manifest_path} wards={len(ward_entries)} tiles={len(tile_entries)} "
+        f"geocoded={manifest['tiles']['count']} count={total}"
     )
 
 
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _copy_if_changed(source: Path, target: Path, written: list[Path] | None = None) -> bool:
+    if target.is_file() and target.stat().st_size == source.stat().st_size and filecmp.cmp(source, target, shallow=False):
+        return False
+    shutil.copyfile(source, target)
+    if written is not None:
+        written.append(target)
+    return True
+
+
+def _write_hashed_data_assets(output_dir: Path, written: list[Path] | None = None) -> dict[str, str]:
+    data_dir = output_dir / "data"
+    assets: dict[str, str] = {}
+    for name in HASHED_DATA_ASSETS:
+        stem, ext = name.rsplit(".", 1)
+        hashed_name = f"{stem}.{_file_sha256(data_dir / name)[:ASSET_HASH_LENGTH]}.{ext}"
+        _copy_if_changed(data_dir / name, data_dir / hashed_name, written)
+        hashed_re = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{{ASSET_HASH_LENGTH}}}\.{ext}")
+        for stale_path in data_dir.glob(f"{stem}.*.{ext}"):
+            if stale_path.name != hashed_name and hashed_re.fullmatch(stale_path.name):
+                stale_path.unlink()
+        assets[name] = f"data/{hashed_name}"
+    return assets
+
+
+class _BrotliCompressor:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(quality=11)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _compress_file(path: Path, sibling: Path, compressor) -> None:
+    with _AtomicFileWriter(sibling, check=False) as writer, path.open("rb") as fh:
+        while chunk := fh.read(WRITE_CHUNK_BYTES):
+            writer.write(compressor.compress(chunk))
+        writer.write(compressor.flush())
+
+
+def _precompress_assets(output_dir: Path, written: list[Path]) -> int:
+    changed = set(written)
+    sources = [output_dir / "index.html", *(output_dir / "data").rglob("*")]
+    compressed = 0
+    for path in sources:
+        if not path.is_file() or path.suffix not in PRECOMPRESS_SUFFIXES or path.stat().st_size < PRECOMPRESS_MIN_BYTES:
+            continue
+        # zlib with a gzip wrapper matches gzip.compress(data, compresslevel=9, mtime=0) byte for byte.
+        siblings = [(path.with_name(f"{path.name}.gz"), lambda: zlib.compressobj(9, zlib.DEFLATED, 31))]
+        if brotli is not None:
+            siblings.append((path.with_name(f"{path.name}.br"), _BrotliCompressor))
+        for sibling, compressor in siblings:
+            if path in changed or not sibling.is_file():
+                _compress_file(path, sibling, compressor())
+                compressed += 1
+    for sibling in [*(output_dir / "data").rglob("*.gz"), *(output_dir / "data").rglob("*.br")]:
+        if not sibling.with_suffix("").is_file():
+            sibling.unlink()
+    return compressed
+
+
+def _template_environment(template_root: str) -> Environment:
+    env = Environment(loader=FileSystemLoader(template_root), autoescape=select_autoescape(["html"]))
+    env.filters["yen"] = _format_yen
+    return env
+
+
+def _write_template(path: Path, template, context: dict, written: list[Path] | None = None) -> int:
+    with _AtomicFileWriter(path, written) as writer:
+        for chunk in _coalesce(piece.encode("utf-8") for piece in template.generate(**context)):
+            writer.write(chunk)
+    return writer.size
+
+
+def _write_pages(template, jobs: list[tuple[str, dict]]) -> list[str]:
+    return [path for path, context in jobs if _write_if_changed(Path(path), template.render(**context))]
+
+
+def _init_page_worker(template_root: str) -> None:
+    _worker_templates["building"] = _template_environment(template_root).get_template("building.html.j2")
+
+
+def _render_page_chunk(jobs: list[tuple[str, dict]]) -> list[str]:
+    return _write_pages(_worker_templates["building"], jobs)
+
+
+class _PageRenderer:
+    # Accepts page jobs one at a time and renders them in fixed-size chunks. The process pool only starts once
+    # a second chunk is needed, and at most a few chunks per worker are in flight, so no job list accumulates.
+    def __init__(self, template_root: str, *, workers: int = 1) -> None:
+        self.template_root = template_root
+        self.workers = workers
+        self.written = 0
+        self._chunk: list[tuple[str, dict]] = []
+        self._in_flight: deque[Future] = deque()
+        self._pool: ProcessPoolExecutor | None = None
+        self._template = None
+
+    def __enter__(self) -> "_PageRenderer":
+        return self
+
+    def submit(self, path: str, context: dict) -> None:
+        self._chunk.append((path, context))
+        if len(self._chunk) >= PAGE_CHUNK_SIZE:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        chunk, self._chunk = self._chunk, []
+        if self.workers <= 1:
+            self._render_serial(chunk)
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_page_worker, initargs=(self.template_root,)
+            )
+        self._in_flight.append(self._pool.submit(_render_page_chunk, chunk))
+        while len(self._in_flight) > self.workers * PAGE_CHUNKS_IN_FLIGHT_PER_WORKER:
+            self.written += len(self._in_flight.popleft().result())
+
+    def _render_serial(self, chunk: list[tuple[str, dict]]) -> None:
+        if self._template is None:
+            self._template = _template_environment(self.template_root).get_template("building.html.j2")
+        self.written += len(_write_pages(self._template, chunk))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                if self._pool is None:
+                    self._render_serial(self._chunk)
+                elif self._chunk:
+                    self._dispatch()
+                while self._in_flight:
+                    self.written += len(self._in_flight.popleft().result())
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=exc_type is not None)
+
+
+def _render_pages(template_root: str, jobs: Iterable[tuple[str, dict]], *, workers: int = 1) -> int:
+    with _PageRenderer(template_root, workers=workers) as renderer:
+        for path, context in jobs:
+            renderer.submit(path, context)
+    return renderer.written
+
+
+def _render_building_pages(
+    output_dir: Path,
+    buildings: Iterable[Mapping],
+    scratch: sqlite3.Connection,
+    *,
+    fingerprint: str,
+    reuse_previous: bool,
+    template_root: str,
+    line_cta_url: str,
+    line_deep_link_url: str,
+    workers: int,
+) -> int:
+    # Page input hashes go to the scratch `pages` table (the next manifest); only changed pages are rendered.
+    scratch.execute("CREATE TABLE pages (name TEXT PRIMARY KEY, input_hash TEXT NOT NULL)")
+    pending: list[tuple[str, str]] = []
+    with _PageRenderer(template_root, workers=workers) as renderer:
+        for b in buildings:
+            page_name = f"b/{b['building_key']}.html"
+            page_path = output_dir / page_name
+            context = {
+                "building": b,
+                "maps_url": _build_google_maps_url(b.get("address")),
+                "line_cta_url": line_cta_url,
+                "line_deep_link_url": line_deep_link_url,
+            }
+            input_hash = _page_input_hash(fingerprint, context)
+            pending.append((page_name, input_hash))
+            if len(pending) >= SCRATCH_FLUSH_ROWS:
+                scratch.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?)", pending)
+                pending = []
+            if reuse_previous and page_path.is_file():
+                previous = scratch.execute("SELECT input_hash FROM previous_pages WHERE name = ?", (page_name,)).fetchone()
+                if previous is not None and previous[0] == input_hash:
+                    continue
+            renderer.submit(str(page_path), context)
+    scratch.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?)", pending)
+    return renderer.written
+
+
 def _build_dist_version(
     output_dir: Path,
     db_path: str,
-    buildings: list[dict],
+    buildings: BuildingSource,
     *,
     canonical_buildings_count: int,
     summary_buildings_count: int,
@@ -379,60 +965,102 @@ def _build_dist_version(
     template_root: str,
     line_cta_url: str,
     line_deep_link_url: str,
+    incremental: bool = False,
+    workers: int = 1,
+    compact_index: bool = True,
 ) -> None:
-    if output_dir.exists():
+    fingerprint = _render_fingerprint(template_root)
+    if not incremental and output_dir.exists():
         shutil.rmtree(output_dir)
     (output_dir / "b").mkdir(parents=True, exist_ok=True)
-
-    env = Environment(loader=FileSystemLoader(template_root), autoescape=select_autoescape(["html"]))
-    env.filters["yen"] = _format_yen
-    index_tpl = env.get_template("index.html.j2")
-    building_tpl = env.get_template("building.html.j2")
-
-    total_buildings = len(buildings)
-    total_vacant = sum((b.get("vacancy_count") or 0) for b in buildings)
-    parsed_dates = [parsed for parsed in (_build_summary_date(b) for b in buildings) if parsed is not None]
-    latest_data_date = max(parsed_dates, default=None)
-    latest_data_date_label = latest_data_date.strftime("%Y/%m/%d") if latest_data_date else "—"
-
-    (output_dir / "index.html").write_text(
-        index_tpl.render(
-            buildings=buildings,
-            total_buildings=total_buildings,
-            total_vacant=total_vacant,
-            total_buildings_formatted=f"{total_buildings:,}",
-            total_vacant_formatted=f"{total_vacant:,}",
-            canonical_buildings_count=canonical_buildings_count,
-            summary_buildings_count=summary_buildings_count,
-            canonical_buildings_count_formatted=f"{canonical_buildings_count:,}",
-            summary_buildings_count_formatted=f"{summary_buildings_count:,}",
-            buildings_count=buildings_count,
-            buildings_count_formatted=f"{buildings_count:,}",
-            vacancy_total=vacancy_total,
-            vacancy_total_formatted=f"{vacancy_total:,}",
-            latest_data_date=latest_data_date_label,
-        ),
-        encoding="utf-8",
-    )
-
-    for b in buildings:
-        maps_url = _build_google_maps_url(b.get("address"))
-        html = building_tpl.render(
-            building=b,
-            maps_url=maps_url,
+    written: list[Path] = []
+    # Private temp-file-backed database for everything that would otherwise grow with the catalogue.
+    scratch = sqlite3.connect("")
+    try:
+        previous_fingerprint = _load_build_manifest(output_dir, scratch) if incremental else None
+
+        stats = _CatalogueStats()
+        buildings_count_json = _write_buildings_json(output_dir, stats.track(buildings.payload_order()), scratch, written)
+        data_assets = _write_hashed_data_assets(output_dir, written)
+
+        total_buildings = stats.count
+        total_vacant = stats.vacant
+        index_path = output_dir / "index.html"
+        index_bytes = _write_template(
+            index_path,
+            _template_environment(template_root).get_template("index.html.j2"),
+            dict(
+                compact_index=compact_index,
+                data_assets=data_assets,
+                buildings=buildings,
+                catalogue_rent_min=stats.rent_min,
+                catalogue_rent_max=stats.rent_max,
+                total_buildings=total_buildings,
+                total_vacant=total_vacant,
+                total_buildings_formatted=f"{total_buildings:,}",
+                total_vacant_formatted=f"{total_vacant:,}",
+                canonical_buildings_count=canonical_buildings_count,
+                summary_buildings_count=summary_buildings_count,
+                canonical_buildings_count_formatted=f"{canonical_buildings_count:,}",
+                summary_buildings_count_formatted=f"{summary_buildings_count:,}",
+                buildings_count=buildings_count,
+                buildings_count_formatted=f"{buildings_count:,}",
+                vacancy_total=vacancy_total,
+                vacancy_total_formatted=f"{vacancy_total:,}",
+                latest_data_date=stats.latest_date.strftime("%Y/%m/%d") if stats.latest_date else "—",
+            ),
+            written,
+        )
+        print(f"render_index path={index_path} bytes={index_bytes} compact={int(compact_index)} buildings={total_buildings}")
+
+        pages_written = _render_building_pages(
+            output_dir,
+            buildings.payload_order(),
+            scratch,
+            fingerprint=fingerprint,
+            reuse_previous=previous_fingerprint == fingerprint,
+            template_root=template_root,
             line_cta_url=line_cta_url,
             line_deep_link_url=line_deep_link_url,
+            workers=workers,
         )
-        (output_dir / "b" / f"{b['building_key']}.html").write_text(html, encoding="utf-8")
 
-    _write_buildings_json(output_dir, buildings)
-    _write_build_info(output_dir, db_path=db_path, buildings_count_json=len(_build_buildings_v2_min_payload(buildings)))
-
-    (output_dir / ".nojekyll").touch()
-    _validate_public_dist(output_dir)
+        removed = 0
+        # os.scandir streams the directory; Path.glob would list every page up front.
+        with os.scandir(output_dir / "b") as entries:
+            for entry in entries:
+                if not entry.name.endswith(".html"):
+                    continue
+                if scratch.execute("SELECT 1 FROM pages WHERE name = ?", (f"b/{entry.name}",)).fetchone() is None:
+                    os.unlink(entry.path)
+                    removed += 1
+
+        compressed = _precompress_assets(output_dir, written)
+        print(f"render_precompress path={output_dir} files={compressed} brotli={int(brotli is not None)}")
+        _write_build_info(output_dir, db_path=db_path, buildings_count_json=buildings_count_json, data_assets=data_assets)
+
+        nojekyll = output_dir / ".nojekyll"
+        if not nojekyll.exists():
+            nojekyll.touch()
+        if incremental:
+            _write_build_manifest(output_dir, scratch, fingerprint)
+            pages = scratch.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            print(
+                f"render_incremental path={output_dir} pages={pages} written={len(written) + pages_written} removed={removed}"
+            )
+    finally:
+        scratch.close()
 
 
-def build_dist(db_path: str, output_dir: str, *, template_root: str = "templates") -> None:
+def build_dist(
+    db_path: str,
+    output_dir: str,
+    *,
+    template_root: str = "templates",
+    incremental: bool = False,
+    workers: int = 1,
+    compact_index: bool = True,
+) -> None:
     load_dotenv()
     line_cta_url = os.getenv("TATEMONO_MAP_LINE_CTA_URL", DEFAULT_LINE_UNIVERSAL_URL).strip() or DEFAULT_LINE_UNIVERSAL_URL
     line_deep_link_url = os.getenv("TATEMONO_MAP_LINE_DEEP_LINK_URL", DEFAULT_LINE_DEEP_LINK).strip() or DEFAULT_LINE_DEEP_LINK
@@ -449,16 +1077,21 @@ def build_dist(db_path: str, output_dir: str, *, template_root: str = "templates
         template_root=template_root,
         line_cta_url=line_cta_url,
         line_deep_link_url=line_deep_link_url,
+        incremental=incremental,
+        workers=workers,
+        compact_index=compact_index,
     )
 
 
-def build_dist_versions(db_path: str, output_dir: str) -> None:
+def build_dist_versions(
+    db_path: str, output_dir: str, *, incremental: bool = False, workers: int = 1, compact_index: bool = True
+) -> None:
     load_dotenv()
     line_cta_url = os.getenv("TATEMONO_MAP_LINE_CTA_URL", DEFAULT_LINE_UNIVERSAL_URL).strip() or DEFAULT_LINE_UNIVERSAL_URL
     line_deep_link_url = os.getenv("TATEMONO_MAP_LINE_DEEP_LINK_URL", DEFAULT_LINE_DEEP_LINK).strip() or DEFAULT_LINE_DEEP_LINK
 
     out = Path(output_dir)
-    if out.exists():
+    if out.exists() and not incremental:
         shutil.rmtree(out)
     out.mkdir(parents=True, exist_ok=True)
 
@@ -474,6 +1107,9 @@ def build_dist_versions(db_path: str, output_dir: str) -> None:
         template_root="templates_v2",
         line_cta_url=line_cta_url,
         line_deep_link_url=line_deep_link_url,
+        incremental=incremental,
+        workers=workers,
+        compact_index=compact_index,
     )
     _build_dist_version(
         out / "v1",
@@ -486,6 +1122,9 @@ def build_dist_versions(db_path: str, output_dir: str) -> None:
         template_root="templates",
         line_cta_url=line_cta_url,
         line_deep_link_url=line_deep_link_url,
+        incremental=incremental,
+        workers=workers,
+        compact_index=compact_index,
     )
 
 
@@ -494,14 +1133,22 @@ def main() -> None:
     parser.add_argument("--db-path", default="data/tatemono_map.sqlite3")
     parser.add_argument("--output-dir", default="dist")
     parser.add_argument("--version", choices=("v1", "v2", "all"), default="all")
+    parser.add_argument("--incremental", action="store_true", help="rewrite only pages whose inputs changed")
+    parser.add_argument("--workers", type=int, default=1, help="processes used to render building pages")
+    parser.add_argument(
+        "--full-index-rent-list",
+        action="store_true",
+        help="render the hidden per-building rent list into the v2 index.html (grows with the catalogue)",
+    )
     args = parser.parse_args()
 
+    options = {"incremental": args.incremental, "workers": args.workers, "compact_index": not args.full_index_rent_list}
     if args.version == "all":
-        build_dist_versions(args.db_path, args.output_dir)
+        build_dist_versions(args.db_path, args.output_dir, **options)
     elif args.version == "v2":
-        build_dist(args.db_path, args.output_dir, template_root="templates_v2")
+        build_dist(args.db_path, args.output_dir, template_root="templates_v2", **options)
     else:
-        build_dist(args.db_path, args.output_dir, template_root="templates")
+        build_dist(args.db_path, args.output_dir, template_root="templates", **options)
     print("dist generated")
 
 
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import math
+import struct
+import tempfile
+from typing import BinaryIO, Iterable, Iterator
+
+COLUMNAR_MAGIC = b"TMC1"
+COLUMNAR_VERSION = 1
+INT32_NULL = -(2**31)
+INT32_MAX = 2**31 - 1
+ALIGNMENT = 4
+FLOAT32_MAX = 3.4028234663852886e38
+FLUSH_ROWS = 1024
+COPY_CHUNK_BYTES = 1 << 16
+ENCODINGS = ("int32", "float32", "utf8", "dict", "dict_list")
+
+LOGGER = logging.getLogger(__name__)
+
+# (field, encoding). utf8 columns store None as an empty string: the v2 payload already maps "" to None.
+COLUMNS = (
+    ("id", "utf8"),
+    ("name", "utf8"),
+    ("address", "utf8"),
+    ("vacancy_count", "int32"),
+    ("rent_min", "int32"),
+    ("rent_max", "int32"),
+    ("sale_price_min", "int32"),
+    ("sale_price_max", "int32"),
+    ("sale_price_avg", "int32"),
+    ("area_min", "float32"),
+    ("area_max", "float32"),
+    ("sale_area_min", "float32"),
+    ("sale_area_max", "float32"),
+    ("updated_at", "utf8"),
+    ("updated_epoch", "int32"),
+    ("property_kind", "dict"),
+    ("sale_listing_count", "int32"),
+    ("building_structure", "dict"),
+    ("building_availability_label", "dict"),
+    ("building_built_year_month", "dict"),
+    ("building_built_age_years", "int32"),
+    ("room_types", "dict_list"),
+)
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % ALIGNMENT)
+
+
+def _int32(values: list[int]) -> bytes:
+    return struct.pack(f"<{len(values)}i", *values)
+
+
+def _int32_value(field: str, value: object) -> int:
+    if value is None or value == "":
+        return INT32_NULL
+    # One bad source row must not abort the whole export; it decodes as a missing value instead.
+    try:
+        number = round(float(value))
+    except (TypeError, ValueError, OverflowError):
+        number = None
+    if number is None or not INT32_NULL < number <= INT32_MAX:
+        LOGGER.warning("columnar: %s=%r is not an int32, encoded as null", field, value)
+        return INT32_NULL
+    return number
+
+
+def _float32_value(field: str, value: object) -> float:
+    if value is None or value == "":
+        return math.nan
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = math.nan
+    if math.isnan(number) or abs(number) > FLOAT32_MAX:
+        LOGGER.warning("columnar: %s=%r is not a float32, encoded as null", field, value)
+        return math.nan
+    return number
+
+
+class _Buffer:
+    # One column buffer spilled to a temp file while rows stream in; only its length stays in memory.
+    def __init__(self) -> None:
+        self.file = tempfile.TemporaryFile()
+        self.length = 0
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+        self.length += len(data)
+
+    def chunks(self) -> Iterator[bytes]:
+        self.file.seek(0)
+        while chunk := self.file.read(COPY_CHUNK_BYTES):
+            yield chunk
+
+
+class _Column:
+    # dict/dict_list codes are assigned in first-seen order while streaming and remapped to the sorted
+    # dictionary on output, so no column ever needs all of its values at once.
+    def __init__(self, field: str, encoding: str) -> None:
+        if encoding not in ENCODINGS:
+            raise ValueError(f"unsupported column encoding: {encoding}")
+        self.field = field
+        self.encoding = encoding
+        self.buffers = [_Buffer() for _ in range(2 if encoding in ("utf8", "dict_list") else 1)]
+        self.pending: list[object] = []
+        self.offset = 0
+        self.codes: dict[str, int] = {}
+        if encoding in ("utf8", "dict_list"):
+            self.buffers[0].write(_int32([0]))
+
+    def _code(self, value: object) -> int:
+        return self.codes.setdefault(str(value), len(self.codes))
+
+    def flush(self) -> None:
+        values, self.pending = self.pending, []
+        if not values:
+            return
+        field, encoding = self.field, self.encoding
+        if encoding == "int32":
+            self.buffers[0].write(_int32([_int32_value(field, value) for value in values]))
+        elif encoding == "float32":
+            self.buffers[0].write(struct.pack(f"<{len(values)}f", *(_float32_value(field, value) for value in values)))
+        elif encoding == "utf8":
+            encoded = [("" if value is None else str(value)).encode("utf-8") for value in values]
+            offsets = []
+            for item in encoded:
+                self.offset += len(item)
+                offsets.append(self.offset)
+            self.buffers[0].write(_int32(offsets))
+            self.buffers[1].write(b"".join(encoded))
+        elif encoding == "dict":
+            self.buffers[0].write(_int32([-1 if value is None else self._code(value) for value in values]))
+        else:
+            offsets = []
+            flat: list[int] = []
+            for value in values:
+                codes = [self._code(item) for item in (value or []) if item is not None]
+                flat.extend(codes)
+                self.offset += len(codes)
+                offsets.append(self.offset)
+            self.buffers[0].write(_int32(offsets))
+            self.buffers[1].write(_int32(flat))
+
+    def meta(self) -> dict:
+        meta: dict = {"name": self.field, "type": self.encoding}
+        if self.encoding in ("dict", "dict_list"):
+            meta["dictionary"] = sorted(self.codes)
+        return meta
+
+    def buffer_chunks(self) -> Iterator[tuple[_Buffer, Iterator[bytes]]]:
+        code_buffer = {"dict": 0, "dict_list": 1}.get(self.encoding)
+        for index, buffer in enumerate(self.buffers):
+            if index != code_buffer:
+                yield buffer, buffer.chunks()
+                continue
+            sorted_codes = {value: code for code, value in enumerate(sorted(self.codes))}
+            remap = [sorted_codes[value] for value in self.codes]
+            yield buffer, (
+                _int32([code if code < 0 else remap[code] for code in struct.unpack(f"<{len(chunk) // 4}i", chunk)])
+                for chunk in buffer.chunks()
+            )
+
+    def close(self) -> None:
+        for buffer in self.buffers:
+            buffer.file.close()
+
+
+class ColumnarWriter:
+    # Rows stream in one at a time; columns are buffered in temp files, so memory stays flat in the row count.
+    def __init__(self) -> None:
+        self.count = 0
+        self.columns = [_Column(field, encoding) for field, encoding in COLUMNS]
+
+    def add(self, row: dict) -> None:
+        for column in self.columns:
+            column.pending.append(row.get(column.field))
+        self.count += 1
+        if self.count % FLUSH_ROWS == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        for column in self.columns:
+            column.flush()
+
+    def write_to(self, fh: BinaryIO) -> int:
+        self._flush()
+        columns = []
+        body_offset = 0
+        for column in self.columns:
+            meta = column.meta()
+            meta["buffers"] = []
+            for buffer in column.buffers:
+                meta["buffers"].append({"offset": body_offset, "length": buffer.length})
+                body_offset += buffer.length + (-buffer.length % ALIGNMENT)
+            columns.append(meta)
+        header = {
+            "version": COLUMNAR_VERSION,
+            "count": self.count,
+            "endian": "little",
+            "int32_null": INT32_NULL,
+            "columns": columns,
+        }
+        header_bytes = _pad(json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        fh.write(COLUMNAR_MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes)
+        for column in self.columns:
+            for buffer, chunks in column.buffer_chunks():
+                for chunk in chunks:
+                    fh.write(chunk)
+                fh.write(b"\0" * (-buffer.length % ALIGNMENT))
+        return 8 + len(header_bytes) + body_offset
+
+    def close(self) -> None:
+        for column in self.columns:
+            column.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def encode_columnar(rows: Iterable[dict]) -> bytes:
+    with ColumnarWriter() as writer:
+        for row in rows:
+            writer.add(row)
+        out = io.BytesIO()
+        writer.write_to(out)
+    return out.getvalue()
+
+
+def read_columnar_header(data: bytes) -> tuple[dict, int]:
+    if data[:4] != COLUMNAR_MAGIC:
+        raise ValueError("not a columnar building export")
+    (header_length,) = struct.unpack_from("<I", data, 4)
+    header = json.loads(data[8 : 8 + header_length].rstrip(b"\0").decode("utf-8"))
+    if header.get("version") != COLUMNAR_VERSION:
+        raise ValueError(f"unsupported columnar version: {header.get('version')}")
+    return header, 8 + header_length
+
+
+def _int32_at(data: bytes, base: int, buffer: dict) -> tuple[int, ...]:
+    return struct.unpack_from(f"<{buffer['length'] // 4}i", data, base + buffer["offset"])
+
+
+def read_columnar(data: bytes) -> list[dict]:
+    header, base = read_columnar_header(data)
+    count = header["count"]
+    decoded: dict[str, list] = {}
+    for column in header["columns"]:
+        encoding = column["type"]
+        buffers = column["buffers"]
+        if encoding == "int32":
+            decoded[column["name"]] = [None if value == INT32_NULL else value for value in _int32_at(data, base, buffers[0])]
+        elif encoding == "float32":
+            values = struct.unpack_from(f"<{count}f", data, base + buffers[0]["offset"])
+            decoded[column["name"]] = [None if math.isnan(value) else value for value in values]
+        elif encoding == "utf8":
+            offsets = _int32_at(data, base, buffers[0])
+            blob = data[base + buffers[1]["offset"] : base + buffers[1]["offset"] + buffers[1]["length"]]
+            decoded[column["name"]] = [blob[offsets[i] : offsets[i + 1]].decode("utf-8") or None for i in range(count)]
+        elif encoding == "dict":
+            dictionary = column["dictionary"]
+            decoded[column["name"]] = [None if code < 0 else dictionary[code] for code in _int32_at(data, base, buffers[0])]
+        elif encoding == "dict_list":
+            dictionary = column["dictionary"]
+            offsets = _int32_at(data, base, buffers[0])
+            codes = _int32_at(data, base, buffers[1])
+            decoded[column["name"]] = [[dictionary[code] for code in codes[offsets[i] : offsets[i + 1]]] for i in range(count)]
+        else:
+            raise ValueError(f"unsupported column encoding: {encoding}")
+    return [{name: values[i] for name, values in decoded.items()} for i in range(count)]
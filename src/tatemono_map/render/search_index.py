@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import unicodedata
+from typing import Iterator
+
+SEARCH_INDEX_VERSION = 1
+SEARCH_INDEX_BUDGET_BYTES = 1_500_000
+MISSING_NUMBER = -1
+TOKEN_RE = re.compile(r"\w+")
+WHITESPACE_RE = re.compile(r"[\s　]+")
+
+
+def normalize_search_text(text: object) -> str:
+    # Mirrors normalizeText in templates_v2/index.html.j2 so query and index agree.
+    return WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", str(text or "")).lower()).strip()
+
+
+def char_bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1) if " " not in text[i : i + 2]}
+
+
+def _int_or_missing(value: object, scale: int = 1) -> int:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return MISSING_NUMBER
+    if number != number or number < 0:
+        return MISSING_NUMBER
+    return int(round(number * scale))
+
+
+TOKEN_KIND = 0
+BIGRAM_KIND = 1
+COLUMN_NAMES = ("rent_min", "area_min_centi", "built_age_years")
+FLUSH_DOCS = 1024
+
+
+def _json_text(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SearchIndexBuilder:
+    # Documents and postings spill into a scratch SQLite database (temp-file backed) and the payload is
+    # streamed back out in term order, so the builder's memory does not grow with the catalogue.
+    def __init__(self, conn: sqlite3.Connection | None = None) -> None:
+        self.conn = conn if conn is not None else sqlite3.connect("")
+        self.conn.execute(
+            "CREATE TABLE search_index_docs (doc_id INTEGER PRIMARY KEY, id TEXT, "
+            + ", ".join(f"{name} INTEGER" for name in COLUMN_NAMES)
+            + ")"
+        )
+        self.conn.execute("CREATE TABLE search_index_postings (kind INTEGER, term TEXT, doc_id INTEGER)")
+        self.count = 0
+        self._docs: list[tuple] = []
+        self._postings: list[tuple[int, str, int]] = []
+
+    def add(self, row: dict) -> None:
+        doc_id = self.count
+        self.count += 1
+        name = normalize_search_text(row.get("name"))
+        address = normalize_search_text(row.get("address"))
+        self._postings.extend((TOKEN_KIND, token, doc_id) for token in set(TOKEN_RE.findall(f"{name} {address}")))
+        self._postings.extend((BIGRAM_KIND, bigram, doc_id) for bigram in char_bigrams(name) | char_bigrams(address))
+        self._docs.append(
+            (
+                doc_id,
+                row["id"],
+                _int_or_missing(row.get("rent_min")),
+                _int_or_missing(row.get("area_min"), 100),
+                _int_or_missing(row.get("building_built_age_years")),
+            )
+        )
+        if len(self._docs) >= FLUSH_DOCS:
+            self._flush()
+
+    def _flush(self) -> None:
+        self.conn.executemany(f"INSERT INTO search_index_docs VALUES (?, ?, {', '.join('?' for _ in COLUMN_NAMES)})", self._docs)
+        self.conn.executemany("INSERT INTO search_index_postings VALUES (?, ?, ?)", self._postings)
+        self._docs = []
+        self._postings = []
+
+    def term_count(self, kind: int) -> int:
+        self._flush()
+        return self.conn.execute("SELECT COUNT(DISTINCT term) FROM search_index_postings WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def _iter_postings(self, kind: int) -> Iterator[bytes]:
+        # Doc ids ascend within a term, so each posting list is delta-encoded as it streams past.
+        rows = self.conn.execute(
+            "SELECT term, doc_id FROM search_index_postings WHERE kind = ? ORDER BY term, doc_id", (kind,)
+        )
+        term = None
+        previous = 0
+        for next_term, doc_id in rows:
+            if next_term != term:
+                yield (b"]," if term is not None else b"") + _json_text(next_term) + b":[" + str(doc_id).encode()
+                term = next_term
+            else:
+                yield b"," + str(doc_id - previous).encode()
+            previous = doc_id
+        if term is not None:
+            yield b"]"
+
+    def _iter_values(self, sql: str) -> Iterator[bytes]:
+        for index, (value,) in enumerate(self.conn.execute(sql)):
+            yield (b"," if index else b"") + _json_text(value)
+
+    def iter_json(self) -> Iterator[bytes]:
+        self._flush()
+        yield b'{"version":%d,"count":%d,"missing":%d,"ids":[' % (SEARCH_INDEX_VERSION, self.count, MISSING_NUMBER)
+        yield from self._iter_values("SELECT id FROM search_index_docs ORDER BY doc_id")
+        yield b'],"tokens":{'
+        yield from self._iter_postings(TOKEN_KIND)
+        yield b'},"bigrams":{'
+        yield from self._iter_postings(BIGRAM_KIND)
+        yield b'},"columns":{'
+        for index, name in enumerate(COLUMN_NAMES):
+            yield (b"," if index else b"") + _json_text(name) + b":["
+            yield from self._iter_values(f"SELECT {name} FROM search_index_docs ORDER BY doc_id")
+            yield b"]"
+        yield b"}}"
+
+    def payload(self) -> dict:
+        return json.loads(b"".join(self.iter_json()))
+
+
+def decode_postings(deltas: list[int]) -> list[int]:
+    doc_ids = []
+    current = 0
+    for delta in deltas:
+        current += delta
+        doc_ids.append(current)
+    return doc_ids
+
+
+def candidate_ids(payload: dict, query: str) -> list[str]:
+    # Superset of the buildings whose name/address contains the query; callers confirm against the row.
+    normalized = normalize_search_text(query)
+    if not normalized:
+        return list(payload["ids"])
+    grams = char_bigrams(normalized)
+    if not grams:
+        matches = {
+            doc_id
+            for key, postings in {**payload["tokens"], **payload["bigrams"]}.items()
+            if normalized in key
+            for doc_id in decode_postings(postings)
+        }
+        return [payload["ids"][doc_id] for doc_id in sorted(matches)]
+    candidates: set[int] | None = None
+    for gram in sorted(grams, key=lambda g: len(payload["bigrams"].get(g, []))):
+        doc_ids = set(decode_postings(payload["bigrams"].get(gram, [])))
+        candidates = doc_ids if candidates is None else candidates & doc_ids
+        if not candidates:
+            return []
+    return [payload["ids"][doc_id] for doc_id in sorted(candidates or ())]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import math
+import unicodedata
+
+from tatemono_map.cli.pdf_batch_run import WARD_NAMES
+
+TILE_ZOOM = 13
+OTHER_WARD_SLUG = "other"
+WARD_SLUGS = {
+    "門司区": "moji",
+    "小倉北区": "kokurakita",
+    "小倉南区": "kokuraminami",
+    "戸畑区": "tobata",
+    "八幡東区": "yahatahigashi",
+    "八幡西区": "yahatanishi",
+    "若松区": "wakamatsu",
+}
+WARD_NAMES_BY_SLUG = {slug: ward for ward, slug in WARD_SLUGS.items()}
+
+
+def ward_slug(address: object) -> str:
+    text = unicodedata.normalize("NFKC", str(address or ""))
+    positions = [(text.find(ward), ward) for ward in WARD_NAMES if ward in text]
+    return WARD_SLUGS.get(min(positions)[1], OTHER_WARD_SLUG) if positions else OTHER_WARD_SLUG
+
+
+def tile_for(lat: object, lng: object, zoom: int = TILE_ZOOM) -> tuple[int, int] | None:
+    try:
+        lat_f, lng_f = float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+    if not (-85.0511 <= lat_f <= 85.0511 and -180.0 <= lng_f <= 180.0):
+        return None
+    n = 2**zoom
+    x = min(n - 1, int((lng_f + 180.0) / 360.0 * n))
+    y = min(n - 1, int((1.0 - math.asinh(math.tan(math.radians(lat_f))) / math.pi) / 2.0 * n))
+    return x, y
+
+
+def tile_bbox(x: int, y: int, zoom: int = TILE_ZOOM) -> list[float]:
+    n = 2**zoom
+
+    def lat_of(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return [round(x / n * 360.0 - 180.0, 6), round(lat_of(y + 1), 6), round((x + 1) / n * 360.0 - 180.0, 6), round(lat_of(y), 6)]
@@ -0,0 +1,285 @@
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from tatemono_map.api import database
+from tatemono_map.api.main import app
+from tatemono_map.api.search import SEARCH_TRIGGERS
+from tatemono_map.api.spatial import (
+    BBOX_KEYS_SQL,
+    BUILDING_TRIGGERS,
+    SUMMARY_TRIGGERS,
+    bbox_params,
+    ensure_spatial_index,
+    spatial_index_present,
+)
+from tatemono_map.db.repo import connect
+from tatemono_map.db.search_queue import drain_search_queue
+from tatemono_map.normalize.building_summaries import rebuild
+
+
+def _client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("SQLITE_DB_PATH", str(tmp_path / "api.sqlite3"))
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    database.reset_engine()
+    return TestClient(app)
+
+
+def test_api_migrates_once_at_startup_and_serves_reads_without_init_db(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        assert database.api_schema_version() == database.API_SCHEMA_VERSION
+
+        conn = sqlite3.connect(tmp_path / "api.sqlite3")
+        conn.execute(
+            "INSERT INTO building_summaries(building_key, name, address, rent_min, last_updated) VALUES ('k1', '読取専用', '福岡県', 50000, '2026-03-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        def fail_init_db(*args, **kwargs):
+            raise AssertionError("init_db must not run per request")
+
+        monkeypatch.setattr(database, "init_db", fail_init_db)
+        listed = client.get("/buildings")
+        assert listed.status_code == 200
+        assert [row["building_key"] for row in listed.json()] == ["k1"]
+        assert client.get("/buildings/k1").json()["rent_yen"] == {"min": 50000, "max": None}
+    database.reset_engine()
+
+
+def test_api_startup_remigrates_when_summary_columns_are_missing(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch):
+        pass
+    conn = sqlite3.connect(tmp_path / "api.sqlite3")
+    conn.execute("DROP TABLE building_summaries")
+    conn.execute("CREATE TABLE building_summaries (building_key TEXT PRIMARY KEY, name TEXT, address TEXT)")
+    conn.commit()
+    conn.close()
+
+    with _client(tmp_path, monkeypatch) as client:
+        assert client.get("/buildings").status_code == 200
+    conn = sqlite3.connect(tmp_path / "api.sqlite3")
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(building_summaries)")}
+    conn.close()
+    assert set(database.API_REQUIRED_SUMMARY_COLUMNS) <= columns
+    database.reset_engine()
+
+
+def test_list_buildings_keyset_cursor_pages_through_summaries(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        assert client.get("/buildings").json() == []
+
+        conn = sqlite3.connect(tmp_path / "api.sqlite3")
+        rows = [(f"k{idx}", f"建物{idx}", ["2026-03-02", "2026-03-01", None][idx % 3]) for idx in range(8)]
+        conn.executemany("INSERT INTO building_summaries(building_key, name, last_updated) VALUES (?, ?, ?)", rows)
+        conn.commit()
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                """
+                EXPLAIN QUERY PLAN SELECT building_key FROM building_summaries
+                WHERE (COALESCE(last_updated, ''), building_key) < (?, ?)
+                ORDER BY COALESCE(last_updated, '') DESC, building_key DESC LIMIT 3
+                """,
+                ("2026-03-02", "k9"),
+            )
+        )
+        conn.close()
+        assert database.SUMMARY_KEYSET_INDEX in plan
+        assert "TEMP B-TREE" not in plan
+
+        expected = [key for key, _name, _updated in sorted(rows, key=lambda row: (row[2] or "", row[0]), reverse=True)]
+        seen = []
+        response = client.get("/buildings", params={"limit": 3})
+        while True:
+            assert response.status_code == 200
+            seen.extend(row["building_key"] for row in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            response = client.get("/buildings", params={"limit": 3, "cursor": next_cursor})
+        assert seen == expected
+        assert client.get("/buildings", params={"cursor": "not-a-cursor"}).status_code == 400
+    database.reset_engine()
+
+
+def test_list_buildings_bbox_uses_rtree_and_follows_summary_updates(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        conn = sqlite3.connect(tmp_path / "api.sqlite3")
+        conn.executemany(
+            "INSERT INTO building_summaries(building_key, name, last_updated, lat, lon) VALUES (?, ?, ?, ?, ?)",
+            [
+                ("kokura1", "小倉1", "2026-03-02", 33.8835, 130.8756),
+                ("kokura2", "小倉2", "2026-03-01", 33.8840, 130.8760),
+                ("tobata", "戸畑", "2026-03-03", 33.8950, 130.8300),
+                ("nocoord", "座標なし", "2026-03-04", None, None),
+            ],
+        )
+        conn.commit()
+
+        bbox = {"min_lat": 33.88, "max_lat": 33.89, "min_lng": 130.87, "max_lng": 130.88}
+        listed = client.get("/buildings", params=bbox)
+        assert [row["building_key"] for row in listed.json()] == ["kokura1", "kokura2"]
+        paged = client.get("/buildings", params=bbox | {"limit": 1})
+        assert [row["building_key"] for row in paged.json()] == ["kokura1"]
+        cursor = paged.headers["X-Next-Cursor"]
+        assert [row["building_key"] for row in client.get("/buildings", params=bbox | {"cursor": cursor}).json()] == [
+            "kokura2"
+        ]
+
+        conn.execute("UPDATE building_summaries SET lat = 33.885, lon = 130.876 WHERE building_key = 'tobata'")
+        conn.execute("DELETE FROM building_summaries WHERE building_key = 'kokura2'")
+        conn.commit()
+        conn.close()
+        assert [row["building_key"] for row in client.get("/buildings", params=bbox).json()] == ["tobata", "kokura1"]
+
+        whole = client.get("/buildings/clusters", params={"zoom": 5}).json()
+        assert [(cluster["count"], cluster["building_key"]) for cluster in whole] == [(2, None)]
+        close = client.get("/buildings/clusters", params=bbox | {"zoom": 22}).json()
+        assert sorted(cluster["building_key"] for cluster in close) == ["kokura1", "tobata"]
+        assert client.get("/buildings/clusters", params={"zoom": 23}).status_code == 422
+    database.reset_engine()
+
+
+def test_spatial_index_falls_back_to_canonical_google_coordinates(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{(tmp_path / 'ingest.sqlite3').as_posix()}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE buildings (building_id TEXT PRIMARY KEY, google_lat REAL, google_lng REAL)"))
+        conn.execute(text("CREATE TABLE building_summaries (building_key TEXT PRIMARY KEY, lat REAL, lon REAL)"))
+        conn.execute(text("INSERT INTO buildings VALUES ('b1', 33.88, 130.87)"))
+        conn.execute(text("INSERT INTO building_summaries VALUES ('b1', NULL, NULL)"))
+        ensure_spatial_index(conn)
+        assert spatial_index_present(conn)
+
+        def indexed():
+            return conn.execute(text(BBOX_KEYS_SQL), bbox_params(33.0, 34.0, 130.0, 131.0)).all()
+
+        assert indexed() == [("b1", 33.88, 130.87)]
+        conn.execute(text("UPDATE buildings SET google_lat = 33.9, google_lng = 130.9 WHERE building_id = 'b1'"))
+        assert indexed() == [("b1", 33.9, 130.9)]
+        conn.execute(text("INSERT INTO building_summaries VALUES ('b2', 33.5, 130.5)"))
+        conn.execute(text("UPDATE buildings SET google_lat = NULL, google_lng = NULL"))
+        assert indexed() == [("b2", 33.5, 130.5)]
+    engine.dispose()
+
+
+def test_search_ranks_normalized_fts_hits_and_follows_updates(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        conn = sqlite3.connect(tmp_path / "api.sqlite3")
+        conn.executemany(
+            "INSERT INTO building_summaries(building_key, name, address) VALUES (?, ?, ?)",
+            [
+                ("a", "ＳＫＹ　ＴＯＷＥＲ小倉", "福岡県北九州市小倉北区米町一丁目2番3号"),
+                ("b", "グランドハイツ", "福岡県北九州市小倉北区スカイタワー通り"),
+                ("c", "Sky Court 戸畑", "福岡県北九州市戸畑区中本町"),
+            ],
+        )
+        assert drain_search_queue(conn) == 3
+        conn.commit()
+
+        assert [row["building_key"] for row in client.get("/search", params={"q": "sky tower"}).json()] == ["a"]
+        assert sorted(row["building_key"] for row in client.get("/search", params={"q": "sky"}).json()) == ["a", "c"]
+        assert [row["building_key"] for row in client.get("/search", params={"q": "米町1丁目2"}).json()] == ["a"]
+        assert [row["building_key"] for row in client.get("/search", params={"q": "戸畑"}).json()] == ["c"]
+        assert client.get("/search", params={"q": '"%'}).json() == []
+
+        conn.execute("UPDATE building_summaries SET name = 'スカイタワー' WHERE building_key = 'c'")
+        conn.commit()
+        # Undrained changes are invisible to /search, which never writes; startup folds them in.
+        assert [row["building_key"] for row in client.get("/search", params={"q": "スカイタワー"}).json()] == ["b"]
+        drain_search_queue(conn)
+        conn.commit()
+        # A name hit outranks an address hit.
+        assert [row["building_key"] for row in client.get("/search", params={"q": "スカイタワー"}).json()] == ["c", "b"]
+        conn.execute("DELETE FROM building_summaries WHERE building_key = 'b'")
+        drain_search_queue(conn)
+        conn.commit()
+        conn.close()
+        hits = client.get("/search", params={"q": "スカイタワー"}).json()
+        assert [row["building_key"] for row in hits] == ["c"]
+        assert hits[0]["name"] == "スカイタワー"
+    database.reset_engine()
+
+
+def test_search_falls_back_to_orm_buildings_without_summaries(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        payload = {"name": "ハイツ足立", "address": "北九州市小倉北区足立2丁目", "lat": 33.87, "lng": 130.89}
+        created = client.post("/buildings", json=payload).json()
+        client.post("/buildings", json=payload | {"name": "別館", "address": "北九州市八幡西区"})
+        hits = client.get("/search", params={"q": "ﾊｲﾂ"}).json()
+        assert [row["id"] for row in hits] == [created["id"]]
+        assert [row["id"] for row in client.get("/search", params={"q": "足立2-"}).json()] == [created["id"]]
+    database.reset_engine()
+
+
+def test_health_reuses_engine_and_reads_share_bounded_pool(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{(tmp_path / 'health.sqlite3').as_posix()}")
+        assert client.get("/health").json()["db"] == "ok"
+        engine = database.get_health_engine(os.environ["DATABASE_URL"])
+        assert client.get("/health").json()["db"] == "ok"
+        assert database.get_health_engine(os.environ["DATABASE_URL"]) is engine
+
+        read_engine = database.get_read_engine()
+        assert read_engine.pool.size() == database.READ_POOL_SIZE
+        assert app.state.read_limiter.total_tokens == database.READ_POOL_SIZE
+        with ThreadPoolExecutor(max_workers=database.READ_POOL_SIZE * 3) as executor:
+            statuses = list(executor.map(lambda _: client.get("/buildings/missing").status_code, range(60)))
+        assert statuses == [404] * 60
+        assert read_engine.pool.checkedout() == 0
+    database.reset_engine()
+
+
+def test_building_page_serves_real_summary_key(tmp_path, monkeypatch):
+    with _client(tmp_path, monkeypatch) as client:
+        conn = sqlite3.connect(tmp_path / "api.sqlite3")
+        conn.execute("INSERT INTO building_summaries(building_key, name, rent_min) VALUES ('k1', '実在建物', 48000)")
+        conn.commit()
+        conn.close()
+
+        page = client.get("/b/k1")
+        assert page.status_code == 200
+        assert page.json()["name"] == "実在建物"
+        assert page.json()["rent_yen"]["min"] == 48000
+        assert client.get("/b/missing").status_code == 404
+        assert client.get("/b/demo").json()["building_key"] == "demo"
+    database.reset_engine()
+
+
+def test_summary_rebuild_on_api_migrated_db_keeps_spatial_and_search_in_sync(tmp_path, monkeypatch):
+    db = tmp_path / "shared.sqlite3"
+    conn = connect(db)
+    conn.executemany(
+        "INSERT INTO buildings(building_id, canonical_name, canonical_address, google_lat, google_lng) VALUES (?, ?, ?, ?, ?)",
+        [("b1", "リバーサイド小倉", "福岡県北九州市小倉北区", 33.88, 130.87), ("b2", "戸畑ハイツ", "福岡県北九州市戸畑区", None, None)],
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db))
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    database.reset_engine()
+    assert database.migrate_db()
+    database.reset_engine()
+
+    assert rebuild(str(db)) == 2
+    conn = connect(db)
+    conn.execute("INSERT INTO buildings(building_id, canonical_name, canonical_address) VALUES ('b3', '門司レジデンス', '福岡県北九州市門司区')")
+    conn.commit()
+    conn.close()
+    assert rebuild(str(db)) == 3
+
+    conn = sqlite3.connect(db)
+    geo = conn.execute("SELECT building_key, lat, lon FROM building_summaries_geo ORDER BY building_key").fetchall()
+    rtree = conn.execute("SELECT COUNT(*) FROM building_summaries_rtree").fetchone()[0]
+    pending = conn.execute("SELECT COUNT(*) FROM building_search_pending").fetchone()[0]
+    docs = {row[0]: row[1] for row in conn.execute("SELECT ref, name FROM building_search_docs WHERE kind = 'summary'")}
+    triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    conn.close()
+    assert geo == [("b1", 33.88, 130.87)]
+    assert rtree == 1
+    assert pending == 0
+    assert docs == {"b1": "リバ-サイド小倉", "b2": "戸畑ハイツ", "b3": "門司レジデンス"}
+    assert set(SUMMARY_TRIGGERS) | set(BUILDING_TRIGGERS) | set(SEARCH_TRIGGERS) <= triggers
@@ -1,10 +1,18 @@
 from pathlib import Path
+
+import pytest
 from tatemono_map.building_registry.ingest_building_facts import ingest_building_facts_csv
-from tatemono_map.building_registry.matcher import match_building
+from tatemono_map.building_registry.matcher import BuildingMatchIndex, match_building
 from tatemono_map.building_registry.seed_from_ui import seed_from_ui_csv
 from tatemono_map.db.repo import connect
 
 
+@pytest.fixture(autouse=True)
+def _review_csvs_in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Ingest writes its review CSVs under the relative tmp/review; keep them out of the work tree.
+    monkeypatch.chdir(tmp_path)
+
+
 def _seed(db_path: Path, rows: str) -> None:
     seed_csv = db_path.parent / "seed.csv"
     seed_csv.write_text(
@@ -119,3 +127,40 @@ def test_matcher_alias_requires_address_match_to_avoid_sibling_mix(tmp_path: Pat
 
     assert result.building_id is not None
     assert result.reason != "alias_exact"
+
+
+def test_match_index_incremental_add_matches_fresh_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "match_index.sqlite3"
+    _seed(
+        db_path,
+        "テストマンション,福岡県北九州市小倉北区紺屋町8-3,ui:a,\n"
+        "サンライフ恒見,福岡県北九州市門司区恒見町1-1,ui:b,\n",
+    )
+
+    conn = connect(str(db_path))
+    index = BuildingMatchIndex.from_connection(conn)
+    conn.execute(
+        """
+        INSERT INTO buildings(building_id, canonical_name, canonical_address, norm_name, norm_address)
+        VALUES ('late-b', '後発マンション', '福岡県北九州市小倉北区紺屋町8-3', '後発マンション', '北九州市小倉北区紺屋町8-3')
+        """
+    )
+    index.add("late-b", "後発マンション", "北九州市小倉北区紺屋町8-3")
+    conn.execute(
+        """
+        INSERT INTO building_sources(source, evidence_id, building_id, raw_name, raw_address)
+        VALUES ('test', 'src:1', 'late-b', '別名ハイツ', '北九州市小倉北区紺屋町8-3')
+        """
+    )
+    index.add_source("test", "src:1", "late-b", "別名ハイツ")
+
+    queries = [
+        ("テストマンション", "北九州市小倉北区紺屋町8-3"),
+        ("後発マンション", "北九州市小倉北区紺屋町83番"),
+        ("別名ハイツ", "北九州市小倉北区紺屋町8-3"),
+        ("サンライフ恒見", "北九州市門司区恒見町1-1"),
+        ("未知マンション", "北九州市門司区恒見町"),
+    ]
+    for name, address in queries:
+        assert index.match(name, address) == match_building(conn, name, address)
+    conn.close()
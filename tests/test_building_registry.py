@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from tatemono_map.building_registry.ingest_master_import import ingest_master_import_csv
 from tatemono_map.building_registry.ingest_master_import import set_current_snapshot
 from tatemono_map.building_registry.keys import make_alias_key
@@ -7,6 +9,12 @@ from tatemono_map.building_registry.seed_from_ui import seed_from_ui_csv
 from tatemono_map.db.repo import connect
 
 
+@pytest.fixture(autouse=True)
+def _review_csvs_in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Ingest writes its review CSVs under the relative tmp/review; keep them out of the work tree.
+    monkeypatch.chdir(tmp_path)
+
+
 def test_seed_idempotency_preserves_canonical(tmp_path: Path) -> None:
     db_path = tmp_path / "registry.sqlite3"
     seed_csv = tmp_path / "buildings_seed_ui.csv"
@@ -75,7 +83,7 @@ def test_weekly_update_idempotency_and_review_csv(tmp_path: Path) -> None:
     assert tuple(canonical) == ("Aマンション", "福岡県北九州市小倉北区魚町1-1-1")
     conn.close()
 
-    review_dir = Path("tmp/review")
+    review_dir = tmp_path / "tmp" / "review"
     assert list(review_dir.glob("suspects_*.csv"))
     assert list(review_dir.glob("unmatched_listings_*.csv"))
 
@@ -420,3 +428,44 @@ def test_future_ingest_matches_auto_seeded_building_stably(tmp_path: Path) -> No
 
     assert len(ids) == 2
     assert ids[0][1] == ids[1][1]
+
+
+def test_close_conflict_candidates_match_full_scan(tmp_path: Path) -> None:
+    import random
+    from difflib import SequenceMatcher
+
+    from tatemono_map.building_registry.candidates import CharNgramCandidateIndex
+    from tatemono_map.building_registry.ingest_master_import import _has_close_conflict
+    from tatemono_map.building_registry.matcher import BuildingMatchIndex
+
+    def full_scan(rows: list[tuple[str, str]], name: str, address: str) -> bool:
+        scores = []
+        for existing_name, existing_addr in rows:
+            name_score = SequenceMatcher(None, name, existing_name).ratio()
+            addr_score = SequenceMatcher(None, address, existing_addr).ratio()
+            total = name_score * 0.65 + addr_score * 0.35
+            if total >= 0.82:
+                scores.append(total)
+        scores.sort(reverse=True)
+        return bool(scores) and (scores[0] >= 0.9 or (len(scores) > 1 and scores[0] - scores[1] < 0.03))
+
+    short = CharNgramCandidateIndex([("b1", "AXBXC", "")], min_name_ratio=0.72)
+    assert [c.building_id for c in short.candidates("ABC", "")] == ["b1"]
+
+    rng = random.Random(7)
+    parts = ["サン", "ライフ", "恒見", "グラン", "小倉", "ハイツ", "マンション", "2", "II", "東"]
+    streets = ["魚町1-1-1", "魚町1-1-2", "紺屋町8-3", "城野2-2-2", "恒見町1-1"]
+    index = BuildingMatchIndex()
+    rows: list[tuple[str, str]] = []
+    for i in range(120):
+        name = "".join(rng.sample(parts, rng.randint(1, 3)))
+        address = f"北九州市小倉北区{rng.choice(streets)}"
+        index.add(f"b{i}", name, address)
+        rows.append((name, address))
+        if i == 10:
+            _has_close_conflict(index, name, address)
+
+    for _ in range(200):
+        name = "".join(rng.sample(parts, rng.randint(1, 3)))
+        address = f"北九州市小倉北区{rng.choice(streets)}"
+        assert _has_close_conflict(index, name, address) == full_scan(rows, name, address)
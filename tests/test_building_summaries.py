@@ -1,5 +1,5 @@
 from tatemono_map.db.repo import ListingRecord, connect, upsert_listing
-from tatemono_map.normalize.building_summaries import rebuild
+from tatemono_map.normalize.building_summaries import rebuild, refresh, verify
 from tatemono_map.util.building_age import age_years_from_built_year_month
 
 
@@ -389,3 +389,143 @@ def test_non_current_source_run_does_not_replace_other_sources_current_snapshot(
     assert a["rent_yen_min"] == 65000
     assert a["rent_yen_max"] == 65000
     assert b["vacancy_count"] == 1
+
+
+def test_rebuild_rewrites_live_table_in_one_transaction(tmp_path):
+    db = tmp_path / "rebuild.sqlite3"
+    conn = connect(db)
+    conn.execute("ALTER TABLE building_summaries ADD COLUMN lat REAL")
+    conn.execute("CREATE INDEX idx_test_summaries_last_updated ON building_summaries(last_updated)")
+    conn.execute("CREATE TABLE summary_audit (building_key TEXT)")
+    conn.execute(
+        "CREATE TRIGGER summary_audit_ai AFTER INSERT ON building_summaries BEGIN "
+        "INSERT INTO summary_audit VALUES (NEW.building_key); END"
+    )
+    conn.execute(
+        "CREATE TRIGGER buildings_touch_summaries AFTER UPDATE ON buildings BEGIN "
+        "UPDATE building_summaries SET name = NEW.canonical_name WHERE building_key = NEW.building_id; END"
+    )
+    triggers_before = {row[0] for row in conn.execute("SELECT sql FROM sqlite_master WHERE type='trigger'")}
+    conn.execute("INSERT INTO building_summaries(building_key, name) VALUES ('stale', 'old')")
+    for i in range(5):
+        conn.execute(
+            "INSERT INTO buildings(building_id, canonical_name, canonical_address) VALUES (?, ?, '東京都A')",
+            (f"b{i}", f"B{i}マンション"),
+        )
+    conn.commit()
+    conn.close()
+
+    assert rebuild(str(db), chunk_size=2) == 5
+    assert rebuild(str(db), chunk_size=2) == 5
+
+    conn = connect(db)
+    keys = [row[0] for row in conn.execute("SELECT building_key FROM building_summaries ORDER BY building_key")]
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(building_summaries)")}
+    audited = sorted({row[0] for row in conn.execute("SELECT building_key FROM summary_audit")})
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='building_summaries'")}
+    triggers_after = {row[0] for row in conn.execute("SELECT sql FROM sqlite_master WHERE type='trigger'")}
+    conn.close()
+
+    assert keys == [f"b{i}" for i in range(5)]
+    assert "lat" in columns
+    assert audited == [*(f"b{i}" for i in range(5)), "stale"]
+    assert "idx_test_summaries_last_updated" in indexes
+    assert triggers_after == triggers_before
+
+
+def test_incremental_refresh_matches_full_rebuild(tmp_path):
+    db = tmp_path / "incremental.sqlite3"
+    conn = connect(db)
+    conn.execute("INSERT INTO buildings(building_id, canonical_name, canonical_address, age_years) VALUES ('b1', 'Aマンション', '東京都A', 5)")
+    conn.execute("INSERT INTO buildings(building_id, canonical_name, canonical_address) VALUES ('b2', 'Bマンション', '東京都B')")
+    conn.execute("INSERT INTO ingest_runs(id, source, snapshot_key, status) VALUES (1, 'ulucks', 's1', 'success')")
+    conn.execute("INSERT INTO ingest_runs(id, source, snapshot_key, status) VALUES (2, 'ulucks', 's2', 'success')")
+    conn.executemany(
+        """
+        INSERT INTO listings(listing_key, building_key, name, address, rent_yen, area_sqm, layout, updated_at, source_kind, source_url, ingest_run_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'ulucks', ?, ?)
+        """,
+        [
+            ("l1", "b1", "Aマンション", "東京都A", 50000, 20.0, "1K", "2026-01-01", "u1", 1),
+            ("l2", "b2", "Bマンション", "東京都B", 60000, 25.0, "1DK", "2026-01-02", "u2", 1),
+            ("l3", "raw-b2", "Bマンション", "東京都B", 65000, 26.0, "1LDK", "2026-01-03", "u3", 2),
+        ],
+    )
+    conn.execute("INSERT INTO current_ingest_snapshots(source, ingest_run_id) VALUES ('ulucks', 1)")
+    conn.commit()
+    conn.close()
+
+    assert rebuild(str(db)) == 2
+    assert verify(str(db)) == []
+
+    conn = connect(db)
+    conn.execute("INSERT INTO building_key_aliases(alias_key, canonical_key) VALUES ('raw-b2', 'b2')")
+    conn.execute("UPDATE current_ingest_snapshots SET ingest_run_id = 2 WHERE source = 'ulucks'")
+    conn.execute("UPDATE listings SET ingest_run_id = 2, rent_yen = 55000 WHERE listing_key = 'l1'")
+    conn.execute("UPDATE buildings SET structure = 'RC' WHERE building_id = 'b1'")
+    conn.execute("UPDATE buildings SET norm_name = 'ignored' WHERE building_id = 'b2'")
+    conn.execute("INSERT INTO listings(listing_key, building_key, name, address, rent_yen, ingest_run_id) VALUES ('l4', 'orphan', 'C荘', '東京都C', 40000, 2)")
+    conn.commit()
+    conn.close()
+
+    assert verify(str(db)) == ["b1", "b2", "orphan"]
+    assert refresh(str(db)) == 3
+    assert verify(str(db)) == []
+
+    conn = connect(db)
+    b1 = conn.execute("SELECT rent_yen_min, structure FROM building_summaries WHERE building_key = 'b1'").fetchone()
+    b2 = conn.execute("SELECT vacancy_count, rent_yen_min FROM building_summaries WHERE building_key = 'b2'").fetchone()
+    conn.execute("DELETE FROM listings WHERE listing_key = 'l4'")
+    conn.commit()
+    conn.close()
+
+    assert (b1["rent_yen_min"], b1["structure"]) == (55000, "RC")
+    assert (b2["vacancy_count"], b2["rent_yen_min"]) == (1, 65000)
+    assert refresh(str(db)) == 2
+    assert verify(str(db)) == []
+
+    conn = connect(db)
+    pending = conn.execute("SELECT COUNT(*) AS c FROM building_summary_changes").fetchone()["c"]
+    conn.close()
+    assert pending == 0
+
+
+def test_sql_aggregates_match_row_reference(tmp_path):
+    db = tmp_path / "parity.sqlite3"
+    conn = connect(db)
+    conn.execute("INSERT INTO buildings(building_id, canonical_name, canonical_address, age_years, structure) VALUES ('b1', 'Aマンション', '東京都A', 7, 'RC')")
+    conn.execute("INSERT INTO buildings(building_id, canonical_name, canonical_address, property_kind, avg_rent_yen) VALUES ('b2', 'B分譲', '東京都B', 'bunjo', 90000)")
+    conn.execute("INSERT INTO buildings(building_id, canonical_name, canonical_address, avg_rent_yen) VALUES ('b3', 'C荘', '東京都C', 48000)")
+    conn.execute("INSERT INTO building_key_aliases(alias_key, canonical_key) VALUES ('raw-a', 'b1')")
+    conn.executemany(
+        """
+        INSERT INTO listings(
+            listing_key, building_key, name, address, rent_yen, area_sqm, layout, move_in_date, updated_at,
+            age_years, structure, availability_raw, structure_raw, built_year_month, built_age_years,
+            availability_date, availability_flag_immediate
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            ("l1", "b1", "A", "東京都A", 50000, 20.0, "1K", "2026-03-01", "2026-01-01", 5, "RC", "退去予定", None, "2019-04", None, None, 0),
+            ("l2", "raw-a", "A別名", "東京都A", None, None, " 1K", "", "", 5, "S", "-", "RC", "2019-04", 6, "2026-05-01", None),
+            ("l3", "b1", "A", "東京都A", 70000, 31.5, "", " ", "2026-02-01", None, "", None, None, "", None, "bad", 0),
+            ("l4", "b2", "B", "東京都B", 80000, 60.0, "3LDK", None, None, None, None, "即入", None, None, None, None, 1),
+            ("l5", "orphan", "D荘", "東京都D", None, 18.0, None, None, "2026-01-05", 30, "木造", "なし", None, None, None, None, None),
+            ("l6", "orphan", "D荘(新)", "東京都D2", 39000, None, "1R", "即入居", None, 12, "木造", None, None, None, None, None, None),
+            ("l7", "", "空", "東京都E", 10000, 10.0, "1R", None, None, None, None, None, None, None, None, None, None),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    assert rebuild(str(db)) == 4
+    assert verify(str(db)) == []
+
+    conn = connect(db)
+    orphan = conn.execute("SELECT name, address, rent_yen_min, area_sqm_max, vacancy_count FROM building_summaries WHERE building_key = 'orphan'").fetchone()
+    b3 = conn.execute("SELECT rent_yen_min, vacancy_count, last_updated FROM building_summaries WHERE building_key = 'b3'").fetchone()
+    conn.close()
+
+    assert tuple(orphan) == ("D荘(新)", "東京都D2", 39000, 18.0, 2)
+    assert tuple(b3) == (48000, 0, None)
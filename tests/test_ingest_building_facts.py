@@ -3,12 +3,20 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
+import pytest
+
 from tatemono_map.db.repo import connect
 from tatemono_map.normalize.building_summaries import rebuild
 from tatemono_map.building_registry.ingest_building_facts import ingest_building_facts_csv
 from tatemono_map.util.building_age import age_years_from_built_year_month
 
 
+@pytest.fixture(autouse=True)
+def _review_csvs_in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Ingest writes its review CSVs under the relative tmp/review; keep them out of the work tree.
+    monkeypatch.chdir(tmp_path)
+
+
 def _write_facts_csv(path: Path, rows: list[dict[str, str]]) -> None:
     with path.open("w", encoding="utf-8-sig", newline="") as fh:
         writer = csv.DictWriter(
@@ -655,3 +655,212 @@ def test_ulucks_parse_extracts_availability_from_header_pattern(tmp_path: Path):
     assert len(result.df) == 1
     row = result.df.iloc[0]
     assert row["availability_raw"] == "2月28日"
+
+
+def test_main_workers_output_matches_serial_run(tmp_path: Path, monkeypatch):
+    from tatemono_map.cli import pdf_batch_run
+
+    src = tmp_path / "ulucks"
+    (src / "nested").mkdir(parents=True)
+    for name in ["b.pdf", "a.pdf", "nested/c.pdf"]:
+        (src / name).write_bytes(b"%PDF-1.4\n%mock " + name.encode())
+
+    outputs = {}
+    for workers in ("1", "3"):
+        out_dir = tmp_path / f"out_{workers}"
+        monkeypatch.setattr("sys.argv", ["pdf_batch_run", "--ulucks-dir", str(src), "--out-dir", str(out_dir), "--workers", workers])
+        assert pdf_batch_run.main() == 0
+        outputs[workers] = {name: (out_dir / name).read_bytes() for name in ["manifest.csv", "stats.csv", "qc_report.txt", "final.csv"]}
+
+    assert outputs["1"] == outputs["3"]
+    assert outputs["1"]["manifest.csv"].index(b'"a.pdf"') < outputs["1"]["manifest.csv"].index(b'"b.pdf"')
+
+
+ULUCKS_HEADER = ["物件名", "所在地", "号室", "賃料", "共益費", "間取詳細", "面積", "築年", "構造", "入居/退予"]
+
+
+def _write_text_pdf(path: Path, title: str, table: list[list[str]]) -> None:
+    # Ruled table drawn in an Identity-H font whose ToUnicode map covers exactly the characters used,
+    # so pypdf and pdfplumber both extract real text and tables.
+    chars = sorted({ch for text in [title, *(cell for row in table for cell in row)] for ch in text})
+    cid = {ch: idx + 1 for idx, ch in enumerate(chars)}
+
+    def hex_text(text: str) -> str:
+        return "".join(f"{cid[ch]:04X}" for ch in text)
+
+    ops = [f"BT /F1 12 Tf 20 570 Td <{hex_text(title)}> Tj ET"]
+    for r, row in enumerate(table):
+        for c, cell in enumerate(row):
+            x, y = 20 + c * 80, 520 - r * 20
+            ops.append(f"{x} {y} 80 20 re S")
+            if cell:
+                ops.append(f"BT /F1 8 Tf {x + 2} {y + 6} Td <{hex_text(cell)}> Tj ET")
+    content = "\n".join(ops).encode()
+    cmap = "\n".join(
+        [
+            "/CIDInit /ProcSet findresource begin 12 dict begin begincmap",
+            "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def",
+            "/CMapName /Adobe-Identity-UCS def /CMapType 2 def",
+            "1 begincodespacerange <0000> <FFFF> endcodespacerange",
+            f"{len(chars)} beginbfchar",
+            *(f"<{cid[ch]:04X}> <{ch.encode('utf-16-be').hex().upper()}>" for ch in chars),
+            "endbfchar endcmap CMapName currentdict /CMap defineresource pop end end",
+        ]
+    ).encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 842 595] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type0 /BaseFont /TestGothic /Encoding /Identity-H /DescendantFonts [6 0 R] /ToUnicode 7 0 R >>",
+        b"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /TestGothic /FontDescriptor 8 0 R"
+        b" /CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> /DW 1000 >>",
+        b"<< /Length %d >>\nstream\n" % len(cmap) + cmap + b"\nendstream",
+        b"<< /Type /FontDescriptor /FontName /TestGothic /Flags 4 /FontBBox [0 -120 1000 880] /ItalicAngle 0"
+        b" /Ascent 880 /Descent -120 /CapHeight 700 /StemV 80 >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def test_iter_pdf_outcomes_workers_parse_real_pdfs_like_serial_run(tmp_path: Path, monkeypatch):
+    from tatemono_map.cli import pdf_batch_run as mod
+
+    src = tmp_path / "ulucks"
+    src.mkdir()
+    listings = {
+        "a.pdf": ["並列テストマンション", "魚町1-1", "101", "6.0万", "0.3万", "1K", "22.0㎡", "2023年1月", "RC", "2月28日"],
+        "b.pdf": ["並列テストハイツ", "京町2-2", "202", "5.5万", "0.2万", "1DK", "25.5㎡", "2019年4月", "S", "即入居"],
+        "c.pdf": ["並列テストコーポ", "紺屋町3-3", "303", "7.2万", "0.4万", "1LDK", "31.0㎡", "2021年9月", "RC", "3月15日"],
+    }
+    for name, row in listings.items():
+        _write_text_pdf(src / name, "ウラックス 空室一覧 小倉北区 2026年02月28日現在", [ULUCKS_HEADER, row])
+    (src / "broken.pdf").mkdir()
+    paths = [src / "a.pdf", src / "broken.pdf", src / "b.pdf", src / "c.pdf"]
+
+    serial = list(mod.iter_pdf_outcomes(paths, qc_mode="warn", workers=1))
+    parallel = list(mod.iter_pdf_outcomes(paths, qc_mode="warn", workers=2))
+
+    assert [o.manifest_row["file"] for o in parallel] == ["a.pdf", "broken.pdf", "b.pdf", "c.pdf"]
+    for one, many in zip(serial, parallel, strict=True):
+        assert (many.manifest_row, many.stats_row, many.qc_lines) == (one.manifest_row, one.stats_row, one.qc_lines)
+        assert (many.failed, many.error, many.sha256) == (one.failed, one.error, one.sha256)
+        assert (many.df is None and one.df is None) or many.df.equals(one.df)
+    parsed = [o for o in parallel if not o.error]
+    assert [o.stats_row["kind"] for o in parsed] == ["ulucks"] * 3
+    assert [o.df.iloc[0]["building_name"] for o in parsed] == [listings[name][0] for name in ("a.pdf", "b.pdf", "c.pdf")]
+    assert [o.df.iloc[0]["rent_man"] for o in parsed] == [6.0, 5.5, 7.2]
+
+    broken = parallel[1]
+    assert broken.failed and broken.stats_row["status"] == "ERROR"
+    assert broken.error.startswith("IsADirectoryError")
+
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr("sys.argv", ["pdf_batch_run", "--ulucks-dir", str(src), "--out-dir", str(out_dir), "--workers", "2"])
+    assert mod.main() == 2
+    assert '"ERROR"' in (out_dir / "stats.csv").read_text(encoding="utf-8-sig")
+
+
+def test_pdf_document_shares_one_handle_across_detect_and_parse(tmp_path: Path):
+    from pypdf import PdfWriter
+
+    from tatemono_map.cli import pdf_batch_run as mod
+
+    pdf = tmp_path / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(200, 200)
+    writer.write(str(pdf))
+
+    calls = {"open": 0, "extract_text": 0, "extract_tables": 0}
+
+    class _Page:
+        def extract_text(self):
+            calls["extract_text"] += 1
+            return "空室一覧"
+
+        def extract_tables(self):
+            calls["extract_tables"] += 1
+            return []
+
+    class _Pdf:
+        pages = [_Page()]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def _open(source):
+        calls["open"] += 1
+        assert not isinstance(source, str)
+        return _Pdf()
+
+    original_open = mod.pdfplumber.open
+    mod.pdfplumber.open = _open
+    try:
+        with mod.PdfDocument(pdf) as doc:
+            assert doc.sha256 == mod.sha256_file(pdf)
+            assert mod.page_count_fast(doc) == 1
+            assert mod.detect_pdf_kind(doc).kind == "non_vacancy"
+            assert mod._try_parse_ambiguous(doc) == ("non_vacancy", None)
+    finally:
+        mod.pdfplumber.open = original_open
+
+    assert calls == {"open": 1, "extract_text": 1, "extract_tables": 1}
+
+
+def test_main_parse_cache_skips_analysis_for_known_pdfs(tmp_path: Path, monkeypatch):
+    from tatemono_map.cli import pdf_batch_run
+
+    src = tmp_path / "ulucks"
+    src.mkdir()
+    (src / "a.pdf").write_bytes(b"%PDF-1.4\n%mock a")
+    cache_dir = tmp_path / "cache"
+
+    def _run(out_name: str) -> str:
+        out_dir = tmp_path / out_name
+        argv = ["pdf_batch_run", "--ulucks-dir", str(src), "--out-dir", str(out_dir), "--cache-dir", str(cache_dir)]
+        monkeypatch.setattr("sys.argv", argv)
+        assert pdf_batch_run.main() == 0
+        return (out_dir / "stats.csv").read_text(encoding="utf-8-sig")
+
+    first = _run("out_1")
+    monkeypatch.setattr(pdf_batch_run, "analyze_pdf", lambda _doc: (_ for _ in ()).throw(AssertionError("re-parsed")))
+    second = _run("out_2")
+
+    assert '"parse_cache"' in first.splitlines()[0]
+    assert first.replace('"miss"', '"hit"') == second
+
+
+def test_parse_cache_opens_once_per_batch_and_keys_on_parser_version(tmp_path: Path, monkeypatch):
+    from tatemono_map.cli import pdf_batch_run as mod
+
+    paths = []
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF-1.4\n%mock " + name.encode())
+        paths.append(tmp_path / name)
+    cache_dir = tmp_path / "cache"
+    opened = []
+    original_init = mod.ParseCache.__init__
+    monkeypatch.setattr(mod.ParseCache, "__init__", lambda self, path: opened.append(path) or original_init(self, path))
+
+    def _statuses() -> list[str]:
+        return [o.stats_row["parse_cache"] for o in mod.iter_pdf_outcomes(paths, qc_mode="warn", cache_dir=str(cache_dir))]
+
+    assert _statuses() == ["miss"] * 3
+    assert _statuses() == ["hit"] * 3
+    assert opened == [cache_dir, cache_dir]
+    assert mod.parser_version().startswith(f"{mod.PARSE_CACHE_VERSION}-")
+
+    monkeypatch.setattr(mod, "parser_version", lambda: f"{mod.PARSE_CACHE_VERSION}-changed-parser")
+    assert _statuses() == ["miss"] * 3
+    assert _statuses() == ["hit"] * 3
@@ -6,7 +6,7 @@ import pytest
 from tatemono_map.db.keys import make_building_key
 from tatemono_map.db.repo import ListingRecord, connect, upsert_listing
 from tatemono_map.normalize.building_summaries import rebuild
-from tatemono_map.render.build import build_dist, build_dist_versions
+from tatemono_map.render.build import BuildingRecord, build_dist, build_dist_versions
 
 
 def test_render_dist_outputs(tmp_path):
@@ -83,6 +83,19 @@ def test_render_dist_creates_nojekyll_file(tmp_path):
     assert (dist / ".nojekyll").exists()
 
 
+def test_building_record_keys_are_its_fields_only():
+    record = BuildingRecord()
+    record["name"] = "レコード確認マンション"
+    assert record["name"] == "レコード確認マンション"
+    assert record.get("keys") is None
+    assert "get" not in record
+    with pytest.raises(KeyError):
+        record["get"]
+    with pytest.raises(KeyError):
+        record["items"] = 1
+    assert list(record) == list(BuildingRecord.__slots__)
+
+
 def test_render_dist_fails_when_forbidden_text_exists(tmp_path):
     db = tmp_path / "test.sqlite3"
     dist = tmp_path / "dist"
@@ -98,6 +111,26 @@ def test_render_dist_fails_when_forbidden_text_exists(tmp_path):
         build_dist(str(db), str(dist))
 
 
+def test_render_dist_fails_before_writing_forbidden_text_in_json_payload(tmp_path):
+    db = tmp_path / "test.sqlite3"
+    dist = tmp_path / "dist"
+    conn = connect(db)
+    upsert_listing(
+        conn,
+        ListingRecord("JSON検査マンション", "東京都B", 55000, 22.0, "1K", "2026-01-01", "ulucks", "u1"),
+    )
+    conn.close()
+    rebuild(str(db))
+    conn = connect(db)
+    conn.execute("UPDATE building_summaries SET sale_layout_types_json = ?", (json.dumps(["電話でお問い合わせ"]),))
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(RuntimeError, match="buildings.json"):
+        build_dist(str(db), str(dist))
+    assert not (dist / "data" / "buildings.json").exists()
+
+
 def test_build_dist_versions_outputs_v1_and_v2(tmp_path):
     db = tmp_path / "test.sqlite3"
     out = tmp_path / "dist"
@@ -181,8 +214,13 @@ def test_build_dist_versions_formats_rent_with_thousands_separator_in_v1_and_v2(
     detail_v1 = next((out / "v1" / "b").glob("*.html")).read_text(encoding="utf-8")
     detail_v2 = next((out / "b").glob("*.html")).read_text(encoding="utf-8")
 
+    build_info = json.loads((out / "build_info.json").read_text(encoding="utf-8"))
+
     assert "125,000円" in index_v1
     assert "125,000円" in index_v2
+    # The compact v2 index carries no per-building markup; rents come from the hashed data asset.
+    assert "カンマ確認マンションv2" not in index_v2
+    assert json.dumps("./" + build_info["data_assets"]["buildings.v2.min.json"]) in index_v2
     assert "125,000円" in detail_v1
     assert "125,000円" in detail_v2
 
@@ -684,3 +722,300 @@ def test_export_buildings_json_excludes_hidden_from_public(tmp_path):
     names = {row["name"] for row in payload}
     assert "公開建物" in names
     assert "除外建物" not in names
+
+
+def test_build_dist_versions_incremental_rewrites_only_changed_pages(tmp_path):
+    db = tmp_path / "test.sqlite3"
+    dist = tmp_path / "dist"
+    conn = connect(db)
+    for idx, name in enumerate(("増分Aマンション", "増分Bマンション", "増分Cマンション")):
+        upsert_listing(
+            conn,
+            ListingRecord(name, f"東京都港区1-2-{idx}", 50000 + idx, 20.0, "1K", "2026-03-01", "ulucks", f"inc{idx}"),
+        )
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(dist), incremental=True)
+
+    pages = {path.relative_to(dist): path.stat().st_mtime_ns for path in dist.rglob("b/*.html")}
+    assert len(pages) == 6
+    assert (dist / ".build_manifest.json").exists()
+    assert (dist / "v1" / ".build_manifest.json").exists()
+    nojekyll = {path: path.stat().st_mtime_ns for path in (dist / ".nojekyll", dist / "v1" / ".nojekyll")}
+
+    build_dist_versions(str(db), str(dist), incremental=True)
+    assert {path.relative_to(dist): path.stat().st_mtime_ns for path in dist.rglob("b/*.html")} == pages
+    assert {path: path.stat().st_mtime_ns for path in nojekyll} == nojekyll
+
+    conn = connect(db)
+    changed_key, removed_key = [
+        row[0] for row in conn.execute("SELECT building_key FROM building_summaries ORDER BY name LIMIT 2").fetchall()
+    ]
+    conn.execute("UPDATE building_summaries SET rent_yen_min = 77000 WHERE building_key = ?", (changed_key,))
+    conn.execute("DELETE FROM building_summaries WHERE building_key = ?", (removed_key,))
+    conn.commit()
+    conn.close()
+    build_dist_versions(str(db), str(dist), incremental=True)
+
+    after = {path.relative_to(dist): path.stat().st_mtime_ns for path in dist.rglob("b/*.html")}
+    assert set(after) == {path for path in pages if path.stem != removed_key}
+    rewritten = {path for path in after if after[path] != pages[path]}
+    assert rewritten == {Path("b") / f"{changed_key}.html", Path("v1") / "b" / f"{changed_key}.html"}
+    assert "77,000" in (dist / "b" / f"{changed_key}.html").read_text(encoding="utf-8")
+
+    full = tmp_path / "full"
+    build_dist_versions(str(db), str(full))
+    for path in after:
+        assert (dist / path).read_bytes() == (full / path).read_bytes()
+    assert (dist / "index.html").read_bytes() == (full / "index.html").read_bytes()
+
+
+def test_build_dist_workers_output_matches_serial_build(tmp_path):
+    db = tmp_path / "test.sqlite3"
+    conn = connect(db)
+    for idx in range(5):
+        upsert_listing(
+            conn,
+            ListingRecord(f"並列{idx}マンション", f"東京都港区3-4-{idx}", 60000 + idx * 1000, 25.0, "1K", "2026-03-01", "ulucks", f"par{idx}"),
+        )
+    conn.close()
+    rebuild(str(db))
+
+    build_dist(str(db), str(tmp_path / "serial"), template_root="templates_v2")
+    build_dist(str(db), str(tmp_path / "parallel"), template_root="templates_v2", workers=2)
+
+    serial_pages = sorted((tmp_path / "serial" / "b").glob("*.html"))
+    assert len(serial_pages) == 5
+    for page in serial_pages:
+        assert (tmp_path / "parallel" / "b" / page.name).read_bytes() == page.read_bytes()
+
+
+def test_render_pages_streams_chunks_through_pool_like_serial(tmp_path):
+    from tatemono_map.render.build import PAGE_CHUNK_SIZE, _render_pages
+
+    def jobs(output_dir):
+        for idx in range(PAGE_CHUNK_SIZE * 3 + 1):
+            building = {"building_key": f"chunk{idx:04d}", "name": f"分割{idx}マンション", "address": "福岡県北九州市小倉北区米町1-1-1"}
+            yield str(output_dir / f"{building['building_key']}.html"), {"building": building, "maps_url": "", "line_cta_url": "", "line_deep_link_url": ""}
+
+    assert _render_pages("templates_v2", jobs(tmp_path / "serial"), workers=1) == PAGE_CHUNK_SIZE * 3 + 1
+    assert _render_pages("templates_v2", jobs(tmp_path / "parallel"), workers=2) == PAGE_CHUNK_SIZE * 3 + 1
+    for page in (tmp_path / "serial").glob("*.html"):
+        assert (tmp_path / "parallel" / page.name).read_bytes() == page.read_bytes()
+
+
+def test_streamed_writer_catches_forbidden_text_split_across_chunks(tmp_path):
+    from tatemono_map.render.build import _AtomicFileWriter
+
+    target = tmp_path / "out.json"
+    with pytest.raises(RuntimeError, match="forbidden data detected"):
+        with _AtomicFileWriter(target) as writer:
+            for chunk in ("管理".encode("utf-8"), "会社".encode("utf-8")):
+                writer.write(chunk)
+    assert not target.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_build_dist_versions_writes_ward_and_tile_shards_with_manifest(tmp_path):
+    db = tmp_path / "test.sqlite3"
+    dist = tmp_path / "dist"
+    conn = connect(db)
+    upsert_listing(
+        conn,
+        ListingRecord("小倉シャードマンション", "福岡県北九州市小倉北区米町1-1-1", 55000, 22.0, "1K", "2026-03-01", "ulucks", "s1"),
+    )
+    upsert_listing(
+        conn,
+        ListingRecord("区外シャードマンション", "東京都港区1-2-3", 65000, 24.0, "1K", "2026-03-01", "ulucks", "s2"),
+    )
+    conn.execute(
+        """
+        INSERT INTO buildings(building_id, canonical_name, canonical_address, google_lat, google_lng)
+        VALUES ('moji-geo', '門司シャードハイツ', '福岡県北九州市門司区港町1-1', 33.9450, 130.9620)
+        """
+    )
+    conn.commit()
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(dist))
+
+    manifest = json.loads((dist / "data" / "shards" / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["count"] == 3
+    wards = {entry["ward"]: entry for entry in manifest["wards"]}
+    assert set(wards) == {"kokurakita", "moji", "other"}
+    assert wards["kokurakita"]["ward_name"] == "小倉北区"
+    kokura = json.loads((dist / wards["kokurakita"]["path"]).read_text(encoding="utf-8"))
+    assert [row["name"] for row in kokura] == ["小倉シャードマンション"]
+
+    tiles = manifest["tiles"]["items"]
+    assert manifest["tiles"]["count"] == 1 and len(tiles) == 1
+    west, south, east, north = tiles[0]["bbox"]
+    assert west <= 130.9620 <= east and south <= 33.9450 <= north
+    tile_rows = json.loads((dist / tiles[0]["path"]).read_text(encoding="utf-8"))
+    assert [row["id"] for row in tile_rows] == ["moji-geo"]
+
+
+def test_build_dist_versions_search_index_candidates_cover_substring_matches(tmp_path):
+    from tatemono_map.render.search_index import candidate_ids, decode_postings, normalize_search_text
+
+    db = tmp_path / "test.sqlite3"
+    dist = tmp_path / "dist"
+    conn = connect(db)
+    rows = [
+        ("サンシャイン小倉", "福岡県北九州市小倉北区米町1-1-1", 55000, 22.5),
+        ("ＳＵＮハイツ門司", "福岡県北九州市門司区港町2-3", 48000, 30.0),
+        ("グランドメゾン八幡", "福岡県北九州市八幡西区黒崎3-4", 72000, 41.2),
+    ]
+    for idx, (name, address, rent, area) in enumerate(rows):
+        upsert_listing(conn, ListingRecord(name, address, rent, area, "1K", "2026-03-01", "ulucks", f"idx{idx}"))
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(dist))
+
+    index = json.loads((dist / "data" / "search_index.json").read_text(encoding="utf-8"))
+    payload = json.loads((dist / "data" / "buildings.v2.min.json").read_text(encoding="utf-8"))
+    assert index["ids"] == [row["id"] for row in payload]
+    assert index["columns"]["rent_min"] == [row["rent_min"] for row in payload]
+    assert index["columns"]["area_min_centi"] == [round(row["area_min"] * 100) for row in payload]
+    assert decode_postings(index["bigrams"]["小倉"]) == [
+        doc_id for doc_id, row in enumerate(payload) if "小倉" in row["name"] + row["address"]
+    ]
+
+    for query in ("sun", "小倉", "北九州市", "門", "ハイツ 門司", "黒崎3", "存在しない"):
+        q = normalize_search_text(query)
+        expected = {
+            row["id"]
+            for row in payload
+            if q in normalize_search_text(row["name"])
+            or q in normalize_search_text(row["address"])
+            or q in normalize_search_text(f"{row['name']} {row['address']}")
+        }
+        assert expected <= set(candidate_ids(index, query))
+
+
+def test_build_dist_versions_columnar_export_round_trips_v2_payload(tmp_path):
+    from tatemono_map.render.columnar import read_columnar, read_columnar_header
+
+    db = tmp_path / "test.sqlite3"
+    dist = tmp_path / "dist"
+    conn = connect(db)
+    upsert_listing(
+        conn,
+        ListingRecord("列指向マンション", "福岡県北九州市小倉北区1-1", 55000, 22.35, "1K", "2026-03-01", "ulucks", "c1"),
+    )
+    upsert_listing(
+        conn,
+        ListingRecord("列指向マンション", "福岡県北九州市小倉北区1-1", 61000, 30.1, "1LDK", "2026-03-02", "ulucks", "c2"),
+    )
+    upsert_listing(
+        conn,
+        ListingRecord("列指向ハイツ", "福岡県北九州市門司区2-2", None, None, None, "2026-03-01", "ulucks", "c3"),
+    )
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(dist))
+
+    data = (dist / "data" / "buildings.v2.cols.bin").read_bytes()
+    header, _ = read_columnar_header(data)
+    assert header["count"] == 2
+    assert {column["type"] for column in header["columns"]} == {"utf8", "int32", "float32", "dict", "dict_list"}
+
+    decoded = read_columnar(data)
+    expected = json.loads((dist / "data" / "buildings.v2.min.json").read_text(encoding="utf-8"))
+    legacy = json.loads((dist / "data" / "buildings.json").read_text(encoding="utf-8"))
+    assert [row["room_types"] for row in decoded] == [row["room_types"] for row in legacy]
+    for got, want in zip(decoded, expected):
+        for key, value in want.items():
+            if isinstance(value, float):
+                assert got[key] == pytest.approx(value, rel=1e-6)
+            else:
+                assert got[key] == value
+
+
+def test_columnar_export_encodes_malformed_numbers_as_null(caplog):
+    from tatemono_map.render.columnar import encode_columnar, read_columnar
+
+    rows = [
+        {"id": "ok", "rent_min": 55000, "area_min": 22.5, "room_types": ["1K"]},
+        {"id": "bad", "rent_min": "要問合せ", "rent_max": 2**31, "sale_price_min": float("inf"), "area_min": "広い"},
+    ]
+    with caplog.at_level("WARNING", logger="tatemono_map.render.columnar"):
+        decoded = read_columnar(encode_columnar(rows))
+
+    assert [row["id"] for row in decoded] == ["ok", "bad"]
+    assert (decoded[0]["rent_min"], decoded[0]["area_min"]) == (55000, 22.5)
+    bad = decoded[1]
+    assert (bad["rent_min"], bad["rent_max"], bad["sale_price_min"], bad["area_min"]) == (None, None, None, None)
+    assert len(caplog.records) == 4
+    assert "rent_min='要問合せ'" in caplog.text
+
+
+def test_build_dist_versions_writes_hashed_and_precompressed_data_assets(tmp_path):
+    import gzip
+    import hashlib
+
+    db = tmp_path / "test.sqlite3"
+    dist = tmp_path / "dist"
+    conn = connect(db)
+    for idx in range(12):
+        upsert_listing(
+            conn,
+            ListingRecord(f"圧縮確認{idx}マンション", f"福岡県北九州市小倉北区{idx}", 50000 + idx, 20.0, "1K", "2026-03-01", "ulucks", f"gz{idx}"),
+        )
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(dist), incremental=True)
+
+    build_info = json.loads((dist / "build_info.json").read_text(encoding="utf-8"))
+    hashed_path = build_info["data_assets"]["buildings.v2.min.json"]
+    plain = (dist / "data" / "buildings.v2.min.json").read_bytes()
+    assert hashed_path == f"data/buildings.v2.min.{hashlib.sha256(plain).hexdigest()[:12]}.json"
+    assert (dist / hashed_path).read_bytes() == plain
+    assert f"./{hashed_path}" in (dist / "index.html").read_text(encoding="utf-8")
+    assert gzip.decompress((dist / "data" / "buildings.v2.min.json.gz").read_bytes()) == plain
+    assert gzip.decompress((dist / f"{hashed_path}.gz").read_bytes()) == plain
+
+    conn = connect(db)
+    conn.execute("UPDATE building_summaries SET rent_yen_min = 99000 WHERE building_key = (SELECT MIN(building_key) FROM building_summaries)")
+    conn.commit()
+    conn.close()
+    build_dist_versions(str(db), str(dist), incremental=True)
+
+    new_hashed_path = json.loads((dist / "build_info.json").read_text(encoding="utf-8"))["data_assets"]["buildings.v2.min.json"]
+    assert new_hashed_path != hashed_path
+    assert not (dist / hashed_path).exists()
+    assert not (dist / f"{hashed_path}.gz").exists()
+    assert gzip.decompress((dist / "data" / "buildings.v2.min.json.gz").read_bytes()) == (
+        dist / "data" / "buildings.v2.min.json"
+    ).read_bytes()
+
+
+def test_build_dist_versions_v2_index_size_does_not_grow_with_buildings(tmp_path):
+    db = tmp_path / "test.sqlite3"
+    conn = connect(db)
+    upsert_listing(
+        conn,
+        ListingRecord("索引サイズ0マンション", "東京都港区5-0", 70000, 25.0, "1K", "2026-03-01", "ulucks", "size0"),
+    )
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(tmp_path / "one"))
+
+    conn = connect(db)
+    for idx in range(1, 40):
+        upsert_listing(
+            conn,
+            ListingRecord(f"索引サイズ{idx}マンション", f"東京都港区5-{idx}", 70000, 25.0, "1K", "2026-03-01", "ulucks", f"size{idx}"),
+        )
+    conn.close()
+    rebuild(str(db))
+    build_dist_versions(str(db), str(tmp_path / "many"))
+    build_dist_versions(str(db), str(tmp_path / "full"), compact_index=False)
+
+    one = (tmp_path / "one" / "index.html").read_text(encoding="utf-8")
+    many = (tmp_path / "many" / "index.html").read_text(encoding="utf-8")
+    full = (tmp_path / "full" / "index.html").read_text(encoding="utf-8")
+    assert "70,000円" in many
+    assert many.count("70,000円") == one.count("70,000円") == 2
+    assert full.count("70,000円") == 80
+    assert abs(len(many.encode("utf-8")) - len(one.encode("utf-8"))) < 64
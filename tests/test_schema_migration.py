@@ -304,3 +304,178 @@ def test_ensure_schema_adds_snapshot_tables_and_listing_run_column(tmp_path):
     assert "ingest_runs" in tables
     assert "current_ingest_snapshots" in tables
     assert "ingest_run_id" in listing_cols
+
+
+def test_ensure_schema_replaces_outdated_summary_change_triggers(tmp_path):
+    from tatemono_map.db.schema import SCHEMA_FINGERPRINT, SUMMARY_CHANGE_TRIGGERS
+
+    db = tmp_path / "triggers.sqlite3"
+    ensure_schema(db)
+    with sqlite3.connect(db) as conn:
+        conn.execute("DROP TRIGGER building_summary_changes_buildings_insert")
+        conn.execute("CREATE TRIGGER building_summary_changes_buildings_insert AFTER INSERT ON buildings BEGIN SELECT 1; END")
+        conn.execute("PRAGMA user_version = 0")
+    conn.close()
+
+    ensure_schema(db)
+    with sqlite3.connect(db) as conn:
+        triggers = {row[0].strip() for row in conn.execute("SELECT sql FROM sqlite_master WHERE type='trigger'")}
+        conn.execute("INSERT INTO buildings(building_id) VALUES ('b1')")
+        logged = [row[0] for row in conn.execute("SELECT building_key FROM building_summary_changes")]
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+
+    assert {ddl.strip().replace(" IF NOT EXISTS", "", 1) for ddl in SUMMARY_CHANGE_TRIGGERS} <= triggers
+    assert logged == ["b1"]
+    assert version == SCHEMA_FINGERPRINT
+
+
+def test_ensure_schema_creates_declared_indexes_and_hot_queries_avoid_full_scans(tmp_path, capsys):
+    from tatemono_map.db.query_plans import full_scans
+    from tatemono_map.db.schema import INDEX_SCHEMAS
+
+    db = tmp_path / "indexes.sqlite3"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE buildings (building_id TEXT PRIMARY KEY, canonical_name TEXT, canonical_address TEXT, norm_name TEXT)")
+        conn.execute("CREATE INDEX idx_buildings_norm_name ON buildings(norm_name)")
+
+    ensure_schema(db)
+    first = capsys.readouterr().err
+    ensure_schema(db)
+    second = capsys.readouterr().err
+
+    with sqlite3.connect(db) as conn:
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        scans = full_scans(conn)
+
+    assert {index.name for index in INDEX_SCHEMAS} <= indexes
+    assert "idx_buildings_norm_address" in first
+    assert "idx_buildings_norm_name" not in first
+    assert second == ""
+    assert scans == []
+
+
+def test_connect_checks_schema_once_and_opens_wal_connections(tmp_path, monkeypatch):
+    from tatemono_map.db import repo
+    from tatemono_map.db.schema import SCHEMA_FINGERPRINT
+
+    db = tmp_path / "factory.sqlite3"
+    calls = []
+    original = repo.ensure_schema
+    monkeypatch.setattr(repo, "ensure_schema", lambda path: calls.append(path) or original(path))
+
+    for _ in range(3):
+        repo.connect(db).close()
+    assert len(calls) == 1
+
+    repo.forget_schema_check(db)
+    conn = repo.connect(db)
+    assert len(calls) == 1
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_FINGERPRINT
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    conn.close()
+
+    ro = repo.connect(db, read_only=True)
+    assert ro.execute("SELECT COUNT(*) FROM buildings").fetchone()[0] == 0
+    with pytest.raises(sqlite3.OperationalError):
+        ro.execute("INSERT INTO buildings(building_id) VALUES ('b1')")
+    ro.close()
+
+
+def test_connect_read_only_leaves_current_database_untouched(tmp_path, monkeypatch):
+    from tatemono_map.db import repo
+
+    db = tmp_path / "public.sqlite3"
+    ensure_schema(db)
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO building_summaries(building_key, name) VALUES ('k1', '読取専用マンション')")
+    conn.close()
+    before = db.read_bytes()
+    monkeypatch.setattr(repo, "ensure_schema", lambda path: pytest.fail("read-only connect migrated a current DB"))
+
+    ro = repo.connect(db, read_only=True)
+    assert ro.execute("SELECT name FROM building_summaries").fetchone()[0] == "読取専用マンション"
+    assert ro.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    ro.close()
+
+    assert db.read_bytes() == before
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["public.sqlite3"]
+
+
+def test_connect_read_only_migrates_stale_database_once(tmp_path, monkeypatch):
+    from tatemono_map.db import repo
+    from tatemono_map.db.schema import SCHEMA_FINGERPRINT
+
+    db = tmp_path / "public.sqlite3"
+    ensure_schema(db)
+    with sqlite3.connect(db) as conn:
+        conn.execute("DROP INDEX idx_buildings_norm_name")
+        conn.execute("INSERT INTO building_summaries(building_key, name) VALUES ('k1', '旧スキーマ')")
+        conn.execute("PRAGMA user_version = 0")
+    conn.close()
+    calls = []
+    original = repo.ensure_schema
+    monkeypatch.setattr(repo, "ensure_schema", lambda path: calls.append(path) or original(path))
+
+    for _ in range(2):
+        ro = repo.connect(db, read_only=True)
+        assert ro.execute("SELECT name FROM building_summaries").fetchone()[0] == "旧スキーマ"
+        assert ro.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_buildings_norm_name'").fetchone() is not None
+        assert ro.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_FINGERPRINT
+        assert ro.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        ro.close()
+    assert len(calls) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["public.sqlite3"]
+
+
+def test_connect_read_only_reports_unmigratable_database(tmp_path, monkeypatch):
+    from tatemono_map.db import repo
+    from tatemono_map.db.schema import SchemaMismatchError
+
+    db = tmp_path / "public.sqlite3"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE building_summaries (building_key TEXT PRIMARY KEY)")
+    conn.close()
+
+    def readonly_file(path):
+        raise sqlite3.OperationalError("attempt to write a readonly database")
+
+    monkeypatch.setattr(repo, "ensure_schema", readonly_file)
+    with pytest.raises(SchemaMismatchError, match="run migrations"):
+        repo.connect(db, read_only=True)
+
+
+def test_connect_schema_check_survives_writes(tmp_path, monkeypatch):
+    from tatemono_map.db import repo
+
+    db = tmp_path / "busy.sqlite3"
+    repo.connect(db).close()
+    monkeypatch.setattr(repo, "ensure_schema", lambda path: pytest.fail("a write invalidated the schema check"))
+    monkeypatch.setattr(repo, "_enable_wal", lambda path: pytest.fail("a write invalidated the schema check"))
+    for idx in range(3):
+        conn = repo.connect(db)
+        conn.execute("INSERT INTO buildings(building_id) VALUES (?)", (f"b{idx}",))
+        conn.commit()
+        conn.close()
+
+
+def test_connect_rechecks_schema_when_db_file_is_replaced(tmp_path, monkeypatch):
+    from tatemono_map.db import repo
+    from tatemono_map.db.schema import SCHEMA_FINGERPRINT
+
+    db = tmp_path / "replaced.sqlite3"
+    calls = []
+    original = repo.ensure_schema
+    monkeypatch.setattr(repo, "ensure_schema", lambda path: calls.append(path) or original(path))
+    repo.connect(db).close()
+    assert len(calls) == 1
+
+    fresh = tmp_path / "fresh.sqlite3"
+    sqlite3.connect(fresh).close()
+    fresh.replace(db)
+    conn = repo.connect(db)
+    assert len(calls) == 2
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_FINGERPRINT
+    conn.close()
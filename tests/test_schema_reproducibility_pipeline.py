@@ -31,7 +31,7 @@ def test_fresh_db_schema_supports_master_ingest_and_summary_cli(tmp_path: Path)
         ],
         check=True,
         env=env,
-        cwd=str(repo_path()),
+        cwd=str(tmp_path),
     )
     subprocess.run(
         [